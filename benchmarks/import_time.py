@@ -0,0 +1,77 @@
+"""Startup time of the package and of the command line.
+
+Runs each snippet in a fresh interpreter ``--runs`` times and prints the
+median wall time, with the heavy dependencies it ended up importing:
+
+    python benchmarks/import_time.py --runs 20
+
+``python`` alone is the floor every command pays.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+HEAVY_MODULES = ("numpy", "scipy", "matplotlib")
+
+SNIPPETS = {
+    "python": "pass",
+    "import models": "import models",
+    "from models import VerticalFlatVessels": "from models import VerticalFlatVessels",
+    "from models import HorizontalToriSphericalVessels": "from models import HorizontalToriSphericalVessels",
+    "VerticalToriSphericalVessels().liquid_volume": (
+        "from models import VerticalToriSphericalVessels; VerticalToriSphericalVessels(2, 6).liquid_volume(1.0)"),
+}
+COMMANDS = {
+    "main.py --list": [str(PROJECT_ROOT / "main.py"), "--list"],
+    "main.py -t vertical-flat-vessel --no-save": [
+        str(PROJECT_ROOT / "main.py"), "-t", "vertical-flat-vessel", "-d", "3", "-l", "9", "--high-level", "7",
+        "--low-level", "2", "--liquid-level", "4", "--no-save"],
+}
+# appended to every snippet to report what it imported
+REPORT = "; import sys; print(','.join(m for m in {modules!r} if m in sys.modules))"
+
+
+def time_command(argv: list[str], runs: int) -> tuple[float, str]:
+    """Median wall time (s) of ``runs`` executions and the last standard output."""
+    samples = []
+    output = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(argv, capture_output=True, text=True, check=True, cwd=SRC_PATH).stdout
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), output
+
+
+def run(runs: int = 10, verbose: bool = True) -> dict[str, float]:
+    results = {}
+    for name, code in SNIPPETS.items():
+        seconds, output = time_command([sys.executable, "-c", code + REPORT.format(modules=HEAVY_MODULES)], runs)
+        results[name] = seconds
+        if verbose:
+            loaded = output.strip().splitlines()[-1] if output.strip() else ""
+            print(f"{name:<50} {seconds * 1e3:8.1f} ms   loads: {loaded or '-'}")
+    for name, argv in COMMANDS.items():
+        seconds, _ = time_command([sys.executable, *argv], runs)
+        results[name] = seconds
+        if verbose:
+            print(f"{name:<50} {seconds * 1e3:8.1f} ms")
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the startup time of the package and the CLI.")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per command, the median is reported.")
+    args = parser.parse_args(argv)
+    run(args.runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
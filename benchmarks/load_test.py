@@ -0,0 +1,161 @@
+"""Load test of the HTTP JSON service in ``models.server``.
+
+Starts a local server (or uses ``--url``), opens ``--connections`` keep-alive
+connections that each send ``/evaluate`` requests back to back for
+``--duration`` seconds, and prints the throughput, the latency percentiles
+and the server's batch and cache counters:
+
+    python benchmarks/load_test.py --connections 64 --duration 10
+
+The requests cycle through ``--specs`` distinct geometries of every vessel
+type with ``--levels`` levels each. Client and server share the machine, so
+the numbers are a floor for a dedicated server.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+TYPES = ("vertical-flat-vessel", "vertical-torispherical-vessel", "vertical-elliptical-vessel",
+         "vertical-hemispherical-vessel", "vertical-conical-vessel", "horizontal-flat-vessel",
+         "horizontal-torispherical-vessel", "horizontal-elliptical-vessel", "horizontal-hemispherical-vessel",
+         "horizontal-conical-vessel", "spherical-tank")
+
+
+def request_bodies(specs: int, levels: int, seed: int = 0) -> list[bytes]:
+    """Encoded ``/evaluate`` requests for ``specs`` geometries per vessel type."""
+    rng = random.Random(seed)
+    requests = []
+    for vessel_type in TYPES:
+        for _ in range(specs):
+            diameter = round(rng.uniform(1.0, 4.0), 2)
+            length = round(diameter * rng.uniform(1.5, 5.0), 2)
+            height = diameter if vessel_type.startswith(("horizontal", "spherical")) else length + diameter
+            body = {"type": vessel_type, "diameter": diameter, "length": length, "head_distance": diameter / 4,
+                    "levels": [round(rng.uniform(0.0, height), 3) for _ in range(levels)]}
+            payload = json.dumps(body).encode()
+            requests.append(b"POST /evaluate HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                            b"Content-Length: %d\r\n\r\n%s" % (len(payload), payload))
+    rng.shuffle(requests)
+    return requests
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    length = 0
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def client(host: str, port: int, requests: list[bytes], offset: int, deadline: float,
+                 latencies: list[float], errors: list[int]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    index = offset
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(requests[index % len(requests)])
+            status, _ = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+            index += 1
+    finally:
+        writer.close()
+
+
+async def get_json(host: str, port: int, path: str) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+    _, body = await read_response(reader)
+    writer.close()
+    return json.loads(body)
+
+
+async def load(host: str, port: int, connections: int, duration: float, requests: list[bytes]) -> dict:
+    latencies, errors = [], []
+    before = await get_json(host, port, "/stats")
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(client(host, port, requests, i * 7919, deadline, latencies, errors)
+                           for i in range(connections)))
+    elapsed = time.perf_counter() - start
+    after = await get_json(host, port, "/stats")
+    batches = after["batches"] - before["batches"]
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {"requests": len(latencies), "errors": len(errors), "seconds": elapsed,
+            "requests_per_second": len(latencies) / elapsed, "p50_ms": quantiles[49] * 1e3,
+            "p90_ms": quantiles[89] * 1e3, "p99_ms": quantiles[98] * 1e3,
+            "mean_batch_size": (after["batched_queries"] - before["batched_queries"]) / batches if batches else 0.0,
+            "cache_hits": after["cache_hits"] - before["cache_hits"],
+            "cache_misses": after["cache_misses"] - before["cache_misses"]}
+
+
+def start_server(batch_window_ms: float, max_batch: int) -> tuple[subprocess.Popen, int]:
+    """Run ``python -m models.server`` on a free port, return the process and the port."""
+    process = subprocess.Popen([sys.executable, "-m", "models.server", "--port", "0",
+                                "--batch-window", str(batch_window_ms), "--max-batch", str(max_batch)],
+                               cwd=SRC_PATH, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("listening on"):
+        process.kill()
+        raise RuntimeError(f"Server did not start: {line!r}")
+    return process, int(line.rsplit(":", 1)[1])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the vessel HTTP service.")
+    parser.add_argument("--url", help="Existing server, e.g. http://127.0.0.1:8765 (default: start one).")
+    parser.add_argument("--connections", type=int, default=64, help="Concurrent keep-alive connections.")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of load.")
+    parser.add_argument("--specs", type=int, default=20, help="Distinct geometries per vessel type.")
+    parser.add_argument("--levels", type=int, default=8, help="Levels per request.")
+    parser.add_argument("--batch-window", type=float, default=1.0, help="Batch window (ms) of a started server.")
+    parser.add_argument("--max-batch", type=int, default=512, help="Batch size of a started server.")
+    parser.add_argument("--min-rps", type=float, help="Exit 1 below this many requests per second.")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port
+    else:
+        process, port = start_server(args.batch_window, args.max_batch)
+        host = "127.0.0.1"
+    try:
+        requests = request_bodies(args.specs, args.levels)
+        # one short pass fills the geometry cache, as on a server that has been up for a while
+        asyncio.run(load(host, port, args.connections, min(1.0, args.duration / 5), requests))
+        result = asyncio.run(load(host, port, args.connections, args.duration, requests))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    print(f"{result['requests']} requests in {result['seconds']:.1f} s with {args.connections} connections, "
+          f"{result['errors']} errors")
+    print(f"throughput  {result['requests_per_second']:10.0f} req/s")
+    print(f"latency     p50 {result['p50_ms']:.2f} ms   p90 {result['p90_ms']:.2f} ms   p99 {result['p99_ms']:.2f} ms")
+    print(f"batches     {result['mean_batch_size']:.1f} requests per batch")
+    print(f"cache       {result['cache_hits']} hits, {result['cache_misses']} misses")
+    if result["errors"] or (args.min_rps is not None and result["requests_per_second"] < args.min_rps):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
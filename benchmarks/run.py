@@ -0,0 +1,207 @@
+"""Offline benchmark runner for every vessel class.
+
+Times the public methods of all 16 vessel classes at three aspect ratios and
+compares the results with a stored baseline:
+
+    python benchmarks/run.py --save              # record benchmarks/baseline.json
+    python benchmarks/run.py                     # compare, exit 1 on regressions
+    python benchmarks/run.py --threshold 0.5 --filter "Horizontal*" --skip-draw
+
+Each timing is the best of ``--repeat`` samples of an auto-sized loop, in
+seconds per call. A benchmark regresses when it is slower than the baseline
+by more than ``--threshold`` (a fraction, 0.25 means 25 %). Baselines are
+machine specific, record one on the machine that runs the comparison.
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+import numpy as np
+
+from models import (HorizontalConicalVessels, HorizontalEllipticalVessels, HorizontalFlatVessels,
+                    HorizontalHemiSphericalVessels, HorizontalToriSphericalVessels, SphericalTanks,
+                    VerticalConicalTanks, VerticalConicalVessels, VerticalEllipticalTanks,
+                    VerticalEllipticalVessels, VerticalFlatTanks, VerticalFlatVessels,
+                    VerticalHemiSphericalTanks, VerticalHemiSphericalVessels, VerticalToriSphericalTanks,
+                    VerticalToriSphericalVessels)
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+DIAMETER = 2.0
+# length / diameter
+ASPECT_RATIOS = {"small": 0.5, "typical": 3.0, "extreme": 25.0}
+VESSEL_CLASSES = [
+    VerticalFlatVessels, VerticalToriSphericalVessels, VerticalEllipticalVessels, VerticalHemiSphericalVessels,
+    VerticalConicalVessels, VerticalFlatTanks, VerticalToriSphericalTanks, VerticalEllipticalTanks,
+    VerticalHemiSphericalTanks, VerticalConicalTanks, HorizontalFlatVessels, HorizontalToriSphericalVessels,
+    HorizontalEllipticalVessels, HorizontalHemiSphericalVessels, HorizontalConicalVessels, SphericalTanks,
+]
+ARRAY_LEVELS = 100
+TABLE_POINTS = 50
+
+
+def build_vessel(vessel_class, aspect: float):
+    if vessel_class is SphericalTanks:
+        return SphericalTanks(DIAMETER)
+    if issubclass(vessel_class, (VerticalConicalVessels, HorizontalConicalVessels)):
+        return vessel_class(DIAMETER, DIAMETER * aspect, DIAMETER / 2)
+    return vessel_class(DIAMETER, DIAMETER * aspect)
+
+
+def _fresh(vessel, name):
+    # geometry properties are cached, time the computation and not the cache lookup
+    def call():
+        vessel._clear_geometry_cache()
+        return getattr(vessel, name)
+    return call
+
+
+def benchmark_calls(vessel, output_dir: Path, draw: bool) -> dict:
+    """Return ``{method: zero-argument callable}`` for one vessel."""
+    level = 0.37 * vessel.total_height
+    # halfway into the top head, the scalar head formulas of the vertical classes and tanks
+    head_level = vessel.total_height - 0.5 * vessel.head_distance
+    levels = np.linspace(0.0, vessel.total_height, ARRAY_LEVELS)
+    calls = {
+        "liquid_volume": lambda: vessel.liquid_volume(level),
+        "liquid_volume[head]": lambda: vessel.liquid_volume(head_level),
+        "liquid_volume[array]": lambda: vessel.liquid_volume(levels),
+        "wetted_area": lambda: vessel.wetted_area(level),
+        "wetted_area[head]": lambda: vessel.wetted_area(head_level),
+        "wetted_area[array]": lambda: vessel.wetted_area(levels),
+        "head_volume": _fresh(vessel, "head_volume"),
+        "head_surface_area": _fresh(vessel, "head_surface_area"),
+        "create_table": lambda: vessel.create_table(TABLE_POINTS),
+    }
+    if draw:
+        path = str(output_dir / f"{type(vessel).__name__}.svg")
+        calls["draw"] = lambda: vessel.draw(path)
+        svg_path = str(output_dir / f"{type(vessel).__name__}-direct.svg")
+        calls["draw[svg]"] = lambda: vessel.draw(svg_path, backend="svg")
+    return calls
+
+
+def time_call(func, repeat: int, min_time: float) -> float:
+    """Best time per call (s) over ``repeat`` samples, each looping for at least ``min_time`` s."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run_benchmarks(pattern: str = "*", repeat: int = 5, min_time: float = 0.05, draw: bool = True,
+                   verbose: bool = True) -> dict[str, float]:
+    """Time every ``class/aspect/method`` benchmark whose name matches the glob ``pattern``."""
+    if draw:
+        try:
+            import matplotlib
+        except ImportError:
+            draw = False
+        else:
+            matplotlib.use("Agg")
+    results = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for vessel_class in VESSEL_CLASSES:
+            for aspect_name, aspect in ASPECT_RATIOS.items():
+                vessel = build_vessel(vessel_class, aspect)
+                vessel.high_liquid_level = 0.8 * vessel.total_height
+                vessel.low_liquid_level = 0.2 * vessel.total_height
+                vessel.liquid_level = 0.5 * vessel.total_height
+                for method, func in benchmark_calls(vessel, Path(output_dir), draw).items():
+                    name = f"{vessel_class.__name__}/{aspect_name}/{method}"
+                    if not fnmatch.fnmatchcase(name, pattern):
+                        continue
+                    results[name] = time_call(func, repeat, min_time)
+                    if verbose:
+                        print(f"{name:<70} {results[name] * 1e6:12.1f} us")
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float],
+            threshold: float = DEFAULT_THRESHOLD) -> list[tuple[str, float, float]]:
+    """Return ``(name, baseline, result)`` for benchmarks slower than the baseline by more than ``threshold``."""
+    regressions = []
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference is not None and seconds > reference * (1 + threshold):
+            regressions.append((name, reference, seconds))
+    return regressions
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)["results"]
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    import scipy
+    data = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+        },
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, sort_keys=True)
+
+
+def parse_arguments(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark every vessel class and compare with a baseline.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON path.")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed slowdown as a fraction (default: {DEFAULT_THRESHOLD}).")
+    parser.add_argument("--filter", default="*", help="Glob on the benchmark names, e.g. '*/extreme/*'.")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per benchmark, the best one is kept.")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum duration of one sample (s).")
+    parser.add_argument("--skip-draw", action="store_true", help="Do not benchmark the drawings.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_arguments(argv)
+    results = run_benchmarks(args.filter, args.repeat, args.min_time, not args.skip_draw)
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --save first.")
+        return 0
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    for name, reference, seconds in regressions:
+        print(f"REGRESSION {name}: {reference * 1e6:.1f} us -> {seconds * 1e6:.1f} us ({seconds / reference:.2f}x)")
+    print(f"{len(results)} benchmarks, {len(regressions)} regressions above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
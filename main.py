@@ -1,39 +1,39 @@
 import argparse
+import csv
+import json
+import math
 import sys
 from dataclasses import dataclass
+from importlib import import_module
+from itertools import islice
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parent
 SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from src.models.vertical_flat_vessels import VerticalFlatVessels
-from src.models.vertical_torispherical_vessels import VerticalToriSphericalVessels
-from src.models.vertical_elliptical_vessels import VerticalEllipticalVessels
-from src.models.vertical_hemispherical_vessels import VerticalHemiSphericalVessels
-from src.models.vertical_conical_vessels import VerticalConicalVessels
-from src.models.vertical_flat_tanks import VerticalFlatTanks
-from src.models.vertical_torispherical_tanks import VerticalToriSphericalTanks
-from src.models.vertical_elliptical_tanks import VerticalEllipticalTanks
-from src.models.vertical_hemispherical_tanks import VerticalHemiSphericalTanks
-from src.models.vertical_conical_tanks import VerticalConicalTanks
-from src.models.horizontal_flat_vessels import HorizontalFlatVessels
-from src.models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
-from src.models.horizontal_elliptical_vessels import HorizontalEllipticalVessels
-from src.models.horizontal_hemispherical_vessels import HorizontalHemiSphericalVessels
-from src.models.horizontal_conical_vessels import HorizontalConicalVessels
-from src.models.spherical_tanks import SphericalTanks
-from src.models.vessels import Vessels
+if TYPE_CHECKING:
+    from src.models.vessels import Vessels
+
+
+def _vessel_class(module: str, name: str):
+    """Import a vessel class on first use, so that ``--list`` and ``--help`` do not load the models."""
+    return getattr(import_module(f"src.models.{module}"), name)
+
 
 DEFAULT_OUTPUT = "vessel.svg"
+# smallest diameter and length accepted by the prompts and by batch specs (m)
+MIN_DIMENSION = 0.01
+# specs evaluated per worker and block in batch mode, bounds the memory held at once
+BATCH_BLOCK_PER_WORKER = 256
 
 @dataclass(frozen=True)
 class VesselOption:
     key: str
     label: str
-    builder: Callable[[float, float, float], Vessels]
+    builder: Callable[[float, float, float], "Vessels"]
     requires_length: bool = True
     requires_head_distance: bool = False
 
@@ -42,85 +42,85 @@ VESSEL_OPTIONS: List[VesselOption] = [
     VesselOption(
         "vertical-flat-vessel",
         "Vertical Flat Vessel",
-        lambda d, l, h: VerticalFlatVessels(d, l),
+        lambda d, l, h: _vessel_class("vertical_flat_vessels", "VerticalFlatVessels")(d, l),
     ),
     VesselOption(
         "vertical-torispherical-vessel",
         "Vertical ToriSpherical Vessel",
-        lambda d, l, h: VerticalToriSphericalVessels(d, l),
+        lambda d, l, h: _vessel_class("vertical_torispherical_vessels", "VerticalToriSphericalVessels")(d, l),
     ),
     VesselOption(
         "vertical-elliptical-vessel",
         "Vertical Elliptical Vessel",
-        lambda d, l, h: VerticalEllipticalVessels(d, l),
+        lambda d, l, h: _vessel_class("vertical_elliptical_vessels", "VerticalEllipticalVessels")(d, l),
     ),
     VesselOption(
         "vertical-hemispherical-vessel",
         "Vertical HemiSpherical Vessel",
-        lambda d, l, h: VerticalHemiSphericalVessels(d, l),
+        lambda d, l, h: _vessel_class("vertical_hemispherical_vessels", "VerticalHemiSphericalVessels")(d, l),
     ),
     VesselOption(
         "vertical-conical-vessel",
         "Vertical Conical Vessel",
-        lambda d, l, h: VerticalConicalVessels(d, l, h),
+        lambda d, l, h: _vessel_class("vertical_conical_vessels", "VerticalConicalVessels")(d, l, h),
         requires_head_distance=True,
     ),
     VesselOption(
         "vertical-flat-tank",
         "Vertical Flat Tank",
-        lambda d, l, h: VerticalFlatTanks(d, l),
+        lambda d, l, h: _vessel_class("vertical_flat_tanks", "VerticalFlatTanks")(d, l),
     ),
     VesselOption(
         "vertical-torispherical-tank",
         "Vertical ToriSpherical Tank",
-        lambda d, l, h: VerticalToriSphericalTanks(d, l),
+        lambda d, l, h: _vessel_class("vertical_torispherical_tanks", "VerticalToriSphericalTanks")(d, l),
     ),
     VesselOption(
         "vertical-elliptical-tank",
         "Vertical Elliptical Tank",
-        lambda d, l, h: VerticalEllipticalTanks(d, l),
+        lambda d, l, h: _vessel_class("vertical_elliptical_tanks", "VerticalEllipticalTanks")(d, l),
     ),
     VesselOption(
         "vertical-hemispherical-tank",
         "Vertical HemiSpherical Tank",
-        lambda d, l, h: VerticalHemiSphericalTanks(d, l),
+        lambda d, l, h: _vessel_class("vertical_hemispherical_tanks", "VerticalHemiSphericalTanks")(d, l),
     ),
     VesselOption(
         "vertical-conical-tank",
         "Vertical Conical Tank",
-        lambda d, l, h: VerticalConicalTanks(d, l, h),
+        lambda d, l, h: _vessel_class("vertical_conical_tanks", "VerticalConicalTanks")(d, l, h),
         requires_head_distance=True,
     ),
     VesselOption(
         "horizontal-flat-vessel",
         "Horizontal Flat Vessel",
-        lambda d, l, h: HorizontalFlatVessels(d, l),
+        lambda d, l, h: _vessel_class("horizontal_flat_vessels", "HorizontalFlatVessels")(d, l),
     ),
     VesselOption(
         "horizontal-torispherical-vessel",
         "Horizontal ToriSpherical Vessel",
-        lambda d, l, h: HorizontalToriSphericalVessels(d, l),
+        lambda d, l, h: _vessel_class("horizontal_torishperical_vessels", "HorizontalToriSphericalVessels")(d, l),
     ),
     VesselOption(
         "horizontal-elliptical-vessel",
         "Horizontal Elliptical Vessel",
-        lambda d, l, h: HorizontalEllipticalVessels(d, l),
+        lambda d, l, h: _vessel_class("horizontal_elliptical_vessels", "HorizontalEllipticalVessels")(d, l),
     ),
     VesselOption(
         "horizontal-hemispherical-vessel",
         "Horizontal HemiSpherical Vessel",
-        lambda d, l, h: HorizontalHemiSphericalVessels(d, l),
+        lambda d, l, h: _vessel_class("horizontal_hemispherical_vessels", "HorizontalHemiSphericalVessels")(d, l),
     ),
     VesselOption(
         "horizontal-conical-vessel",
         "Horizontal Conical Vessel",
-        lambda d, l, h: HorizontalConicalVessels(d, l, h),
+        lambda d, l, h: _vessel_class("horizontal_conical_vessels", "HorizontalConicalVessels")(d, l, h),
         requires_head_distance=True,
     ),
     VesselOption(
         "spherical-tank",
         "Spherical Tank",
-        lambda d, l, h: SphericalTanks(d),
+        lambda d, l, h: _vessel_class("spherical_tanks", "SphericalTanks")(d),
         requires_length=False,
     ),
 ]
@@ -236,16 +236,32 @@ def _select_vessel_option(key: Optional[str]) -> VesselOption:
     return _prompt_vessel_option()
 
 
-def _build_vessel(option: VesselOption, diameter: float, length: float, head_distance: float) -> Vessels:
+def _build_vessel(option: VesselOption, diameter: float, length: float, head_distance: float) -> "Vessels":
     vessel = option.builder(diameter, length, head_distance)
     return vessel
 
 
-def _configure_levels(vessel: Vessels, args) -> Tuple[float, float, float]:
+def _default_levels(total_height: float, high: Optional[float] = None,
+                    low: Optional[float] = None) -> Tuple[float, float, float]:
+    """High, low and current liquid levels, with the defaults of the prompts for the levels not given."""
+    if high is None:
+        high = min(total_height, max(total_height * 0.8, total_height * 0.2))
+    if low is None:
+        low = max(0.0, high * 0.35)
+    return high, low, min(total_height, (high + low) / 2)
+
+
+def _check_range(label: str, value: float, min_value: float, max_value: Optional[float] = None) -> None:
+    """Raise ValueError when ``value`` is outside the bounds the interactive prompts accept."""
+    if value < min_value:
+        raise ValueError(f"{label} must be ≥ {min_value}")
+    if max_value is not None and value > max_value:
+        raise ValueError(f"{label} must be ≤ {max_value}")
+
+
+def _configure_levels(vessel: "Vessels", args) -> Tuple[float, float, float]:
     total_height = vessel.total_height
-    default_high = min(total_height, max(total_height * 0.8, total_height * 0.2))
-    default_low = max(0.0, default_high * 0.35)
-    default_liquid = min(total_height, (default_high + default_low) / 2)
+    default_high, default_low, default_liquid = _default_levels(total_height)
     high = _get_float(args.high_level, "High liquid level (m)", default_high, 0.0, total_height)
     low = _get_float(args.low_level, "Low liquid level (m)", default_low, 0.0, total_height)
     if low > high:
@@ -255,6 +271,199 @@ def _configure_levels(vessel: Vessels, args) -> Tuple[float, float, float]:
     return high, low, liquid
 
 
+# the quantities printed by ``Vessels.__str__``, in the same order
+BATCH_COLUMNS = (
+    "total_height", "head_volume", "shell_volume", "total_volume", "effective_volume", "efficiency_volume",
+    "tangent_volume", "working_volume", "overflow_volume", "liquid_volume", "head_surface_area",
+    "shell_surface_area", "total_surface_area", "wetted_area",
+)
+BATCH_INPUT_COLUMNS = ("id", "type", "diameter", "length", "head_distance", "high_level", "low_level",
+                       "liquid_level", "overflow")
+BATCH_FORMATS = ("csv", "jsonl", "json")
+
+
+def _spec_float(spec: dict, name: str) -> Optional[float]:
+    value = spec.get(name)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    label = name.replace("_", " ").capitalize()
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{label} must be a number, got {value!r}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"{label} must be finite, got {value!r}")
+    return number
+
+
+def _spec_flag(spec: dict, name: str) -> bool:
+    value = spec.get(name)
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y")
+    return bool(value)
+
+
+def _evaluate_spec(spec: dict) -> dict:
+    """Build the vessel of one batch spec and evaluate the ``BATCH_COLUMNS``.
+
+    Levels that are not given default to the values the interactive prompts
+    offer, and dimensions and levels are checked against the bounds of the
+    prompts. A spec that cannot be built is reported in the ``error`` column.
+    """
+    row = {name: spec.get(name) for name in BATCH_INPUT_COLUMNS}
+    row.update(dict.fromkeys(BATCH_COLUMNS))
+    row["error"] = None
+    try:
+        key = str(spec.get("type") or "").strip().lower()
+        if key not in VESSEL_OPTION_MAP:
+            raise ValueError(f"Unknown vessel type '{spec.get('type')}'")
+        option = VESSEL_OPTION_MAP[key]
+        diameter = _spec_float(spec, "diameter")
+        length = _spec_float(spec, "length")
+        head_distance = _spec_float(spec, "head_distance")
+        if diameter is None:
+            raise ValueError("Diameter is required")
+        if option.requires_length and length is None:
+            raise ValueError("Length is required")
+        if option.requires_head_distance and head_distance is None:
+            raise ValueError("Head distance is required")
+        _check_range("Diameter", diameter, MIN_DIMENSION)
+        if option.requires_length:
+            _check_range("Length", length, MIN_DIMENSION)
+        if option.requires_head_distance:
+            _check_range("Head distance", head_distance, 0.0)
+        vessel = _build_vessel(option, diameter, length or 0.0, head_distance or 0.0)
+        total_height = vessel.total_height
+        high, low, default_liquid = _default_levels(total_height, _spec_float(spec, "high_level"),
+                                                    _spec_float(spec, "low_level"))
+        liquid = _spec_float(spec, "liquid_level")
+        if liquid is None:
+            liquid = default_liquid
+        _check_range("High liquid level", high, 0.0, total_height)
+        _check_range("Low liquid level", low, 0.0, total_height)
+        if low > high:
+            raise ValueError("Low liquid level exceeds the high liquid level")
+        _check_range("Current liquid level", liquid, 0.0, total_height)
+        vessel.high_liquid_level = high
+        vessel.low_liquid_level = low
+        vessel.liquid_level = liquid
+        vessel.overflow_flag = _spec_flag(spec, "overflow")
+        row.update(type=key, diameter=diameter, length=length, head_distance=head_distance,
+                   high_level=vessel.high_liquid_level, low_level=vessel.low_liquid_level,
+                   liquid_level=vessel.liquid_level, overflow=vessel.overflow_flag)
+        for name in BATCH_COLUMNS:
+            if name == "liquid_volume":
+                value = vessel.liquid_volume(liquid)
+            elif name == "wetted_area":
+                value = vessel.wetted_area(liquid)
+            else:
+                value = getattr(vessel, name)
+            row[name] = float(value)
+    except (TypeError, ValueError, ZeroDivisionError) as error:
+        row["error"] = str(error)
+    return row
+
+
+def _read_batch_specs(handle, fmt: str):
+    """Yield the spec dicts of a CSV (header row) or JSONL (one object per line) file."""
+    if fmt == "csv":
+        yield from csv.DictReader(handle)
+        return
+    for number, line in enumerate(handle, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            spec = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise SystemExit(f"Line {number} of the batch file is not valid JSON: {error}") from None
+        if not isinstance(spec, dict):
+            raise SystemExit(f"Line {number} of the batch file is not a JSON object.")
+        yield spec
+
+
+def _evaluate_specs(specs, workers: int):
+    """Yield the rows of ``specs`` in input order, on a process pool when ``workers`` > 1."""
+    if workers <= 1:
+        yield from map(_evaluate_spec, specs)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    specs = iter(specs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            block = list(islice(specs, workers * BATCH_BLOCK_PER_WORKER))
+            if not block:
+                return
+            yield from executor.map(_evaluate_spec, block, chunksize=BATCH_BLOCK_PER_WORKER // 4)
+
+
+def _json_value(value):
+    # NaN and infinity are not valid JSON
+    return None if isinstance(value, float) and not math.isfinite(value) else value
+
+
+def _write_batch_rows(rows, handle, fmt: str) -> Tuple[int, int]:
+    """Write the rows as they come, return the number of rows and of rows with an error."""
+    columns = BATCH_INPUT_COLUMNS + BATCH_COLUMNS + ("error",)
+    count = failed = 0
+    writer = None
+    if fmt == "csv":
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(columns)
+    elif fmt == "json":
+        handle.write("[")
+    for row in rows:
+        if fmt == "csv":
+            writer.writerow(["" if row[name] is None else row[name] for name in columns])
+        else:
+            text = json.dumps({name: _json_value(row[name]) for name in columns})
+            if fmt == "json":
+                text = ("\n  " if count == 0 else ",\n  ") + text
+            else:
+                text += "\n"
+            handle.write(text)
+        count += 1
+        failed += row["error"] is not None
+    if fmt == "json":
+        handle.write("\n]\n" if count else "]\n")
+    return count, failed
+
+
+def _batch_format(path: Optional[str], requested: Optional[str], default: str) -> str:
+    if requested:
+        return requested
+    if path and path != "-":
+        suffix = Path(path).suffix.lower()
+        if suffix in (".jsonl", ".ndjson"):
+            return "jsonl"
+        if suffix == ".json":
+            return "json"
+        if suffix == ".csv":
+            return "csv"
+    return default
+
+
+def run_batch(args) -> None:
+    """Evaluate every spec of ``args.batch`` and stream the results to ``args.batch_output``."""
+    input_format = _batch_format(args.batch, args.batch_input_format, "csv")
+    if input_format == "json":
+        input_format = "jsonl"
+    output_format = _batch_format(args.batch_output, args.batch_format, "csv")
+    from src.models.parallel import resolve_workers
+    workers = resolve_workers(args.workers)
+    source = sys.stdin if args.batch == "-" else open(args.batch, newline="", encoding="utf-8")
+    target = sys.stdout if args.batch_output == "-" else open(args.batch_output, "w", newline="", encoding="utf-8")
+    try:
+        count, failed = _write_batch_rows(_evaluate_specs(_read_batch_specs(source, input_format), workers),
+                                          target, output_format)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    print(f"Evaluated {count} vessels, {failed} with errors.", file=sys.stderr)
+
+
 def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Interactive CLI for configuring and drawing process vessels."
@@ -270,6 +479,15 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument("--output", help=f"Output drawing path (default: {DEFAULT_OUTPUT}).")
     parser.add_argument("--no-save", action="store_true", help="Skip saving the vessel drawing.")
     parser.add_argument("--list", action="store_true", help="List available vessel types and exit.")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="Evaluate the vessel specs of a CSV or JSONL file ('-' for stdin) instead of one vessel.")
+    parser.add_argument("--batch-input-format", choices=("csv", "jsonl"),
+                        help="Format of the batch file (default: from its extension, else csv).")
+    parser.add_argument("--batch-output", default="-", help="Batch results path (default: stdout).")
+    parser.add_argument("--batch-format", choices=BATCH_FORMATS,
+                        help="Format of the batch results (default: from the output extension, else csv).")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for --batch, 0 uses every core (default: 1).")
     return parser.parse_args()
 
 
@@ -278,12 +496,15 @@ def main() -> None:
     if args.list:
         _list_vessel_types()
         return
+    if args.batch:
+        run_batch(args)
+        return
 
     option = _select_vessel_option(args.type)
-    diameter = _get_float(args.diameter, "Diameter (m)", 3.0, 0.01)
+    diameter = _get_float(args.diameter, "Diameter (m)", 3.0, MIN_DIMENSION)
     length = 0.0
     if option.requires_length:
-        length = _get_float(args.length, "Tangent-to-tangent length (m)", 9.0, 0.01)
+        length = _get_float(args.length, "Tangent-to-tangent length (m)", 9.0, MIN_DIMENSION)
     else:
         length = args.length if args.length is not None else 0.0
     head_distance = 0.0
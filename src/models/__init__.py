@@ -1,17 +1,49 @@
-from .vessels import Vessels
-from .horizontal_conical_vessels import HorizontalConicalVessels
-from .horizontal_elliptical_vessels import HorizontalEllipticalVessels
-from .horizontal_flat_vessels import HorizontalFlatVessels
-from .horizontal_hemispherical_vessels import HorizontalHemiSphericalVessels
-from .horizontal_torishperical_vessels import HorizontalToriSphericalVessels
-from .spherical_tanks import SphericalTanks
-from .vertical_conical_tanks import VerticalConicalTanks
-from .vertical_conical_vessels import VerticalConicalVessels
-from .vertical_elliptical_tanks import VerticalEllipticalTanks
-from .vertical_elliptical_vessels import VerticalEllipticalVessels
-from .vertical_flat_tanks import VerticalFlatTanks
-from .vertical_flat_vessels import VerticalFlatVessels
-from .vertical_hemispherical_tanks import VerticalHemiSphericalTanks
-from .vertical_hemispherical_vessels import VerticalHemiSphericalVessels
-from .vertical_torispherical_tanks import VerticalToriSphericalTanks
-from .vertical_torispherical_vessels import VerticalToriSphericalVessels
+# the class modules are imported on first access (PEP 562), so importing the
+# package, or one class, does not pay for all of them
+_EXPORTS = {
+    "Vessels": "vessels",
+    "HorizontalConicalVessels": "horizontal_conical_vessels",
+    "HorizontalEllipticalVessels": "horizontal_elliptical_vessels",
+    "HorizontalFlatVessels": "horizontal_flat_vessels",
+    "HorizontalHemiSphericalVessels": "horizontal_hemispherical_vessels",
+    "HorizontalToriSphericalVessels": "horizontal_torishperical_vessels",
+    "SphericalTanks": "spherical_tanks",
+    "StrappingTable": "strapping",
+    "TableStore": "table_store",
+    "VerticalConicalTanks": "vertical_conical_tanks",
+    "VerticalConicalVessels": "vertical_conical_vessels",
+    "VerticalEllipticalTanks": "vertical_elliptical_tanks",
+    "VerticalEllipticalVessels": "vertical_elliptical_vessels",
+    "VerticalFlatTanks": "vertical_flat_tanks",
+    "VerticalFlatVessels": "vertical_flat_vessels",
+    "VerticalHemiSphericalTanks": "vertical_hemispherical_tanks",
+    "VerticalHemiSphericalVessels": "vertical_hemispherical_vessels",
+    "VerticalToriSphericalTanks": "vertical_torispherical_tanks",
+    "VerticalToriSphericalVessels": "vertical_torispherical_vessels",
+    "FLEET_TYPES": "fleet",
+    "evaluate_fleet": "fleet",
+    "fleet_records": "fleet",
+    "simulate_levels": "dynamics",
+    "LevelRules": "sizing",
+    "size_vessel": "sizing",
+    "LevelMemo": "memo",
+    "Profiler": "profiling",
+    "VesselSpec": "spec",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,6 @@
 import math
 
-import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle, Arc, Circle
-
+from .svg import SvgAxes
 from .vessels import Vessels
 from .vertical_flat_vessels import VerticalFlatVessels
 from .horizontal_flat_vessels import HorizontalFlatVessels
@@ -23,6 +21,7 @@ LEVEL_COLORS = {
     "LL": "#1f77b4",
 }
 LEVEL_LABEL_STYLE = dict(boxstyle="round,pad=0.15", fc="white", ec="none", alpha=0.85)
+DRAW_BACKENDS = ("matplotlib", "svg")
 
 
 def _arc_points(cx, cy, radius, start_deg, end_deg, steps=30):
@@ -117,6 +116,30 @@ def _torispherical_profile_points(vessel, steps_knuckle=30, steps_dish=60):
     return points_x, points_y
 
 
+def _add_rectangle(ax, xy, width, height):
+    if isinstance(ax, SvgAxes):
+        ax.rectangle(xy, width, height)
+        return
+    from matplotlib.patches import Rectangle
+    ax.add_patch(Rectangle(xy, width, height, edgecolor='black', facecolor='none'))
+
+
+def _add_arc(ax, center, width, height, theta1, theta2):
+    if isinstance(ax, SvgAxes):
+        ax.arc(center, width, height, theta1, theta2)
+        return
+    from matplotlib.patches import Arc
+    ax.add_patch(Arc(center, width, height, theta1=theta1, theta2=theta2, edgecolor='black'))
+
+
+def _add_circle(ax, center, radius):
+    if isinstance(ax, SvgAxes):
+        ax.circle(center, radius)
+        return
+    from matplotlib.patches import Circle
+    ax.add_patch(Circle(center, radius, edgecolor='black', facecolor='none'))
+
+
 def _head_distances(vessel):
     bottom = getattr(vessel, "bottom_head_distance", getattr(vessel, "head_distance", 0.0))
     top = getattr(vessel, "top_head_distance", getattr(vessel, "head_distance", 0.0))
@@ -250,12 +273,10 @@ def _draw_horizontal_level_markers(ax, vessel):
         )
 
 def _draw_vertical_shell(ax, vessel):
-    shell = Rectangle((-vessel.diameter / 2, 0), vessel.diameter, vessel.length, edgecolor='black', facecolor='none')
-    ax.add_patch(shell)
+    _add_rectangle(ax, (-vessel.diameter / 2, 0), vessel.diameter, vessel.length)
 
 def _draw_horizontal_shell(ax, vessel):
-    shell = Rectangle((0, -vessel.diameter / 2), vessel.length, vessel.diameter, edgecolor='black', facecolor='none')
-    ax.add_patch(shell)
+    _add_rectangle(ax, (0, -vessel.diameter / 2), vessel.length, vessel.diameter)
 
 def _draw_vertical_flat_heads(ax, vessel):
     d = vessel.diameter
@@ -275,30 +296,30 @@ def _draw_vertical_hemispherical_heads(ax, vessel):
     d = vessel.diameter
     bottom_h, top_h = _head_distances(vessel)
     if bottom_h > 0:
-        ax.add_patch(Arc((0, 0), d, d, theta1=180, theta2=360, edgecolor='black'))
+        _add_arc(ax, (0, 0), d, d, 180, 360)
     else:
         ax.plot([-d / 2, d / 2], [0, 0], 'k-')
     if top_h > 0:
-        ax.add_patch(Arc((0, vessel.length), d, d, theta1=0, theta2=180, edgecolor='black'))
+        _add_arc(ax, (0, vessel.length), d, d, 0, 180)
     else:
         ax.plot([-d / 2, d / 2], [vessel.length, vessel.length], 'k-')
 
 def _draw_horizontal_hemispherical_heads(ax, vessel):
     d = vessel.diameter
     # Left head
-    ax.add_patch(Arc((0, 0), d, d, theta1=90, theta2=270, edgecolor='black'))
+    _add_arc(ax, (0, 0), d, d, 90, 270)
     # Right head
-    ax.add_patch(Arc((vessel.length, 0), d, d, theta1=270, theta2=450, edgecolor='black'))
+    _add_arc(ax, (vessel.length, 0), d, d, 270, 450)
 
 def _draw_vertical_elliptical_heads(ax, vessel):
     d = vessel.diameter
     bottom_h, top_h = _head_distances(vessel)
     if bottom_h > 0:
-        ax.add_patch(Arc((0, 0), d, bottom_h * 2, theta1=180, theta2=360, edgecolor='black'))
+        _add_arc(ax, (0, 0), d, bottom_h * 2, 180, 360)
     else:
         ax.plot([-d / 2, d / 2], [0, 0], 'k-')
     if top_h > 0:
-        ax.add_patch(Arc((0, vessel.length), d, top_h * 2, theta1=0, theta2=180, edgecolor='black'))
+        _add_arc(ax, (0, vessel.length), d, top_h * 2, 0, 180)
     else:
         ax.plot([-d / 2, d / 2], [vessel.length, vessel.length], 'k-')
 
@@ -306,9 +327,9 @@ def _draw_horizontal_elliptical_heads(ax, vessel):
     d = vessel.diameter
     h = vessel.head_distance
     # Left head
-    ax.add_patch(Arc((0, 0), h * 2, d, theta1=90, theta2=270, edgecolor='black'))
+    _add_arc(ax, (0, 0), h * 2, d, 90, 270)
     # Right head
-    ax.add_patch(Arc((vessel.length, 0), h * 2, d, theta1=270, theta2=450, edgecolor='black'))
+    _add_arc(ax, (vessel.length, 0), h * 2, d, 270, 450)
 
 def _draw_vertical_conical_heads(ax, vessel):
     d = vessel.diameter
@@ -364,19 +385,34 @@ def _draw_horizontal_torispherical_heads(ax, vessel):
 
 def _draw_spherical(ax, vessel):
     radius = vessel.diameter / 2
-    sphere = Circle((0, radius), radius, edgecolor='black', facecolor='none')
-    ax.add_patch(sphere)
+    _add_circle(ax, (0, radius), radius)
 
 
-def draw_vessel(vessel: Vessels, output_path: str):
+def draw_vessel(vessel: Vessels, output_path: str, backend: str = "matplotlib"):
     """
     Draws a 2D cross-section of a vessel and saves it to a file.
 
     Args:
         vessel (Vessels): The vessel object to draw.
         output_path (str): The path to save the output image (e.g., 'vessel.svg').
+        backend (str): "matplotlib" saves in the format of the path extension,
+            "svg" writes SVG with the standard library only, much faster.
     """
+    if backend == "svg":
+        ax = SvgAxes()
+        _render(ax, vessel)
+        ax.savefig(output_path)
+        return
+    if backend != "matplotlib":
+        raise ValueError(f"Unknown drawing backend '{backend}', expected one of {DRAW_BACKENDS}")
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots(figsize=(8, 8))
+    _render(ax, vessel)
+    plt.savefig(output_path)
+    plt.close(fig)
+
+
+def _render(ax, vessel: Vessels):
     ax.set_aspect('equal')
 
     is_horizontal = "Horizontal" in vessel.vessels_type
@@ -438,5 +474,124 @@ def draw_vessel(vessel: Vessels, output_path: str):
 
     ax.set_title(vessel.vessels_type)
     ax.axis('off')
-    plt.savefig(output_path)
-    plt.close(fig)
+
+
+DRAW_MANY_LAYOUTS = ("pdf-pages", "sprite")
+PAGES_NAME = "drawings.pdf"
+SPRITE_NAME = "sprite.png"
+
+# figure and axes reused by every drawing of ``draw_many`` in this process
+_shared_figure = None
+
+
+def _clear_shared_axes(dpi=None):
+    global _shared_figure
+    if _shared_figure is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        figure = Figure(figsize=(8, 8))
+        FigureCanvasAgg(figure)
+        _shared_figure = figure, figure.add_subplot(), figure.dpi
+    figure, ax, default_dpi = _shared_figure
+    figure.set_dpi(dpi or default_dpi)
+    ax.clear()
+    return figure, ax
+
+
+def _draw_files(task):
+    vessels, paths, backend = task
+    for vessel, path in zip(vessels, paths):
+        if backend == "svg":
+            draw_vessel(vessel, path, backend)
+            continue
+        figure, ax = _clear_shared_axes()
+        _render(ax, vessel)
+        figure.savefig(path)
+    return paths
+
+
+def _draw_thumbnails(task):
+    import numpy as np
+    vessels, dpi = task
+    thumbnails = []
+    for vessel in vessels:
+        figure, ax = _clear_shared_axes(dpi)
+        _render(ax, vessel)
+        figure.canvas.draw()
+        thumbnails.append(np.asarray(figure.canvas.buffer_rgba()).copy())
+    return thumbnails
+
+
+def draw_many(vessels, output_dir, fmt: str = "svg", names=None, backend: str = "matplotlib",
+              workers: int | None = None, chunk_size: int | None = None, columns: int | None = None,
+              sprite_dpi: float = 30) -> list:
+    """
+    Draws many vessels, reusing one matplotlib figure per process instead of one per drawing.
+
+    Args:
+        vessels: The vessels to draw.
+        output_dir (str): Directory the drawings are written to, created if needed.
+        fmt (str): A savefig format ("svg", "png", "pdf", ...) writes one file per
+            vessel. "pdf-pages" writes every drawing as a page of drawings.pdf and
+            "sprite" tiles thumbnails row by row into sprite.png.
+        names: File names without extension, one per vessel, default "0000-ClassName".
+        backend (str): "svg" draws the per-vessel SVG files without matplotlib.
+        workers (int): Processes for the per-vessel files and the sprite thumbnails,
+            None or 1 draws in this process, 0 uses every core. PDF pages are
+            always written by this process.
+        chunk_size (int): Vessels per worker task, default a few tasks per worker.
+        columns (int): Sprite sheet width in drawings, default a square sheet.
+        sprite_dpi (float): Resolution of the sprite thumbnails, 30 gives 240 px.
+
+    Returns:
+        The paths written, in the order of the vessels for per-vessel files.
+    """
+    from pathlib import Path
+    from .parallel import chunk_bounds, parallel_map, resolve_workers
+
+    vessels = list(vessels)
+    if backend not in DRAW_BACKENDS:
+        raise ValueError(f"Unknown drawing backend '{backend}', expected one of {DRAW_BACKENDS}")
+    if backend == "svg" and fmt != "svg":
+        raise ValueError("The svg backend only writes svg files")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = resolve_workers(workers)
+    bounds = chunk_bounds(len(vessels), workers, chunk_size)
+
+    if fmt == "pdf-pages":
+        from matplotlib.backends.backend_pdf import PdfPages
+        path = output_dir / PAGES_NAME
+        with PdfPages(path) as pages:
+            for vessel in vessels:
+                figure, ax = _clear_shared_axes()
+                _render(ax, vessel)
+                pages.savefig(figure)
+        return [str(path)]
+
+    if fmt == "sprite":
+        import numpy as np
+        from matplotlib.image import imsave
+        if not vessels:
+            return []
+        tasks = [(vessels[start:stop], sprite_dpi) for start, stop in bounds]
+        thumbnails = [image for chunk in parallel_map(_draw_thumbnails, tasks, workers) for image in chunk]
+        columns = columns or math.ceil(math.sqrt(len(thumbnails)))
+        rows = math.ceil(len(thumbnails) / columns)
+        height, width = thumbnails[0].shape[:2]
+        sheet = np.full((rows * height, columns * width, 4), 255, dtype=np.uint8)
+        for index, image in enumerate(thumbnails):
+            row, column = divmod(index, columns)
+            sheet[row * height:(row + 1) * height, column * width:(column + 1) * width] = image
+        path = output_dir / SPRITE_NAME
+        imsave(path, sheet)
+        return [str(path)]
+
+    if names is None:
+        names = [f"{index:04d}-{type(vessel).__name__}" for index, vessel in enumerate(vessels)]
+    names = list(names)
+    if len(names) != len(vessels):
+        raise ValueError("Expected one name per vessel")
+    paths = [str(output_dir / f"{name}.{fmt}") for name in names]
+    tasks = [(vessels[start:stop], paths[start:stop], backend) for start, stop in bounds]
+    return [path for chunk in parallel_map(_draw_files, tasks, workers) for path in chunk]
@@ -0,0 +1,353 @@
+"""Fill and drain simulation with level-dependent flows.
+
+``simulate_levels`` integrates the liquid volume of one or many vessels,
+``dV/dt = inflow(t, h) - outflow(t, h)``, where the flows may depend on the
+level ``h`` (an orifice, a pump curve). Integrating the volume rather than
+the level keeps the equation regular where the free surface shrinks to a
+point, at the bottom of a sphere or a dished head; the level is recovered
+with a few safeguarded Newton steps on ``liquid_volume`` with
+``surface_area_at_level`` as the derivative, started from the previous level.
+
+All vessels advance together: the stepper is the linearly implicit
+Rosenbrock 2(3) pair of ``ode23s`` with one step size per vessel, so the
+stiff approach to an inflow/outflow balance or to an empty tank does not
+limit the step, and vessels of the same class and
+head shape are evaluated as one vessel with array dimensions, like
+``evaluate_fleet``. The high and low liquid levels, overflow (full) and
+empty are found as volume crossings of the cubic Hermite interpolant of each
+step. A vessel stops when it overflows or empties, or at ``t_end``.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .fleet import fleet_vessel
+from .spec import VesselSpec, vessel_class
+from .vessels import Vessels
+
+GRAVITY = 9.80665
+# volume fraction left at which a vessel counts as empty; dq/dV is unbounded as an orifice drain
+# runs dry, and the damped implicit stage would take the last fraction of a drop geometrically
+EMPTY_FRACTION = 1e-9
+MAX_NEWTON = 30
+
+SimulationResult = namedtuple("SimulationResult", (
+    "time_to_high_level", "time_to_low_level", "time_to_overflow", "time_to_empty",
+    "final_time", "final_level", "final_volume", "trajectories"))
+SimulationResult.__doc__ = """Event times (s, NaN when not reached) and final state of each vessel.
+
+``trajectories`` is None unless requested, otherwise one ``(times, levels)``
+pair of arrays per vessel with the accepted steps.
+"""
+
+
+def orifice_outflow(area, discharge_coefficient: float = 0.61, outlet_level=0.0):
+    """Gravity drain through an orifice, ``Cd * a * sqrt(2 g (h - outlet_level))`` m3/s.
+
+    Parameters
+        area : float or array
+            orifice area (m2), per vessel
+        discharge_coefficient : float
+            discharge coefficient, default 0.61 for a sharp-edged orifice
+        outlet_level : float or array
+            level of the orifice above the bottom (m), default 0.0
+    """
+    area = np.asarray(area, dtype=float)
+    outlet_level = np.asarray(outlet_level, dtype=float)
+
+    def outflow(t, level):
+        return discharge_coefficient * area * np.sqrt(2 * GRAVITY * np.maximum(level - outlet_level, 0.0))
+
+    return outflow
+
+
+def pump_outflow(max_flow, shutoff_head, discharge_level, trip_level=0.0):
+    """Centrifugal pump lifting liquid from the vessel to ``discharge_level``.
+
+    The pump curve ``H = shutoff_head * (1 - (Q / max_flow) ** 2)`` is solved
+    against the static lift ``discharge_level - h``, so the flow grows as the
+    vessel fills. The pump stops below ``trip_level``.
+
+    Parameters
+        max_flow : float or array
+            flow at zero head (m3/s)
+        shutoff_head : float or array
+            head at zero flow (m)
+        discharge_level : float or array
+            discharge elevation above the vessel bottom (m)
+        trip_level : float or array
+            level below which the pump is stopped (m), default 0.0
+    """
+    max_flow = np.asarray(max_flow, dtype=float)
+    shutoff_head = np.asarray(shutoff_head, dtype=float)
+    discharge_level = np.asarray(discharge_level, dtype=float)
+    trip_level = np.asarray(trip_level, dtype=float)
+
+    def outflow(t, level):
+        lift = discharge_level - level
+        flow = max_flow * np.sqrt(np.maximum(1 - lift / shutoff_head, 0.0))
+        return np.where(level > trip_level, flow, 0.0)
+
+    return outflow
+
+
+class _Fleet:
+    """Row-wise level methods of a vessel with array dimensions or of a list of vessels."""
+
+    def __init__(self, vessels) -> None:
+        if isinstance(vessels, Vessels):
+            self.size = np.broadcast(vessels.total_height, vessels.total_volume).size
+            self.groups = [(vessels, slice(None))]
+            self.high_liquid_level = np.broadcast_to(np.asarray(vessels.high_liquid_level, dtype=float),
+                                                     (self.size,))
+            self.low_liquid_level = np.broadcast_to(np.asarray(vessels.low_liquid_level, dtype=float), (self.size,))
+        else:
+            vessels = list(vessels)
+            specs = [vessel if isinstance(vessel, VesselSpec) else vessel.spec for vessel in vessels]
+            self.size = len(specs)
+            groups = {}
+            for row, spec in enumerate(specs):
+                groups.setdefault((spec.vessel_type, spec.fd, spec.fk), []).append(row)
+            self.groups = []
+            for (name, fd, fk), rows in groups.items():
+                rows = np.array(rows)
+                dimensions = np.array([(specs[row].diameter, specs[row].length, specs[row].head_distance)
+                                       for row in rows])
+                self.groups.append((fleet_vessel(vessel_class(name), dimensions[:, 0], dimensions[:, 1],
+                                                 dimensions[:, 2], fd, fk), rows))
+            self.high_liquid_level = np.array([getattr(vessel, "high_liquid_level", 0.0) for vessel in vessels])
+            self.low_liquid_level = np.array([getattr(vessel, "low_liquid_level", 0.0) for vessel in vessels])
+        self.total_height = self._gather("total_height")
+        self.total_volume = self._gather("total_volume")
+
+    def _gather(self, name: str) -> np.ndarray:
+        result = np.empty(self.size)
+        for vessel, rows in self.groups:
+            result[rows] = np.broadcast_to(getattr(vessel, name), result[rows].shape)
+        return result
+
+    def _apply(self, method: str, level: np.ndarray, mask=None) -> np.ndarray:
+        # groups without a row in ``mask`` are skipped and left NaN
+        result = np.full(self.size, np.nan)
+        for vessel, rows in self.groups:
+            if mask is None or mask[rows].any():
+                result[rows] = getattr(vessel, method)(level[rows])
+        return result
+
+    def liquid_volume(self, level: np.ndarray, mask=None) -> np.ndarray:
+        return self._apply("liquid_volume", level, mask)
+
+    def surface_area_at_level(self, level: np.ndarray, mask=None) -> np.ndarray:
+        return self._apply("surface_area_at_level", level, mask)
+
+    def level_for_volume(self, volume: np.ndarray, guess: np.ndarray, rtol: float = 1e-7,
+                         mask=None) -> np.ndarray:
+        """Levels holding ``volume``, Newton steps from ``guess`` kept inside a shrinking bracket.
+
+        A row stops once its step is below ``rtol`` of the height, the
+        convergence is quadratic so the error left is of order ``rtol ** 2``.
+        Rows outside ``mask`` keep ``guess``.
+        """
+        volume = np.clip(volume, 0.0, self.total_volume)
+        low, high = np.zeros(self.size), self.total_height.copy()
+        level = np.clip(guess, low, high)
+        tolerance = rtol * self.total_height
+        pending = np.ones(self.size, dtype=bool) if mask is None else mask.copy()
+        for _ in range(MAX_NEWTON):
+            error = self.liquid_volume(level, pending) - volume
+            low = np.where(pending & (error < 0), level, low)
+            high = np.where(pending & (error > 0), level, high)
+            area = self.surface_area_at_level(level, pending)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                step = np.where(area > 0, level - error / area, np.nan)
+            # a step leaving the bracket, or a flat spot, falls back to bisection
+            step = np.where((step >= low) & (step <= high), step, (low + high) / 2)
+            step = np.where(error == 0, level, step)
+            converged = (np.abs(step - level) <= tolerance) | (error == 0)
+            level = np.where(pending, step, level)
+            pending &= ~converged
+            if not pending.any():
+                break
+        return level
+
+
+def _flow(value, size: int):
+    if callable(value):
+        return value, True
+    constant = np.broadcast_to(np.asarray(value, dtype=float), (size,))
+    return (lambda t, level: constant), False
+
+
+def _hermite_crossing(threshold, t0, dt, v0, v1, f0, f1, rows, iterations: int = 50):
+    """Time where the cubic Hermite interpolant of each step in ``rows`` crosses ``threshold``, by bisection."""
+    lo, hi = np.zeros(rows.size), np.ones(rows.size)
+    v0, v1, f0, f1, step, target = v0[rows], v1[rows], f0[rows] * dt[rows], f1[rows] * dt[rows], dt[rows], threshold[rows]
+    start = np.sign(v0 - target)
+    for _ in range(iterations):
+        s = (lo + hi) / 2
+        value = ((2 * s ** 3 - 3 * s ** 2 + 1) * v0 + (s ** 3 - 2 * s ** 2 + s) * f0
+                 + (-2 * s ** 3 + 3 * s ** 2) * v1 + (s ** 3 - s ** 2) * f1)
+        same = np.sign(value - target) == start
+        lo = np.where(same, s, lo)
+        hi = np.where(same, hi, s)
+    return t0[rows] + (lo + hi) / 2 * step
+
+
+def simulate_levels(vessels, initial_level, t_end: float, inflow=0.0, outflow=0.0, high_level=None,
+                    low_level=None, rtol: float = 1e-6, max_steps: int = 100000, trajectories: bool = False,
+                    first_step: float | None = None) -> SimulationResult:
+    """Integrate the level of every vessel from ``initial_level`` to ``t_end`` s.
+
+    Parameters
+        vessels : Vessels or sequence
+            one vessel, possibly with array dimensions, or a sequence of
+            vessels or ``VesselSpec``s with scalar dimensions
+        initial_level : float or array
+            level at ``t = 0`` (m), per vessel
+        t_end : float
+            end of the simulation (s)
+        inflow, outflow : float, array or callable
+            flows (m3/s), constants per vessel or ``f(t, level)`` returning
+            one flow per vessel from arrays of times and levels, see
+            ``orifice_outflow`` and ``pump_outflow``
+        high_level, low_level : float or array
+            event levels (m), default the ``high_liquid_level`` and
+            ``low_liquid_level`` of the vessels; 0 disables the event
+        rtol : float
+            relative tolerance of the volume, default 1e-6
+        max_steps : int
+            steps per vessel before it is stopped where it is, default 100000
+        trajectories : bool
+            also return the level at every accepted step, default False
+        first_step : float
+            initial step (s), default estimated from the flows
+
+    Returns
+        SimulationResult
+            arrays with one entry per vessel, floats for a single vessel with
+            scalar dimensions
+    """
+    if t_end <= 0:
+        raise ValueError("End time must be positive")
+    if rtol <= 0:
+        raise ValueError("Tolerance must be positive")
+    fleet = _Fleet(vessels)
+    n = fleet.size
+    level = np.broadcast_to(np.asarray(initial_level, dtype=float), (n,)).copy()
+    if np.any(level < 0) or np.any(level > fleet.total_height):
+        raise ValueError("Initial level must be between 0 and the total height")
+    inflow, inflow_uses_level = _flow(inflow, n)
+    outflow, outflow_uses_level = _flow(outflow, n)
+    uses_level = inflow_uses_level or outflow_uses_level
+    high_level = fleet.high_liquid_level if high_level is None else np.broadcast_to(
+        np.asarray(high_level, dtype=float), (n,))
+    low_level = fleet.low_liquid_level if low_level is None else np.broadcast_to(
+        np.asarray(low_level, dtype=float), (n,))
+
+    total_volume = fleet.total_volume
+    volume = fleet.liquid_volume(level)
+    # the events as volume thresholds and crossing directions, terminal ones stop the vessel
+    events = [
+        (np.where(high_level > 0, fleet.liquid_volume(np.minimum(high_level, fleet.total_height)), np.nan), 1, False),
+        (np.where(low_level > 0, fleet.liquid_volume(np.minimum(low_level, fleet.total_height)), np.nan), -1, False),
+        (total_volume, 1, True),
+        (EMPTY_FRACTION * total_volume, -1, True),
+    ]
+    event_times = [np.full(n, np.nan) for _ in events]
+    atol = 1e-3 * rtol * total_volume
+
+    def net_flow(t, current):
+        return np.broadcast_to(inflow(t, current), (n,)) - np.broadcast_to(outflow(t, current), (n,))
+
+    def rate(t, v, v0, h0, area, mask):
+        if not uses_level:
+            return net_flow(t, h0), h0
+        # Newton from the first order prediction dh = dV / A of the level h0 at volume v0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            guess = np.where(area > 0, h0 + (v - v0) / area, h0)
+        current = fleet.level_for_volume(v, guess, mask=mask)
+        return net_flow(t, current), current
+
+    def derivatives(t, current, q, mask):
+        """Surface area, dq/dV kept non-positive so the implicit stage only damps, and dq/dt."""
+        if not uses_level:
+            return np.zeros(n), 0.0, 0.0
+        dh = 1e-7 * fleet.total_height
+        area = fleet.surface_area_at_level(current, mask)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            jacobian = np.where(area > 0, (net_flow(t, current + dh) - q) / dh / area, 0.0)
+        dt = 1e-7 * np.maximum(t, 1.0)
+        return area, np.minimum(jacobian, 0.0), (net_flow(t + dt, current) - q) / dt
+
+    t = np.zeros(n)
+    f0 = net_flow(t, level)
+    if first_step is None:
+        scale = np.abs(f0) / np.maximum(total_volume, 1e-300)
+        dt = np.minimum(t_end, 0.01 / np.maximum(scale, 1e-300) * rtol ** (1 / 3))
+    else:
+        dt = np.full(n, float(first_step))
+    # a vessel that starts full and filling, or empty and draining, stops at once
+    for index, direction in ((2, 1), (3, -1)):
+        threshold = events[index][0]
+        at_start = direction * (volume - threshold) >= 0
+        at_start &= (direction * f0 > 0) if index == 2 else (volume <= threshold) & (f0 < 0)
+        event_times[index][at_start] = 0.0
+    active = np.isnan(event_times[2]) & np.isnan(event_times[3])
+    steps = np.zeros(n, dtype=int)
+    history = [(t.copy(), level.copy(), active.copy())] if trajectories else None
+    d, e32 = 1 / (2 + np.sqrt(2)), 6 + np.sqrt(2)
+    while active.any():
+        dt = np.where(active, np.minimum(dt, t_end - t), 0.0)
+        # linearly implicit Rosenbrock 2(3) pair of Shampine and Reichelt (ode23s), stable for stiff drains
+        area, jacobian, time_derivative = derivatives(t, level, f0, active)
+        w = 1 - dt * d * jacobian
+        k1 = (f0 + dt * d * time_derivative) / w
+        f1, _ = rate(t + dt / 2, volume + dt / 2 * k1, volume, level, area, active)
+        k2 = (f1 - k1) / w + k1
+        new_volume = volume + dt * k2
+        f2, new_level = rate(t + dt, new_volume, volume, level, area, active)
+        k3 = (f2 - e32 * (k2 - f1) - 2 * (k1 - f0) + dt * d * time_derivative) / w
+        error = dt / 6 * (k1 - 2 * k2 + k3)
+        scale = atol + rtol * np.maximum(np.abs(volume), np.abs(new_volume))
+        ratio = np.abs(error) / scale
+        accepted = active & (ratio <= 1)
+        stop = np.zeros(n, dtype=bool)
+        stop_time = t + dt
+        for index, (threshold, direction, terminal) in enumerate(events):
+            crossed = accepted & np.isnan(event_times[index]) & (direction * (volume - threshold) < 0) & (
+                direction * (new_volume - threshold) >= 0)
+            rows = np.flatnonzero(crossed)
+            if rows.size:
+                times = _hermite_crossing(threshold, t, dt, volume, new_volume, f0, f2, rows)
+                event_times[index][rows] = times
+                if terminal:
+                    stop[rows] = True
+                    stop_time[rows] = times
+                    new_volume[rows] = threshold[rows]
+        if trajectories and not uses_level:
+            new_level = fleet.level_for_volume(new_volume, level, mask=accepted)
+        if stop.any():
+            new_level = fleet.level_for_volume(new_volume, new_level, mask=stop)
+        t = np.where(accepted, np.where(stop, stop_time, t + dt), t)
+        volume = np.where(accepted, new_volume, volume)
+        level = np.where(accepted, new_level, level)
+        f0 = np.where(accepted, f2, f0)
+        steps += active
+        with np.errstate(divide="ignore"):
+            factor = np.clip(0.9 * np.where(ratio > 0, ratio, 1e-12) ** (-1 / 3), 0.2, 5.0)
+        dt = np.where(accepted, dt * factor, dt * np.minimum(factor, 0.5))
+        active &= ~(accepted & (stop | (t >= t_end))) & (steps < max_steps)
+        if history is not None:
+            history.append((t.copy(), level.copy(), accepted.copy()))
+
+    if not uses_level:
+        level = fleet.level_for_volume(volume, level)
+    result = SimulationResult(*event_times, t, level, volume, None)
+    if history is not None:
+        times, levels, kept = (np.array(column) for column in zip(*history))
+        result = result._replace(trajectories=[(times[kept[:, row], row], levels[kept[:, row], row])
+                                               for row in range(n)])
+    if isinstance(vessels, Vessels) and np.broadcast(vessels.total_height, vessels.total_volume).ndim == 0:
+        result = SimulationResult(*(float(value[0]) for value in result[:-1]),
+                                  result.trajectories[0] if trajectories else None)
+    return result
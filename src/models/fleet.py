@@ -0,0 +1,168 @@
+"""Columnar evaluation of many vessels at once.
+
+A fleet is given as equal-length columns, one entry per vessel. Rows are
+grouped by vessel type (and by ``fd``/``fk`` for F&D heads) and every group
+is evaluated by a single vessel object whose dimensions are arrays, so the
+level methods run as NumPy kernels instead of one Python object per row.
+"""
+import numpy as np
+
+from .horizontal_conical_vessels import HorizontalConicalVessels
+from .horizontal_elliptical_vessels import HorizontalEllipticalVessels
+from .horizontal_flat_vessels import HorizontalFlatVessels
+from .horizontal_hemispherical_vessels import HorizontalHemiSphericalVessels
+from .horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from .spherical_tanks import SphericalTanks
+from .vertical_conical_tanks import VerticalConicalTanks
+from .vertical_conical_vessels import VerticalConicalVessels
+from .vertical_elliptical_tanks import VerticalEllipticalTanks
+from .vertical_elliptical_vessels import VerticalEllipticalVessels
+from .vertical_flat_tanks import VerticalFlatTanks
+from .vertical_flat_vessels import VerticalFlatVessels
+from .vertical_hemispherical_tanks import VerticalHemiSphericalTanks
+from .vertical_hemispherical_vessels import VerticalHemiSphericalVessels
+from .vertical_torispherical_tanks import VerticalToriSphericalTanks
+from .vertical_torispherical_vessels import VerticalToriSphericalVessels
+from .parallel import map_fleet, resolve_workers
+from .vessels import Vessels
+
+# same keys as the command line ``--type`` option
+FLEET_TYPES: dict[str, type[Vessels]] = {
+    "vertical-flat-vessel": VerticalFlatVessels,
+    "vertical-torispherical-vessel": VerticalToriSphericalVessels,
+    "vertical-elliptical-vessel": VerticalEllipticalVessels,
+    "vertical-hemispherical-vessel": VerticalHemiSphericalVessels,
+    "vertical-conical-vessel": VerticalConicalVessels,
+    "vertical-flat-tank": VerticalFlatTanks,
+    "vertical-torispherical-tank": VerticalToriSphericalTanks,
+    "vertical-elliptical-tank": VerticalEllipticalTanks,
+    "vertical-hemispherical-tank": VerticalHemiSphericalTanks,
+    "vertical-conical-tank": VerticalConicalTanks,
+    "horizontal-flat-vessel": HorizontalFlatVessels,
+    "horizontal-torispherical-vessel": HorizontalToriSphericalVessels,
+    "horizontal-elliptical-vessel": HorizontalEllipticalVessels,
+    "horizontal-hemispherical-vessel": HorizontalHemiSphericalVessels,
+    "horizontal-conical-vessel": HorizontalConicalVessels,
+    "spherical-tank": SphericalTanks,
+}
+
+FLEET_COLUMNS = ("total_height", "total_volume", "working_volume", "effective_volume",
+                 "head_surface_area", "shell_surface_area", "total_surface_area", "surge_time")
+
+_CONICAL = (VerticalConicalVessels, HorizontalConicalVessels)
+
+
+def fleet_vessel(vessel_class: type[Vessels], diameter, length, head_distance=None, fd=None, fk=None) -> Vessels:
+    """Build one vessel whose dimensions are arrays, one entry per fleet row.
+
+    Every level method broadcasts over the dimensions, so the returned object
+    evaluates the whole group at once. ``fd`` and ``fk`` must be scalars.
+    """
+    if vessel_class is SphericalTanks:
+        return SphericalTanks(diameter)
+    if issubclass(vessel_class, _CONICAL):
+        return vessel_class(diameter, length, head_distance)
+    if issubclass(vessel_class, VerticalToriSphericalVessels):
+        vessel = vessel_class(diameter, length)
+        if fd is not None:
+            vessel.fd = fd
+        if fk is not None:
+            vessel.fk = fk
+        return vessel
+    return vessel_class(diameter, length)
+
+
+def evaluate_fleet(vessel_type, diameter, length=None, head_distance=None, high_liquid_level=None,
+                   low_liquid_level=None, fd=None, fk=None, flow_out=None,
+                   workers: int | None = None) -> dict[str, np.ndarray]:
+    """Evaluate a columnar table of vessels without creating one object per row.
+
+    Parameters
+        vessel_type : array of str
+            vessel type keys, see ``FLEET_TYPES``
+        diameter, length, head_distance : array of float
+            dimensions (m); ``length`` is ignored for spherical tanks and
+            ``head_distance`` is only used by conical heads, default 0.0
+        high_liquid_level, low_liquid_level : array of float
+            liquid levels (m), default 0.0
+        fd, fk : array of float
+            dish and knuckle radius fractions of F&D heads, NaN or None for
+            the vessel default
+        flow_out : array of float
+            outlet flow (m3/s) for the surge time, NaN where not given
+        workers : int
+            evaluate row chunks on a process pool of this size, 0 for all
+            cores, default None (serial)
+
+    Returns
+        dict of str to ndarray
+            one float column per name in ``FLEET_COLUMNS``, in row order
+    """
+    vessel_type = np.asarray(vessel_type)
+    n = vessel_type.shape[0]
+    diameter = _column(diameter, n, np.nan)
+    length = _column(length, n, 0.0)
+    head_distance = _column(head_distance, n, 0.0)
+    high_liquid_level = _column(high_liquid_level, n, 0.0)
+    low_liquid_level = _column(low_liquid_level, n, 0.0)
+    fd = _column(fd, n, np.nan)
+    fk = _column(fk, n, np.nan)
+    flow_out = _column(flow_out, n, np.nan)
+    unknown = set(np.unique(vessel_type).tolist()) - FLEET_TYPES.keys()
+    if unknown:
+        raise ValueError(f"Unknown vessel types: {', '.join(sorted(map(str, unknown)))}")
+    if np.any(~(diameter > 0)):
+        raise ValueError("Diameter must be positive")
+    if np.any(head_distance < 0):
+        raise ValueError("Head distance must be non-negative")
+    if np.any(high_liquid_level < 0) or np.any(low_liquid_level < 0):
+        raise ValueError("Liquid levels must be non-negative")
+    if n > 0 and resolve_workers(workers) > 1:
+        return map_fleet(dict(vessel_type=vessel_type, diameter=diameter, length=length, head_distance=head_distance,
+                              high_liquid_level=high_liquid_level, low_liquid_level=low_liquid_level,
+                              fd=fd, fk=fk, flow_out=flow_out), n, workers)
+
+    columns = {name: np.full(n, np.nan) for name in FLEET_COLUMNS}
+    for key in np.unique(vessel_type):
+        vessel_class = FLEET_TYPES[key]
+        rows = np.flatnonzero(vessel_type == key)
+        if vessel_class is not SphericalTanks and np.any(~(length[rows] > 0)):
+            raise ValueError("Length must be positive")
+        if issubclass(vessel_class, VerticalToriSphericalVessels):
+            # the F&D head engine takes scalar fd/fk, so split the type by head shape
+            default = vessel_class()
+            heads = np.stack([np.where(np.isnan(fd[rows]), default.fd, fd[rows]),
+                              np.where(np.isnan(fk[rows]), default.fk, fk[rows])], axis=1)
+            shapes, inverse = np.unique(heads, axis=0, return_inverse=True)
+            groups = [(rows[inverse.ravel() == i], (float(shape[0]), float(shape[1])))
+                      for i, shape in enumerate(shapes)]
+        else:
+            groups = [(rows, (None, None))]
+        for group, (group_fd, group_fk) in groups:
+            vessel = fleet_vessel(vessel_class, diameter[group], length[group], head_distance[group],
+                                  group_fd, group_fk)
+            vessel._high_liquid_level = high_liquid_level[group]
+            vessel._low_liquid_level = low_liquid_level[group]
+            for name in FLEET_COLUMNS[:-1]:
+                columns[name][group] = getattr(vessel, name)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        columns["surge_time"] = np.where(flow_out > 0, columns["working_volume"] / flow_out, np.nan)
+    return columns
+
+
+def fleet_records(columns: dict[str, np.ndarray]) -> np.ndarray:
+    """Pack the columns returned by ``evaluate_fleet`` into a structured array."""
+    names = list(columns)
+    records = np.empty(len(columns[names[0]]), dtype=[(name, float) for name in names])
+    for name in names:
+        records[name] = columns[name]
+    return records
+
+
+def _column(values, n: int, default: float) -> np.ndarray:
+    if values is None:
+        return np.full(n, default)
+    column = np.asarray(values, dtype=float)
+    if column.shape != (n,):
+        column = np.broadcast_to(column, (n,)).copy()
+    return column
@@ -0,0 +1,180 @@
+"""Process-wide registry of tabulated dimensionless head curves.
+
+Heads of the same shape are similar, so a curve in units of the diameter
+serves every vessel with that head: volumes scale with ``diameter ** 3`` and
+areas with ``diameter ** 2``. Curves are keyed on ``(head type, fd, fk,
+orientation, quantity)``, built on first use and shared by every instance.
+
+The registry can be persisted with ``save`` and ``load``. When the
+``VESSELS_HEAD_CURVES`` environment variable names a ``.npz`` file the shared
+registry loads it at import and writes newly built curves back to it.
+
+Only horizontal heads are tabulated. Vertical F&D heads have exact closed
+forms (see ``torispherical_heads``) that are cheaper than a table lookup.
+"""
+import os
+from ast import literal_eval
+
+import numpy as np
+
+from .torispherical_heads import (head_constants, horizontal_head_surface_area, horizontal_head_volume,
+                                  horizontal_head_wetted_area)
+
+CURVE_INTERVALS = 4096
+
+
+class HeadCurve:
+    """Piecewise cubic Hermite curve through ``(nodes, values)`` with ``slopes``.
+
+    Arguments outside the node range are clipped to it.
+    """
+
+    __slots__ = ("nodes", "values", "slopes")
+
+    def __init__(self, nodes, values, slopes) -> None:
+        self.nodes = np.asarray(nodes, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        self.slopes = np.asarray(slopes, dtype=float)
+        for array in (self.nodes, self.values, self.slopes):
+            array.flags.writeable = False
+
+    def __call__(self, x):
+        nodes = self.nodes
+        x = np.minimum(np.maximum(np.asarray(x, dtype=float), nodes[0]), nodes[-1])
+        i = np.minimum(np.maximum(np.searchsorted(nodes, x, side="right") - 1, 0), nodes.size - 2)
+        h = nodes[i + 1] - nodes[i]
+        t = (x - nodes[i]) / h
+        return (self.values[i] * (1 + 2 * t) * (1 - t) ** 2 + self.slopes[i] * h * t * (1 - t) ** 2
+                + self.values[i + 1] * t ** 2 * (3 - 2 * t) + self.slopes[i + 1] * h * t ** 2 * (t - 1))
+
+    def derivative(self, x):
+        """Exact derivative of the interpolant at ``x``, continuous across the nodes."""
+        nodes = self.nodes
+        x = np.minimum(np.maximum(np.asarray(x, dtype=float), nodes[0]), nodes[-1])
+        i = np.minimum(np.maximum(np.searchsorted(nodes, x, side="right") - 1, 0), nodes.size - 2)
+        h = nodes[i + 1] - nodes[i]
+        t = (x - nodes[i]) / h
+        return (6 * t * (t - 1) * (self.values[i] - self.values[i + 1]) / h
+                + self.slopes[i] * (1 - t) * (1 - 3 * t) + self.slopes[i + 1] * t * (3 * t - 2))
+
+
+def _breaks(fd: float, fk: float) -> list[float]:
+    # fill fractions where the liquid surface touches the dish/knuckle junction
+    _, _, b1 = head_constants(fd, fk)
+    return [0.0, 1 / 2 - b1, 1 / 2 + b1, 1.0]
+
+
+def _piece_nodes(low: float, high: float, intervals: int) -> np.ndarray:
+    return np.linspace(low, high, max(int(np.ceil(intervals * (high - low))), 2) + 1)
+
+
+def horizontal_volume_curve(fd: float, fk: float, intervals: int = CURVE_INTERVALS) -> HeadCurve:
+    """Volume of one horizontal F&D head against the fill fraction, with the exact surface area as slope.
+
+    Within ``2e-13`` of :func:`horizontal_head_volume`, relative to the full
+    head, for the ASME torispherical and 2:1 elliptical pairs.
+    """
+    nodes = np.unique(np.concatenate([_piece_nodes(low, high, intervals)
+                                      for low, high in zip(_breaks(fd, fk)[:-1], _breaks(fd, fk)[1:])]))
+    return HeadCurve(nodes, horizontal_head_volume(nodes, fd, fk), horizontal_head_surface_area(nodes, fd, fk))
+
+
+def horizontal_wetted_area_curve(fd: float, fk: float, intervals: int = CURVE_INTERVALS) -> HeadCurve:
+    """Wetted area of one horizontal F&D head against the fill fraction.
+
+    The slope is infinite where the liquid surface is tangent to the head,
+    so slopes are second order finite differences taken within each piece
+    between the breaks. Within ``2e-9`` of :func:`horizontal_head_wetted_area`,
+    relative to the full head area, for the ASME torispherical and 2:1
+    elliptical pairs.
+    """
+    nodes, values, slopes = [], [], []
+    breaks = _breaks(fd, fk)
+    for low, high in zip(breaks[:-1], breaks[1:]):
+        piece = _piece_nodes(low, high, intervals)
+        area = horizontal_head_wetted_area(piece, fd, fk)
+        slope = np.gradient(area, piece, edge_order=2)
+        if nodes:
+            # a break node keeps the slope of the piece on its right
+            slopes[-1][-1] = slope[0]
+            piece, area, slope = piece[1:], area[1:], slope[1:]
+        nodes.append(piece)
+        values.append(area)
+        slopes.append(slope)
+    return HeadCurve(np.concatenate(nodes), np.concatenate(values), np.concatenate(slopes))
+
+
+CURVE_BUILDERS = {
+    ("horizontal", "volume"): horizontal_volume_curve,
+    ("horizontal", "wetted_area"): horizontal_wetted_area_curve,
+}
+
+
+class HeadCurveRegistry:
+    """Dimensionless head curves keyed on ``(head type, fd, fk, orientation, quantity)``.
+
+    Parameters
+        path : str
+            ``.npz`` file the curves are loaded from and saved to as they are
+            built, default None (memory only)
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self._curves = {}
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._curves)
+
+    def __contains__(self, key) -> bool:
+        return key in self._curves
+
+    def keys(self) -> list[tuple]:
+        return list(self._curves)
+
+    def get(self, head_type: str, fd: float, fk: float, orientation: str, quantity: str) -> HeadCurve:
+        """Return the curve for the key, building it on first use."""
+        key = (head_type, float(fd), float(fk), orientation, quantity)
+        try:
+            return self._curves[key]
+        except KeyError:
+            pass
+        try:
+            builder = CURVE_BUILDERS[orientation, quantity]
+        except KeyError:
+            raise ValueError(f"No {orientation} {quantity} head curve") from None
+        curve = self._curves[key] = builder(key[1], key[2])
+        if self.path is not None:
+            self.save(self.path)
+        return curve
+
+    def clear(self) -> None:
+        self._curves.clear()
+
+    def save(self, path: str) -> None:
+        """Write every curve to the ``.npz`` file ``path``."""
+        arrays = {}
+        for index, (key, curve) in enumerate(self._curves.items()):
+            arrays[f"key_{index}"] = np.array([repr(part) for part in key])
+            for field in HeadCurve.__slots__:
+                arrays[f"{field}_{index}"] = getattr(curve, field)
+        # write next to the target and rename, so readers never see a partial file
+        temporary = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(temporary, **arrays)
+        os.replace(temporary, path)
+
+    def load(self, path: str) -> None:
+        """Add the curves stored in ``path`` by ``save``."""
+        with np.load(path) as data:
+            for name in data.files:
+                if not name.startswith("key_"):
+                    continue
+                index = name[len("key_"):]
+                head_type, fd, fk, orientation, quantity = (literal_eval(str(part)) for part in data[name])
+                self._curves[head_type, fd, fk, orientation, quantity] = HeadCurve(
+                    *(data[f"{field}_{index}"] for field in HeadCurve.__slots__))
+
+
+HEAD_CURVES = HeadCurveRegistry(os.environ.get("VESSELS_HEAD_CURVES"))
@@ -1,5 +1,7 @@
 from .horizontal_flat_vessels import HorizontalFlatVessels
-from math import pi, sqrt, asin, acosh
+from .vessels import clip_level, memoize_level
+from math import pi
+import numpy as np
 
 class HorizontalConicalVessels(HorizontalFlatVessels):
     vessels_type = 'Horizontal Conical Vessels'
@@ -17,6 +19,7 @@ class HorizontalConicalVessels(HorizontalFlatVessels):
     @head_distance.setter
     def head_distance(self, value: float):
         self._head_distance = value
+        self._clear_geometry_cache()
 
     @property
     def tangent_height(self) -> float:
@@ -26,36 +29,42 @@ class HorizontalConicalVessels(HorizontalFlatVessels):
     def tangent_volume(self) -> float:
         return 0.0
 
+    @memoize_level
     def head_liquid_volume(self, value: float) -> float:
-        if (value <= 0.0) | (self.head_distance <= 0.0):
-            return 0.0
-        elif value < self.diameter / 2:
-            return 2 * self.conical_head_volume(value)
-        else:
-            value = self.total_height - min(value, self.total_height)
-            return 2 * (1 / 3 * pi * self.diameter ** 2 / 4 * self.head_distance - self.conical_head_volume(value))
+        lower_half = value < self.diameter / 2
+        depth = np.where(lower_half, np.maximum(value, 0.0), self.total_height - np.minimum(value, self.total_height))
+        partial = self.conical_head_volume(depth)
+        volume = np.where(lower_half, 2 * partial,
+                          2 * (1 / 3 * pi * self.diameter ** 2 / 4 * self.head_distance - partial))
+        return np.where((value <= 0.0) | (self.head_distance <= 0.0), 0.0, volume)
 
     def conical_head_volume(self, value: float) -> float:
         k = 1 - 2 * value / self.diameter
-        if k == 0:
-            return 1 / 6 * pi * self.diameter ** 2 / 4 * self.head_distance
+        safe_k = np.where(k == 0, 1.0, k)
+        tail = np.where(k == 0, 0.0, k ** 3 * np.arccosh(1 / safe_k))
         return self.head_distance * self.diameter ** 2 / 12 * (
-                pi / 2 - 2 * k * sqrt(1 - k ** 2) - asin(k) + k ** 3 * acosh(1 / k))
+                pi / 2 - 2 * k * np.sqrt(1 - k ** 2) - np.arcsin(k) + tail)
 
+    @memoize_level
     def head_wetted_area(self, value: float) -> float:
-        return 0.0 if (value <= 0.0) | (self.head_distance <= 0.0) else 2 * self.horizontal_cone_surface_area(value)
+        return np.where((value <= 0.0) | (self.head_distance <= 0.0), 0.0, 2 * self.horizontal_cone_surface_area(value))
 
     def horizontal_cone_surface_area(self, value: float) -> float:
-        if value <= 0.0:
-            return 0.0
-        elif value < self.diameter / 2:
-            return self.horizontal_cone_surface_area_fn(value)
-        else:
-            sa1 = self.vertical_cone_surface_area(self.head_distance)
-            sa2 = self.horizontal_cone_surface_area_fn(self.diameter - value)
-            return sa1 - sa2
+        lower_half = value < self.diameter / 2
+        depth = np.where(lower_half, np.maximum(value, 0.0), self.diameter - np.minimum(value, self.diameter))
+        partial = self.horizontal_cone_surface_area_fn(depth)
+        sa1 = self.vertical_cone_surface_area(self.head_distance)
+        return np.where(value <= 0.0, 0.0, np.where(lower_half, partial, sa1 - partial))
 
     def horizontal_cone_surface_area_fn(self, value: float) -> float:
         r = self.diameter / 2
         k = 1 - value / r
-        return r * sqrt(r ** 2 + self.head_distance ** 2) * (pi / 2 - asin(k) - k * sqrt(1 - k ** 2))
\ No newline at end of file
+        return r * np.sqrt(r ** 2 + self.head_distance ** 2) * (pi / 2 - np.arcsin(k) - k * np.sqrt(1 - k ** 2))
+
+    def head_surface_area_at_level(self, value: float) -> float:
+        # each cone cuts a hyperbolic segment, integral of the chord 2 * sqrt((r z / h) ^ 2 - y ^ 2) over z
+        radius = self.diameter / 2
+        y = np.abs(clip_level(value, 0.0, self.diameter) - radius)
+        root = np.sqrt(radius ** 2 - y ** 2)
+        log_term = np.where(y > 0, y ** 2 * np.log((radius + root) / np.where(y > 0, y, 1.0)), 0.0)
+        return 2 * self.head_distance / radius * (radius * root - log_term)
@@ -1,9 +1,12 @@
 from .horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from .vessels import clip_level, memoize_level
 from .vertical_elliptical_vessels import elliptical_head_volume
-from .constants import FD_ELLIP, FK_ELLIP
+from .constants import FD_ELLIP, FK_ELLIP, pi
+import numpy as np
 
 class HorizontalEllipticalVessels(HorizontalToriSphericalVessels):
     vessels_type = 'Horizontal Elliptical Vessels'
+    head_type = 'elliptical'
 
     def __init__(self, input_diameter: float = 3, input_length: float = 9,
                  fd: float = FD_ELLIP, fk: float = FK_ELLIP) -> None:
@@ -13,5 +16,12 @@ class HorizontalEllipticalVessels(HorizontalToriSphericalVessels):
     def head_distance(self) -> float:
         return self.diameter / 4
 
+    @memoize_level
     def head_liquid_volume(self, value: float) -> float:
-        return elliptical_head_volume(self.diameter / 2, self.head_distance, self.diameter / 2, value)
\ No newline at end of file
+        return elliptical_head_volume(self.diameter / 2, self.head_distance, self.diameter / 2, value)
+
+    def head_surface_area_at_level(self, value: float) -> float:
+        # each head cuts a half ellipse with semi-axes sqrt(R^2 - y^2) and head_distance * sqrt(1 - y^2 / R^2)
+        radius = self.diameter / 2
+        y = clip_level(value, 0.0, self.diameter) - radius
+        return pi * self.head_distance * (radius ** 2 - y ** 2) / radius
@@ -1,5 +1,6 @@
-from .vessels import Vessels
-from math import pi, sqrt, acos
+from .vessels import Vessels, cached_geometry, vectorize_levels, clip_level, memoize_level
+from math import pi
+import numpy as np
 
 class HorizontalFlatVessels(Vessels):
     vessels_type = 'Horizontal Flat Vessels'
@@ -9,19 +10,19 @@ class HorizontalFlatVessels(Vessels):
         self._diameter = input_diameter
         self._length = input_length
 
-    @property
+    @cached_geometry
     def total_height(self) -> float:
         return self.diameter
 
-    @property
+    @cached_geometry
     def head_volume(self) -> float:
         return self.head_liquid_volume(self.total_height)
 
-    @property
+    @cached_geometry
     def shell_volume(self) -> float:
         return self.shell_liquid_volume(self.total_height)
 
-    @property
+    @cached_geometry
     def total_volume(self) -> float:
         return self.head_volume + self.shell_volume
 
@@ -29,11 +30,11 @@ class HorizontalFlatVessels(Vessels):
     def working_volume(self) -> float:
         return self.liquid_volume(self.high_liquid_level) - self.liquid_volume(self.low_liquid_level)
 
-    @property
+    @cached_geometry
     def shell_surface_area(self) -> float:
         return pi * self.diameter * self.length
 
-    @property
+    @cached_geometry
     def head_surface_area(self) -> float:
         return self.head_wetted_area(self.total_height)
 
@@ -45,27 +46,50 @@ class HorizontalFlatVessels(Vessels):
     def tangent_volume(self) -> float:
         return 0.0
 
+    @memoize_level
     def head_liquid_volume(self, value: float) -> float:
         return 0.0
 
+    @memoize_level
     def shell_liquid_volume(self, value: float) -> float:
-        if value <= 0:
-            return 0.0
-        else:
-            value = min(value, self.total_height)
-            theta = acos(1 - value * 2 / self.diameter)
-            return self.length * (theta * self.diameter ** 2 / 4 - (self.diameter / 2 - value) * sqrt(
-                value * (self.diameter - value)))
+        return horizontal_cylinder_liquid_volume(self.diameter, self.length, value)
 
+    @memoize_level
     def shell_wetted_area(self, value: float) -> float:
-        return 0.0 if value <= 0 else self.diameter * \
-                                      acos(1 - min(value, self.total_height) * 2 / self.diameter) * self.length
+        return horizontal_cylinder_wetted_area(self.diameter, self.length, value)
 
+    @memoize_level
     def head_wetted_area(self, value: float) -> float:
-        if value <= 0:
-            return 0
-        else:
-            value = min(value, self.total_height)
-            theta = 2 * acos(1 - value * 2 / self.diameter)
-            return 2 * (theta / 2 * (self.diameter / 2) ** 2 - (self.diameter / 2 - value) * sqrt(
-                value * (self.diameter - value)))
\ No newline at end of file
+        level = clip_level(value, 0.0, self.total_height)
+        theta = 2 * np.arccos(1 - level * 2 / self.diameter)
+        return np.where(value <= 0, 0.0, 2 * (theta / 2 * (self.diameter / 2) ** 2 - (self.diameter / 2 - level) * np.sqrt(
+            level * (self.diameter - level))))
+
+    def head_surface_area_at_level(self, value: float) -> float:
+        """Free liquid surface area (m2) inside both heads at ``value`` m level."""
+        return 0.0
+
+    @vectorize_levels
+    def surface_area_at_level(self, value: float) -> float:
+        level = clip_level(value, 0.0, self.total_height)
+        return 2 * np.sqrt(level * (self.diameter - level)) * self.length + self.head_surface_area_at_level(level)
+
+
+def horizontal_cylinder_liquid_volume(diameter, length, level):
+    """Liquid volume of horizontal cylinders, broadcast over diameter, length and level.
+
+    The circular segment below ``level`` times ``length``, with the level
+    clipped to ``[0, diameter]``.
+    """
+    diameter = np.asarray(diameter, dtype=float)
+    level = clip_level(level, 0.0, diameter)
+    radius = diameter / 2
+    theta = np.arccos(1 - level / radius)
+    return length * (theta * radius ** 2 - (radius - level) * np.sqrt(level * (diameter - level)))
+
+
+def horizontal_cylinder_wetted_area(diameter, length, level):
+    """Wetted shell area of horizontal cylinders, broadcast over diameter, length and level."""
+    diameter = np.asarray(diameter, dtype=float)
+    level = clip_level(level, 0.0, diameter)
+    return diameter * np.arccos(1 - 2 * level / diameter) * length
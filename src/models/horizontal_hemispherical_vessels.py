@@ -1,5 +1,7 @@
 from .horizontal_elliptical_vessels import HorizontalEllipticalVessels
+from .vessels import cached_geometry, memoize_level
 from .constants import pi
+import numpy as np
 
 class HorizontalHemiSphericalVessels(HorizontalEllipticalVessels):
     vessels_type = 'Horizontal HemiSpherical Vessels'
@@ -11,5 +13,10 @@ class HorizontalHemiSphericalVessels(HorizontalEllipticalVessels):
     def head_distance(self) -> float:
         return self.diameter / 2
 
+    @cached_geometry
+    def head_surface_area(self) -> float:
+        return self.head_wetted_area(self.total_height)
+
+    @memoize_level
     def head_wetted_area(self, value: float) -> float:
-        return 0.0 if value < 0 else pi * self.diameter * value
+        return np.where(value < 0, 0.0, pi * self.diameter * value)
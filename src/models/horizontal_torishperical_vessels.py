@@ -1,7 +1,8 @@
 from .horizontal_flat_vessels import HorizontalFlatVessels
 from .vertical_torispherical_vessels import VerticalToriSphericalVessels
+from .vessels import Vessels, cached_geometry, memoize_level
 from .constants import FD_TORI, FK_TORI
-import scipy.integrate as integrate
+from .head_curves import HEAD_CURVES
 
 
 class HorizontalToriSphericalVessels(HorizontalFlatVessels, VerticalToriSphericalVessels):
@@ -12,34 +13,31 @@ class HorizontalToriSphericalVessels(HorizontalFlatVessels, VerticalToriSpherica
         self._fd: float = fd
         self._fk: float = fk
 
+    # the head/shell/head zones of VerticalFlatVessels.level_for_volume do not apply lying down
+    level_for_volume = Vessels.level_for_volume
+
+    @memoize_level
     def head_liquid_volume(self, value: float) -> float:
         return 2 * self.horizontal_fd_head_volume(value)
 
+    @cached_geometry
+    def head_surface_area(self) -> float:
+        # a full head wets its whole surface, which the vertical closed form gives without integrals
+        return 2 * self.vertical_bottom_fd_head_wetted_area(self.a2 * self.diameter)
+
+    @memoize_level
     def head_wetted_area(self, value: float) -> float:
         return 2 * self.horizontal_fd_head_wetted_area(value)
 
     def horizontal_fd_head_volume(self, value: float) -> float:
-        if value <= 0:
-            return 0.0
-        else:
-            a = min(value, self.diameter) / self.diameter
-            try:
-                head_volume = integrate.quad(self.horizontal_fd_head_surface_area, 0, a)[0]
-            except Exception:
-                head_volume = 0.0
-            return head_volume * self.diameter / 2
-
-    def horizontal_fd_head_surface_area(self, x) -> float:
-        return 2 * (self.horizontal_area_2(x) + self.horizontal_area_1(x))
+        curve = HEAD_CURVES.get(self.head_type, self.fd, self.fk, "horizontal", "volume")
+        return self.diameter ** 3 * curve(value / self.diameter)
+
+    def head_surface_area_at_level(self, value: float) -> float:
+        # slope of the tabulated head volume, so the total is exactly dV/dh of liquid_volume
+        curve = HEAD_CURVES.get(self.head_type, self.fd, self.fk, "horizontal", "volume")
+        return 2 * self.diameter ** 2 * curve.derivative(value / self.diameter)
 
     def horizontal_fd_head_wetted_area(self, value: float) -> float:
-        if value <= 0:
-            return 0.0
-        else:
-            delta = min(value, self.diameter) / self.diameter
-            # dimensionless height
-            # knuckle of the left head
-            s2 = self.horizontal_surface_area_2(delta)
-            # dish of the left head
-            s1 = self.horizontal_surface_area_1(delta)
-            return s1 + s2
+        curve = HEAD_CURVES.get(self.head_type, self.fd, self.fk, "horizontal", "wetted_area")
+        return self.diameter ** 2 * curve(value / self.diameter)
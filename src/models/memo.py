@@ -0,0 +1,70 @@
+"""Opt-in LRU memo for the level methods of a vessel.
+
+``Vessels.enable_memo`` attaches a :class:`LevelMemo` to a vessel. Scalar
+calls of the methods in ``MEMO_METHODS`` are then stored under
+``(method, vessel.spec, level)``; array calls are not memoized.
+Because the geometry is part of the key one memo can be shared by several
+vessels, and the entries of a geometry are dropped when one of its setters
+changes it.
+"""
+from collections import OrderedDict, namedtuple
+
+MEMO_METHODS = frozenset({
+    "liquid_volume", "wetted_area",
+    "head_liquid_volume", "shell_liquid_volume", "head_wetted_area", "shell_wetted_area",
+    "bottom_head_liquid_volume", "top_head_liquid_volume", "bottom_head_wetted_area", "top_head_wetted_area",
+})
+
+MemoInfo = namedtuple("MemoInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LevelMemo:
+    """Bounded least-recently-used store of level method results.
+
+    Parameters
+        maxsize : int
+            number of results kept, the least recently used is dropped first, default 256
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize <= 0:
+            raise ValueError("Memo size must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the stored result for ``key`` or None, counting a hit or a miss."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, spec) -> None:
+        """Drop every result computed for the geometry ``spec``."""
+        for key in [key for key in self._entries if key[1] == spec]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all results and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> MemoInfo:
+        """Hit and miss counts with the current and maximum size."""
+        return MemoInfo(self.hits, self.misses, self.maxsize, len(self._entries))
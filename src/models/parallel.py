@@ -0,0 +1,72 @@
+"""Process pool backend for large tables and fleets.
+
+Work is cut into contiguous chunks, each chunk is evaluated in a worker
+process by the same vectorized code as the serial path, and the results are
+joined back in input order, so the output does not depend on the number of
+workers. Vessels are sent to the workers by pickling.
+"""
+import os
+
+import numpy as np
+
+# chunks per worker, a few more than one keeps the workers busy when chunks differ in cost
+CHUNKS_PER_WORKER = 4
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Number of processes for ``workers``: None or 1 is serial, 0 or less means all cores."""
+    if workers is None:
+        return 1
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def chunk_bounds(n: int, workers: int, chunk_size: int | None = None) -> list[tuple[int, int]]:
+    """Split ``range(n)`` into contiguous ``(start, stop)`` chunks, in order."""
+    if chunk_size is None:
+        chunk_size = -(-n // (workers * CHUNKS_PER_WORKER))
+    chunk_size = max(chunk_size, 1)
+    return [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+
+def parallel_map(func, items, workers: int | None = None) -> list:
+    """``[func(item) for item in items]`` on a process pool, results in input order."""
+    items = list(items)
+    workers = min(resolve_workers(workers), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    # importing the pool costs more than the rest of the package, load it only when it is used
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _evaluate_levels(task):
+    vessel, method, levels = task
+    return np.asarray(getattr(vessel, method)(levels), dtype=float)
+
+
+def map_levels(vessel, method: str, levels, workers: int | None = None, chunk_size: int | None = None) -> np.ndarray:
+    """Evaluate the level method ``method`` of ``vessel`` over a 1-d array of levels on a process pool."""
+    levels = np.asarray(levels, dtype=float)
+    workers = resolve_workers(workers)
+    if workers <= 1:
+        return np.asarray(getattr(vessel, method)(levels), dtype=float)
+    tasks = [(vessel, method, levels[start:stop]) for start, stop in chunk_bounds(levels.size, workers, chunk_size)]
+    return np.concatenate(parallel_map(_evaluate_levels, tasks, workers))
+
+
+def _evaluate_fleet_chunk(kwargs):
+    from .fleet import evaluate_fleet
+    return evaluate_fleet(**kwargs)
+
+
+def map_fleet(columns: dict, n: int, workers: int | None = None, chunk_size: int | None = None) -> dict[str, np.ndarray]:
+    """Run ``evaluate_fleet`` over row chunks of ``columns`` on a process pool and join the results."""
+    workers = resolve_workers(workers)
+    tasks = []
+    for start, stop in chunk_bounds(n, workers, chunk_size):
+        tasks.append({name: value if np.ndim(value) == 0 else value[start:stop] for name, value in columns.items()})
+    results = parallel_map(_evaluate_fleet_chunk, tasks, workers)
+    return {name: np.concatenate([result[name] for result in results]) for name in results[0]}
@@ -0,0 +1,163 @@
+"""Call counts and timings of the vessel methods, per vessel class.
+
+``Profiler`` is a context manager. On entry it wraps, on every ``Vessels``
+subclass, the public methods and the ``cached_geometry`` getters; on exit
+the original functions are put back. Nothing is wrapped outside of a
+``with`` block, so there is no cost when profiling is off::
+
+    with Profiler(trace=True) as profiler:
+        vessel.create_table(50)
+    print(profiler.summary())
+    profiler.save_chrome_trace("vessels-trace.json")
+
+Work done in the worker processes of ``workers=`` calls is not seen, and
+only one profiler can be active at a time.
+"""
+import json
+import os
+import threading
+from collections import namedtuple
+from time import perf_counter
+from types import FunctionType
+
+from .fleet import FLEET_TYPES
+from .vessels import Vessels, cached_geometry
+
+ProfileStat = namedtuple("ProfileStat", ["vessel_type", "method", "category", "calls", "total", "own"])
+
+_active = None
+
+
+def _category(name: str) -> str:
+    if name == "draw":
+        return "drawing"
+    return "level"
+
+
+def _vessel_classes() -> list[type]:
+    # the package imports class modules lazily, FLEET_TYPES makes sure every built-in class is loaded
+    classes, pending = [], [Vessels, *FLEET_TYPES.values()]
+    while pending:
+        cls = pending.pop()
+        if cls not in classes:
+            classes.append(cls)
+            pending.extend(cls.__subclasses__())
+    return classes
+
+
+class Profiler:
+    """Count and time vessel method calls inside a ``with`` block.
+
+    Times are inclusive (``total``) and without the profiled calls made from
+    within (``own``), in seconds. A method overriding and calling the one of
+    its parent class is counted once.
+
+    The methods are patched on the classes, process-wide: calls from every
+    thread are counted while the block is open, not only those of the thread
+    that entered it. Each thread keeps its own call stack, so the ``own``
+    times of concurrent calls do not mix.
+
+    Parameters
+        trace : bool
+            also record every call as a Chrome trace event, default False
+        max_events : int
+            trace events kept, later calls are only counted, default 1000000
+    """
+
+    def __init__(self, trace: bool = False, max_events: int = 1_000_000) -> None:
+        self.trace = trace
+        self.max_events = max_events
+        self.events = []
+        self._stats = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._patches = []
+        self._start = 0.0
+
+    def __enter__(self) -> "Profiler":
+        global _active
+        if _active is not None:
+            raise RuntimeError("A profiler is already active")
+        _active = self
+        self._start = perf_counter()
+        for cls in _vessel_classes():
+            for name, attribute in list(vars(cls).items()):
+                if name.startswith("_"):
+                    continue
+                if isinstance(attribute, cached_geometry):
+                    self._patches.append((attribute, "method", attribute.method))
+                    attribute.method = self._wrap(name, "geometry", attribute.method)
+                elif isinstance(attribute, FunctionType):
+                    self._patches.append((cls, name, attribute))
+                    setattr(cls, name, self._wrap(name, _category(name), attribute))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _active
+        for target, name, original in reversed(self._patches):
+            setattr(target, name, original)
+        self._patches.clear()
+        _active = None
+
+    def _wrap(self, name: str, category: str, func):
+        stats, local, lock, events = self._stats, self._local, self._lock, self.events
+
+        def profiled(vessel, *args, **kwargs):
+            key = (type(vessel).__name__, name)
+            stack = getattr(local, "stack", None)
+            if stack is None:
+                stack = local.stack = []
+            if stack and stack[-1][0] == key:
+                # an override calling the parent implementation
+                return func(vessel, *args, **kwargs)
+            frame = [key, 0.0]
+            stack.append(frame)
+            start = perf_counter()
+            try:
+                return func(vessel, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+                with lock:
+                    stat = stats.get(key)
+                    if stat is None:
+                        stat = stats[key] = [category, 0, 0.0, 0.0]
+                    stat[1] += 1
+                    stat[2] += elapsed
+                    stat[3] += elapsed - frame[1]
+                    if self.trace and len(events) < self.max_events:
+                        events.append((f"{key[0]}.{name}", category, start - self._start, elapsed,
+                                       threading.get_ident()))
+        profiled.__wrapped__ = func
+        return profiled
+
+    def stats(self) -> list[ProfileStat]:
+        """Statistics per vessel class and method, the slowest first."""
+        stats = [ProfileStat(vessel_type, method, category, calls, total, own)
+                 for (vessel_type, method), (category, calls, total, own) in self._stats.items()]
+        return sorted(stats, key=lambda stat: stat.total, reverse=True)
+
+    def summary(self, limit: int | None = None) -> str:
+        """Table of the statistics, ``limit`` rows at most."""
+        lines = [f"{'vessel type':<32} {'method':<40} {'category':<10} {'calls':>9} "
+                 f"{'total ms':>10} {'own ms':>10} {'us/call':>9}"]
+        for stat in self.stats()[:limit]:
+            lines.append(f"{stat.vessel_type:<32} {stat.method:<40} {stat.category:<10} {stat.calls:>9} "
+                         f"{stat.total * 1e3:>10.3f} {stat.own * 1e3:>10.3f} {stat.total / stat.calls * 1e6:>9.1f}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """Recorded calls in the Chrome trace event format (``chrome://tracing``, Perfetto)."""
+        pid = os.getpid()
+        return {
+            "traceEvents": [{"name": name, "cat": category, "ph": "X", "ts": start * 1e6, "dur": duration * 1e6,
+                             "pid": pid, "tid": tid}
+                            for name, category, start, duration, tid in self.events],
+            "displayTimeUnit": "ms",
+        }
+
+    def save_chrome_trace(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.chrome_trace(), handle)
@@ -0,0 +1,449 @@
+"""HTTP JSON service for the vessel models.
+
+A single-process asyncio server with only the standard library and NumPy::
+
+    cd src && python -m models.server --port 8765
+
+Endpoints
+    GET  /health     ``{"status": "ok"}``
+    GET  /types      the vessel type keys, see ``FLEET_TYPES``
+    GET  /stats      request, batch and cache counters
+    POST /evaluate   geometry summary, and ``liquid_volume``/``wetted_area`` at ``levels``
+    POST /table      ``create_table(n)``, or ``create_adaptive_table(tolerance)`` with ``"adaptive": true``
+    POST /draw       SVG sketch of the vessel at ``high_level``, ``low_level`` and ``liquid_level``
+
+Every POST body is a JSON object with the geometry: ``type`` (a
+``FLEET_TYPES`` key), ``diameter`` and, where the type needs them,
+``length``, ``head_distance``, ``fd`` and ``fk``.
+
+Level queries of concurrent ``/evaluate`` requests are not evaluated one by
+one: they wait up to ``batch_window`` seconds (or until ``max_batch``
+requests are queued) and are then grouped by vessel class and head shape,
+and every group runs as one vectorized call on a vessel whose dimensions are
+arrays, like ``evaluate_fleet``. Vessels are kept in an LRU cache keyed by
+``VesselSpec``, so the geometry of a repeated tank is computed once.
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+from collections import OrderedDict
+from http import HTTPStatus
+
+import numpy as np
+
+from .drawing import _render
+from .fleet import FLEET_TYPES, fleet_vessel
+from .horizontal_conical_vessels import HorizontalConicalVessels
+from .spec import VesselSpec, vessel_class
+from .spherical_tanks import SphericalTanks
+from .svg import SvgAxes
+from .vertical_conical_vessels import VerticalConicalVessels
+
+DEFAULT_PORT = 8765
+DEFAULT_BATCH_WINDOW = 0.001
+DEFAULT_MAX_BATCH = 512
+DEFAULT_CACHE_SIZE = 4096
+MAX_BODY_SIZE = 1 << 20
+MAX_LEVELS = 10000
+MAX_TABLE_POINTS = 10000
+SUMMARY_FIELDS = ("total_height", "tangent_height", "head_volume", "shell_volume", "total_volume",
+                  "head_surface_area", "shell_surface_area", "total_surface_area")
+_CLASS_KEYS = {cls.__name__: key for key, cls in FLEET_TYPES.items()}
+
+
+def _number(value, name: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ValueError(f"'{name}' must be a finite number")
+    return float(value)
+
+
+def _finite(values) -> list:
+    """Floats for JSON, NaN and infinities as null."""
+    return [value if math.isfinite(value) else None for value in values]
+
+
+def request_spec(payload) -> VesselSpec:
+    """Canonical ``VesselSpec`` of the geometry fields of a request body.
+
+    Fields the class does not take are dropped and a missing ``fd`` or ``fk``
+    takes the class default, so every request for the same tank maps to the
+    same ``GeometryCache`` key.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object")
+    try:
+        cls = FLEET_TYPES[payload.get("type")]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown vessel type {payload.get('type')!r}") from None
+    required = ["diameter"] if cls is SphericalTanks else ["diameter", "length"]
+    if issubclass(cls, (VerticalConicalVessels, HorizontalConicalVessels)):
+        required.append("head_distance")
+    missing = [name for name in required if payload.get(name) is None]
+    if missing:
+        raise ValueError(f"Missing {', '.join(missing)}")
+    values = {name: _number(payload[name], name) for name in ("diameter", "length", "head_distance", "fd", "fk")
+              if payload.get(name) is not None}
+    if values["diameter"] <= 0:
+        raise ValueError("Diameter must be positive")
+    if cls is not SphericalTanks and values["length"] <= 0:
+        raise ValueError("Length must be positive")
+    if values.get("head_distance", 0.0) < 0:
+        raise ValueError("Head distance must be non-negative")
+    return VesselSpec(cls.__name__, **values)
+
+
+class GeometryCache:
+    """LRU cache of built vessels and their geometry summaries, keyed by ``VesselSpec``."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, spec: VesselSpec):
+        """``(vessel, summary)`` of ``spec``, building it on a miss; invalid dimensions raise ValueError."""
+        try:
+            entry = self._entries[spec]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._entries.move_to_end(spec)
+            return entry
+        self.misses += 1
+        vessel = spec.build()
+        summary = {name: float(getattr(vessel, name)) for name in SUMMARY_FIELDS}
+        entry = self._entries[spec] = (vessel, summary)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+
+def evaluate_levels(queries, cache: GeometryCache | None = None) -> list:
+    """Volume and wetted area arrays for each ``(spec, levels)`` query, in query order.
+
+    The queries are grouped by vessel class and head shape and every group is
+    evaluated by one vessel with array dimensions, one entry per level.
+    Groups of a single spec use the cached vessel instead.
+    """
+    groups = {}
+    for index, (spec, _) in enumerate(queries):
+        groups.setdefault((spec.vessel_type, spec.fd, spec.fk), []).append(index)
+    results = [None] * len(queries)
+    for (name, fd, fk), indices in groups.items():
+        levels = [queries[index][1] for index in indices]
+        sizes = [level.size for level in levels]
+        level_column = np.concatenate(levels)
+        specs = {queries[index][0] for index in indices}
+        if len(specs) == 1 and cache is not None:
+            vessel = cache.get(specs.pop())[0]
+        else:
+            dimensions = np.repeat([(queries[index][0].diameter, queries[index][0].length,
+                                     queries[index][0].head_distance) for index in indices], sizes, axis=0)
+            vessel = fleet_vessel(vessel_class(name), dimensions[:, 0], dimensions[:, 1], dimensions[:, 2], fd, fk)
+        volume = np.asarray(vessel.liquid_volume(level_column), dtype=float)
+        wetted_area = np.asarray(vessel.wetted_area(level_column), dtype=float)
+        bounds = np.cumsum(sizes)[:-1]
+        for index, group_volume, group_area in zip(indices, np.split(volume, bounds), np.split(wetted_area, bounds)):
+            results[index] = (group_volume, group_area)
+    return results
+
+
+class LevelBatcher:
+    """Collect the level queries of concurrent requests and evaluate them together."""
+
+    def __init__(self, cache: GeometryCache, window: float = DEFAULT_BATCH_WINDOW,
+                 max_batch: int = DEFAULT_MAX_BATCH) -> None:
+        if window < 0:
+            raise ValueError("Batch window must be non-negative")
+        if max_batch < 1:
+            raise ValueError("Batch size must be positive")
+        self.cache = cache
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.queries = 0
+        self._pending = []
+        self._timer = None
+
+    async def submit(self, spec: VesselSpec, levels: np.ndarray):
+        """Wait for the batch holding this query, return its ``(volume, wetted_area)`` arrays."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((spec, levels, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Evaluate every pending query now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        self.batches += 1
+        self.queries += len(pending)
+        try:
+            results = evaluate_levels([(spec, levels) for spec, levels, _ in pending], self.cache)
+        except Exception:
+            # one bad group must not fail the whole batch, so retry the queries one by one
+            results = []
+            for spec, levels, _ in pending:
+                try:
+                    results.append(evaluate_levels([(spec, levels)], self.cache)[0])
+                except Exception as error:
+                    results.append(error)
+        for (_, _, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class VesselServer:
+    """Asyncio HTTP/1.1 server of the endpoints in the module docstring.
+
+    Parameters
+        host : str
+            interface to listen on, default "127.0.0.1"
+        port : int
+            port to listen on, 0 picks a free one, default 8765
+        batch_window : float
+            seconds a level query waits for others to join its batch, default 0.001
+        max_batch : int
+            evaluate a batch as soon as it holds this many queries, default 512
+        cache_size : int
+            vessels kept in the geometry cache, default 4096
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, batch_window: float = DEFAULT_BATCH_WINDOW,
+                 max_batch: int = DEFAULT_MAX_BATCH, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.host = host
+        self.port = port
+        self.cache = GeometryCache(cache_size)
+        self.batcher = LevelBatcher(self.cache, batch_window, max_batch)
+        self.requests = 0
+        self.errors = 0
+        self._server = None
+        self._routes = {
+            ("GET", "/health"): self._health,
+            ("GET", "/types"): self._types,
+            ("GET", "/stats"): self._stats,
+            ("POST", "/evaluate"): self._evaluate,
+            ("POST", "/table"): self._table,
+            ("POST", "/draw"): self._draw,
+        }
+
+    async def start(self) -> None:
+        """Start listening; ``port`` is updated to the bound port."""
+        self._server = await asyncio.start_server(self._connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_response(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                           {"error": "Request header too large"}, keep_alive=False))
+                    break
+                request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ")
+                except ValueError:
+                    writer.write(_response(HTTPStatus.BAD_REQUEST, {"error": "Malformed request line"},
+                                           keep_alive=False))
+                    break
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                if "transfer-encoding" in headers:
+                    writer.write(_response(HTTPStatus.NOT_IMPLEMENTED, {"error": "Chunked bodies are not supported"},
+                                           keep_alive=False))
+                    break
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY_SIZE:
+                    writer.write(_response(HTTPStatus.REQUEST_ENTITY_TOO_LARGE if length > 0 else
+                                           HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length"},
+                                           keep_alive=False))
+                    break
+                try:
+                    body = await reader.readexactly(length) if length else b""
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                status, payload, content_type = await self._dispatch(method, target.partition("?")[0], body)
+                writer.write(_response(status, payload, content_type, keep_alive))
+                if not keep_alive:
+                    break
+                if writer.transport.get_write_buffer_size() > 1 << 16:
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes):
+        self.requests += 1
+        if method == "OPTIONS":
+            return HTTPStatus.NO_CONTENT, b"", None
+        handler = self._routes.get((method, path))
+        if handler is None:
+            self.errors += 1
+            if any(route_path == path for _, route_path in self._routes):
+                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"{method} is not allowed on {path}"}, None
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown path {path}"}, None
+        try:
+            payload = json.loads(body) if method == "POST" else None
+        except ValueError:
+            self.errors += 1
+            return HTTPStatus.BAD_REQUEST, {"error": "Request body is not valid JSON"}, None
+        try:
+            result = await handler(payload)
+        except (ValueError, TypeError) as error:
+            self.errors += 1
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}, None
+        except Exception as error:
+            self.errors += 1
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(error).__name__}: {error}"}, None
+        if isinstance(result, str):
+            return HTTPStatus.OK, result.encode("utf-8"), "image/svg+xml"
+        return HTTPStatus.OK, result, None
+
+    async def _health(self, payload):
+        return {"status": "ok"}
+
+    async def _types(self, payload):
+        return {"types": list(FLEET_TYPES)}
+
+    async def _stats(self, payload):
+        batcher = self.batcher
+        return {"requests": self.requests, "errors": self.errors, "batches": batcher.batches,
+                "batched_queries": batcher.queries,
+                "mean_batch_size": batcher.queries / batcher.batches if batcher.batches else 0.0,
+                "cache_size": len(self.cache), "cache_hits": self.cache.hits, "cache_misses": self.cache.misses}
+
+    async def _evaluate(self, payload):
+        spec = request_spec(payload)
+        _, summary = self.cache.get(spec)
+        result = {"type": _CLASS_KEYS[spec.vessel_type], **summary}
+        levels = payload.get("levels")
+        if levels is None:
+            return result
+        if not isinstance(levels, list):
+            levels = [levels]
+        if len(levels) > MAX_LEVELS:
+            raise ValueError(f"At most {MAX_LEVELS} levels per request")
+        levels = np.array([_number(level, "levels") for level in levels], dtype=float)
+        if np.any(levels < 0):
+            raise ValueError("Levels must be non-negative")
+        if levels.size:
+            volume, wetted_area = await self.batcher.submit(spec, levels)
+        else:
+            volume = wetted_area = levels
+        result.update(levels=levels.tolist(), liquid_volume=_finite(volume.tolist()),
+                      wetted_area=_finite(wetted_area.tolist()))
+        return result
+
+    async def _table(self, payload):
+        vessel, _ = self.cache.get(request_spec(payload))
+        if payload.get("adaptive"):
+            tolerance = _number(payload.get("tolerance", 1e-4), "tolerance")
+            height, volume, wetted_area = vessel.create_adaptive_table(tolerance, MAX_TABLE_POINTS)
+        else:
+            n = payload.get("n", 10)
+            if isinstance(n, bool) or not isinstance(n, int) or not 1 <= n <= MAX_TABLE_POINTS:
+                raise ValueError(f"'n' must be an integer from 1 to {MAX_TABLE_POINTS}")
+            height, volume, wetted_area = vessel.create_table(n)
+        return {"height": height, "volume": _finite(volume), "wetted_area": _finite(wetted_area)}
+
+    async def _draw(self, payload):
+        vessel, _ = self.cache.get(request_spec(payload))
+        # the cached vessel is shared, so every request sets all of its levels
+        vessel.high_liquid_level = _number(payload.get("high_level", 0.0), "high_level")
+        vessel.low_liquid_level = _number(payload.get("low_level", 0.0), "low_level")
+        vessel.liquid_level = _number(payload.get("liquid_level", 0.0), "liquid_level")
+        ax = SvgAxes()
+        _render(ax, vessel)
+        return ax.to_svg()
+
+
+def _response(status: HTTPStatus, payload, content_type: str | None = None, keep_alive: bool = True) -> bytes:
+    if isinstance(payload, bytes):
+        body = payload
+    else:
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        content_type = "application/json"
+    headers = [f"HTTP/1.1 {status.value} {status.phrase}",
+               f"Content-Length: {len(body)}",
+               "Access-Control-Allow-Origin: *",
+               "Access-Control-Allow-Headers: Content-Type",
+               "Access-Control-Allow-Methods: GET, POST, OPTIONS"]
+    if content_type is not None:
+        headers.append(f"Content-Type: {content_type}")
+    if not keep_alive:
+        headers.append("Connection: close")
+    return ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the vessel models as an HTTP JSON service.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port, 0 for any free port (default: 8765).")
+    parser.add_argument("--batch-window", type=float, default=DEFAULT_BATCH_WINDOW * 1e3,
+                        help="Milliseconds a level query waits for others to batch with (default: 1).")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="Queries per batch (default: 512).")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE,
+                        help="Vessels kept in the geometry cache (default: 4096).")
+    args = parser.parse_args(argv)
+    server = VesselServer(args.host, args.port, args.batch_window / 1e3, args.max_batch, args.cache_size)
+
+    async def serve():
+        await server.start()
+        print(f"listening on http://{server.host}:{server.port}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
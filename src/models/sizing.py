@@ -0,0 +1,255 @@
+"""Sizing of vessels for a required working volume.
+
+``size_vessel`` searches the diameters and lengths of one vessel type for a
+required working volume (or a surge time at an outlet flow) within bounds
+of the slenderness L/D. The liquid levels follow ``LevelRules``: the low
+liquid level sits a fraction of the diameter (or a minimum height) above
+the bottom and the high liquid level the same way below the top, measured
+from the bottom tangent line in vertical vessels, as ``working_volume``
+does, and from the bottom in horizontal vessels and spheres.
+
+Every candidate slenderness is solved at once: one vessel with array
+dimensions evaluates a grid of diameters per slenderness to bracket the
+required volume, and a vectorized Illinois iteration refines the diameter
+of every bracket. The weight uses the ASME VIII-1 shell thickness under
+internal pressure for shell and heads alike, and the non-dominated designs
+of the chosen objectives are returned, by default the shortest vessels for
+their weight::
+
+    cd src && python -m models.sizing vertical-elliptical-vessel --working-volume 12 --pressure 10e5
+"""
+import argparse
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+from .fleet import FLEET_TYPES, fleet_vessel
+from .horizontal_conical_vessels import HorizontalConicalVessels
+from .horizontal_flat_vessels import HorizontalFlatVessels
+from .spherical_tanks import SphericalTanks
+from .vertical_conical_vessels import VerticalConicalVessels
+from .vessels import Vessels
+
+SIZING_COLUMNS = ("diameter", "length", "slenderness", "low_liquid_level", "high_liquid_level", "working_volume",
+                  "total_volume", "total_height", "total_surface_area", "wall_thickness", "weight")
+STEEL_DENSITY = 7850.0
+# SA-516 grade 70 at ambient temperature, Pa
+ALLOWABLE_STRESS = 138e6
+MAX_ITERATIONS = 60
+_SCAN = np.geomspace(1 / 16, 16, 41)
+
+LevelRules = namedtuple("LevelRules", ("low_fraction", "low_minimum", "high_fraction", "high_minimum"),
+                        defaults=(0.15, 0.15, 0.2, 0.3))
+LevelRules.__doc__ = """Placement of the liquid levels of a sized vessel.
+
+The low liquid level is ``max(low_fraction * D, low_minimum)`` m above the
+bottom and the high liquid level ``max(high_fraction * D, high_minimum)`` m
+below the top, of the shell in vertical vessels and of the diameter in
+horizontal vessels and spheres.
+"""
+
+
+def _vessel_class(vessel_type) -> type[Vessels]:
+    if isinstance(vessel_type, type) and issubclass(vessel_type, Vessels):
+        return vessel_type
+    try:
+        return FLEET_TYPES[vessel_type]
+    except KeyError:
+        raise ValueError(f"Unknown vessel type: {vessel_type}") from None
+
+
+class _Candidates:
+    """Vessels of one type at array diameters and slendernesses, with the rule levels applied."""
+
+    def __init__(self, vessel_class, rules: LevelRules, head_ratio: float, fd, fk) -> None:
+        self.vessel_class = vessel_class
+        self.rules = rules
+        self.head_ratio = head_ratio
+        self.fd, self.fk = fd, fk
+        self.vertical = not issubclass(vessel_class, (HorizontalFlatVessels, SphericalTanks))
+
+    def build(self, diameter: np.ndarray, slenderness: np.ndarray) -> Vessels:
+        length = slenderness * diameter
+        head_distance = self.head_ratio * diameter if issubclass(
+            self.vessel_class, (VerticalConicalVessels, HorizontalConicalVessels)) else None
+        vessel = fleet_vessel(self.vessel_class, diameter, length, head_distance, self.fd, self.fk)
+        span = length if self.vertical else diameter
+        low = np.maximum(self.rules.low_fraction * diameter, self.rules.low_minimum)
+        high = span - np.maximum(self.rules.high_fraction * diameter, self.rules.high_minimum)
+        # rule levels that cross leave no working volume, negative levels are kept out of the volume methods
+        vessel._low_liquid_level = np.minimum(low, span)
+        vessel._high_liquid_level = np.maximum(high, vessel._low_liquid_level)
+        return vessel
+
+    def working_volume(self, diameter: np.ndarray, slenderness: np.ndarray) -> np.ndarray:
+        vessel = self.build(diameter, slenderness)
+        return np.broadcast_to(vessel.working_volume, np.shape(diameter)).copy()
+
+
+def _solve_diameters(candidates: _Candidates, slenderness: np.ndarray, target: float, rtol: float) -> np.ndarray:
+    """Diameter with ``target`` working volume at each slenderness, NaN where none is found."""
+    # the working volume grows about as D ** 3 at a fixed slenderness
+    guess = (target / (np.pi / 4 * np.maximum(slenderness, 1.0))) ** (1 / 3)
+    grid = guess[:, None] * _SCAN[None, :]
+    rows = np.broadcast_to(slenderness[:, None], grid.shape)
+    excess = candidates.working_volume(grid.ravel(), rows.ravel()).reshape(grid.shape) - target
+    above = excess >= 0
+    found = above.any(axis=1) & ~above[:, 0]
+    first = np.argmax(above, axis=1)
+    index = np.arange(len(slenderness))
+    # rows without a bracket read a wrapped index and are dropped at the end
+    low, high = grid[index, first - 1], grid[index, first]
+    f_low, f_high = excess[index, first - 1], excess[index, first]
+    diameter = high.copy()
+    # Illinois variant of regula falsi, every row keeps a bracket
+    side = np.zeros(len(slenderness), dtype=int)
+    for _ in range(MAX_ITERATIONS if found.any() else 0):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            diameter = np.where(f_high != f_low, high - f_high * (high - low) / (f_high - f_low), (low + high) / 2)
+        value = candidates.working_volume(diameter, slenderness) - target
+        right = value > 0
+        high, f_high = np.where(right, diameter, high), np.where(right, value, f_high)
+        low, f_low = np.where(right, low, diameter), np.where(right, f_low, value)
+        f_low = np.where(right & (side == 1), f_low / 2, f_low)
+        f_high = np.where(~right & (side == -1), f_high / 2, f_high)
+        side = np.where(right, 1, -1)
+        if np.all((np.abs(value) <= rtol * target) | ~found):
+            break
+    return np.where(found, diameter, np.nan)
+
+
+def pareto_mask(columns: dict, objectives=("length", "weight")) -> np.ndarray:
+    """Rows of ``columns`` that no other row beats in every one of ``objectives``, all minimized."""
+    values = np.column_stack([np.asarray(columns[name], dtype=float) for name in objectives])
+    no_worse = np.all(values[:, None, :] <= values[None, :, :], axis=2)
+    better = np.any(values[:, None, :] < values[None, :, :], axis=2)
+    # row j is dominated when some row i is no worse everywhere and better somewhere
+    return ~np.any(no_worse & better, axis=0)
+
+
+def size_vessel(vessel_type, working_volume: float | None = None, surge_time: float | None = None,
+                flow: float | None = None, slenderness=(2.5, 6.0), rules: LevelRules = LevelRules(),
+                n: int = 64, design_pressure: float = 0.0, allowable_stress: float = ALLOWABLE_STRESS,
+                joint_efficiency: float = 1.0, corrosion_allowance: float = 0.003, min_thickness: float = 0.006,
+                material_density: float = STEEL_DENSITY, head_ratio: float = 0.25, fd: float | None = None,
+                fk: float | None = None, objectives=("length", "weight"), pareto: bool = True,
+                rtol: float = 1e-9) -> dict[str, np.ndarray]:
+    """Designs of ``vessel_type`` holding the required working volume.
+
+    Parameters
+        vessel_type : str or Vessels subclass
+            a key of ``FLEET_TYPES`` or a vessel class
+        working_volume : float
+            required volume between the low and high liquid levels (m3)
+        surge_time, flow : float
+            alternatively, the surge time (s) at the outlet ``flow`` (m3/s)
+        slenderness : (float, float)
+            bounds of the tangent length over the diameter, default 2.5 to 6;
+            ignored for spheres
+        rules : LevelRules
+            placement of the liquid levels
+        n : int
+            number of slendernesses sampled between the bounds, default 64
+        design_pressure : float
+            internal gauge pressure (Pa); 0 uses ``min_thickness``
+        allowable_stress, joint_efficiency, corrosion_allowance, min_thickness : float
+            shell thickness ``P R / (S E - 0.6 P) + c``, at least ``min_thickness`` (m)
+        material_density : float
+            wall density (kg/m3), default carbon steel
+        head_ratio : float
+            head distance over diameter of conical heads, default 0.25
+        fd, fk : float
+            dish and knuckle radius fractions of F&D heads, default the class's
+        objectives : sequence of str
+            columns minimized by the Pareto set, default length and weight
+        pareto : bool
+            return only the non-dominated designs, default True
+        rtol : float
+            relative tolerance of the working volume, default 1e-9
+
+    Returns
+        dict of str to ndarray
+            one column per name in ``SIZING_COLUMNS``, rows by increasing diameter
+    """
+    if working_volume is None:
+        if surge_time is None or flow is None:
+            raise ValueError("Give a working volume, or a surge time and a flow")
+        if surge_time <= 0 or flow <= 0:
+            raise ValueError("Surge time and flow must be positive")
+        working_volume = surge_time * flow
+    elif surge_time is not None or flow is not None:
+        raise ValueError("Give a working volume, or a surge time and a flow, not both")
+    if working_volume <= 0:
+        raise ValueError("Working volume must be positive")
+    low_slenderness, high_slenderness = (float(bound) for bound in slenderness)
+    if not 0 < low_slenderness <= high_slenderness:
+        raise ValueError("Slenderness bounds must be positive and increasing")
+    if n < 1:
+        raise ValueError("At least one candidate is needed")
+    if design_pressure < 0 or design_pressure >= allowable_stress * joint_efficiency / 0.6:
+        raise ValueError("Design pressure must be non-negative and below the allowable stress limit")
+    unknown = set(objectives) - set(SIZING_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown objectives: {', '.join(sorted(unknown))}")
+
+    vessel_class = _vessel_class(vessel_type)
+    candidates = _Candidates(vessel_class, LevelRules(*rules), head_ratio, fd, fk)
+    if vessel_class is SphericalTanks:
+        ratios = np.zeros(1)
+    else:
+        ratios = np.unique(np.linspace(low_slenderness, high_slenderness, n))
+    diameter = _solve_diameters(candidates, ratios, working_volume, rtol)
+    feasible = ~np.isnan(diameter)
+    if not feasible.any():
+        raise ValueError("No design within the slenderness bounds meets the level rules")
+    diameter, ratios = diameter[feasible], ratios[feasible]
+
+    vessel = candidates.build(diameter, ratios)
+    size = diameter.shape[0]
+    thickness = design_pressure * diameter / 2 / (allowable_stress * joint_efficiency - 0.6 * design_pressure)
+    thickness = np.maximum(thickness + corrosion_allowance, min_thickness)
+    total_surface_area = np.broadcast_to(vessel.total_surface_area, (size,))
+    columns = {
+        "diameter": diameter,
+        "length": np.zeros(size) if vessel_class is SphericalTanks else ratios * diameter,
+        "slenderness": ratios,
+        "low_liquid_level": np.broadcast_to(vessel.low_liquid_level, (size,)),
+        "high_liquid_level": np.broadcast_to(vessel.high_liquid_level, (size,)),
+        "working_volume": np.broadcast_to(vessel.working_volume, (size,)),
+        "total_volume": np.broadcast_to(vessel.total_volume, (size,)),
+        "total_height": np.broadcast_to(vessel.total_height, (size,)),
+        "total_surface_area": total_surface_area,
+        "wall_thickness": thickness,
+        "weight": total_surface_area * thickness * material_density,
+    }
+    keep = pareto_mask(columns, objectives) if pareto else np.ones(size, dtype=bool)
+    order = np.argsort(diameter[keep], kind="stable")
+    return {name: np.array(column, dtype=float)[keep][order] for name, column in columns.items()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Size a vessel for a working volume and print the Pareto set.")
+    parser.add_argument("type", choices=list(FLEET_TYPES), help="Vessel type.")
+    parser.add_argument("--working-volume", type=float, help="Working volume (m3).")
+    parser.add_argument("--surge-time", type=float, help="Surge time (s), with --flow.")
+    parser.add_argument("--flow", type=float, help="Outlet flow (m3/s), with --surge-time.")
+    parser.add_argument("--slenderness", type=float, nargs=2, default=(2.5, 6.0), metavar=("MIN", "MAX"),
+                        help="Bounds of L/D (default: 2.5 6).")
+    parser.add_argument("--pressure", type=float, default=0.0, help="Design gauge pressure (Pa).")
+    parser.add_argument("--n", type=int, default=64, help="Slendernesses sampled (default: 64).")
+    parser.add_argument("--all", action="store_true", help="Print every candidate, not only the Pareto set.")
+    args = parser.parse_args(argv)
+    try:
+        columns = size_vessel(args.type, args.working_volume, args.surge_time, args.flow, args.slenderness,
+                              n=args.n, design_pressure=args.pressure, pareto=not args.all)
+    except ValueError as error:
+        parser.error(str(error))
+    print(",".join(SIZING_COLUMNS))
+    for row in zip(*(columns[name] for name in SIZING_COLUMNS)):
+        print(",".join(f"{value:.6g}" for value in row))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""Immutable, hashable description of a vessel geometry.
+
+A ``VesselSpec`` holds the class name and the dimensions that define a
+vessel, nothing else: no levels, flags or caches. It uses ``__slots__``, so it
+is a fraction of the size of a vessel object, it compares and hashes by
+value, so identical geometries deduplicate in a ``set`` or ``dict`` and can
+key caches, and it cannot be modified, so it is safe to share between
+threads. Every vessel exposes its spec as ``vessel.spec`` and
+``spec.build()`` creates a new vessel from it.
+
+Specs are canonical: only the dimensions the class constructor takes are
+kept, the others are stored as ``0.0`` (or None for ``fd`` and ``fk``), and
+a missing ``fd`` or ``fk`` takes the constructor default. A spec written by
+hand therefore equals the spec of the vessel it builds, and derived
+dimensions such as the depth of an elliptical head are not part of it.
+"""
+import hashlib
+import inspect
+
+_CLASSES = {}
+_INPUTS = {}
+# constructor parameters of the optional spec fields
+_PARAMETERS = {"length": "input_length", "head_distance": "head_distance", "fd": "fd", "fk": "fk"}
+
+
+def vessel_class(name: str) -> type:
+    """Return the ``Vessels`` subclass called ``name``."""
+    try:
+        return _CLASSES[name]
+    except KeyError:
+        pass
+    # the package imports class modules lazily, FLEET_TYPES loads every built-in class
+    from .fleet import FLEET_TYPES
+    from .vessels import Vessels
+    pending = [Vessels, *FLEET_TYPES.values()]
+    while pending:
+        cls = pending.pop()
+        _CLASSES.setdefault(cls.__name__, cls)
+        pending.extend(cls.__subclasses__())
+    try:
+        return _CLASSES[name]
+    except KeyError:
+        raise ValueError(f"Unknown vessel class '{name}'") from None
+
+
+def _inputs(vessel_type: str) -> dict | None:
+    """Constructor defaults of the optional fields ``vessel_type`` takes, None for an unknown class."""
+    inputs = _INPUTS.get(vessel_type)
+    if inputs is None:
+        try:
+            parameters = inspect.signature(vessel_class(vessel_type)).parameters
+        except ValueError:
+            return None
+        inputs = {field: parameters[name].default for field, name in _PARAMETERS.items() if name in parameters}
+        _INPUTS[vessel_type] = inputs
+    return inputs
+
+
+def _optional_float(value):
+    return None if value is None else float(value)
+
+
+class VesselSpec:
+    """Frozen geometry of one vessel.
+
+    Parameters
+        vessel_type : str
+            name of the vessel class, e.g. ``"VerticalFlatVessels"``
+        diameter : float
+            diameter (m)
+        length : float
+            tangent-to-tangent length (m), 0 for spherical tanks
+        head_distance : float
+            head depth (m), only an input for conical heads and 0 for the others
+        fd, fk : float
+            dish and knuckle radius ratios of F&D and elliptical heads, the
+            class default when None, and None for other heads
+    """
+
+    __slots__ = ("vessel_type", "diameter", "length", "head_distance", "fd", "fk", "_hash")
+
+    def __init__(self, vessel_type: str, diameter: float, length: float = 0.0, head_distance: float = 0.0,
+                 fd: float | None = None, fk: float | None = None) -> None:
+        vessel_type = str(vessel_type)
+        fields = {"length": length, "head_distance": head_distance, "fd": fd, "fk": fk}
+        inputs = _inputs(vessel_type)
+        if inputs is not None:
+            for name, value in fields.items():
+                if name not in inputs:
+                    fields[name] = None if name in ("fd", "fk") else 0.0
+                elif value is None:
+                    fields[name] = inputs[name]
+        values = (vessel_type, float(diameter), float(fields["length"]), float(fields["head_distance"]),
+                  _optional_float(fields["fd"]), _optional_float(fields["fk"]))
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_hash", hash(values))
+
+    @classmethod
+    def from_vessel(cls, vessel) -> "VesselSpec":
+        """Spec of the current geometry of ``vessel``, which must have scalar dimensions."""
+        return cls(type(vessel).__name__, vessel.diameter, vessel.length, vessel.head_distance,
+                   getattr(vessel, "fd", None), getattr(vessel, "fk", None))
+
+    @property
+    def key(self) -> tuple:
+        """The fields as a tuple."""
+        return (self.vessel_type, self.diameter, self.length, self.head_distance, self.fd, self.fk)
+
+    @property
+    def digest(self) -> str:
+        """Hex digest of the fields, the same in every process and run, unlike ``hash``."""
+        return hashlib.blake2b(repr(self.key).encode(), digest_size=16).hexdigest()
+
+    def build(self):
+        """Create a vessel with this geometry, its levels at zero."""
+        from .fleet import fleet_vessel
+        return fleet_vessel(vessel_class(self.vessel_type), self.diameter, self.length, self.head_distance,
+                            self.fd, self.fk)
+
+    def replace(self, **changes) -> "VesselSpec":
+        """Copy of the spec with some fields changed."""
+        fields = dict(zip(self.__slots__, self.key))
+        unknown = set(changes) - set(fields)
+        if unknown:
+            raise TypeError(f"VesselSpec has no field {', '.join(sorted(unknown))}")
+        fields.update(changes)
+        return VesselSpec(**fields)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"VesselSpec is immutable, use replace() to change '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"VesselSpec is immutable, cannot delete '{name}'")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, VesselSpec):
+            return NotImplemented
+        return self._hash == other._hash and self.key == other.key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return VesselSpec, self.key
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(self.__slots__, self.key)
+                           if value is not None)
+        return f"VesselSpec({fields})"
@@ -1,5 +1,7 @@
-from .vessels import Vessels
-from math import pi, sqrt
+from .vessels import Vessels, cached_geometry, vectorize_levels, clip_level, memoize_level
+from .vertical_elliptical_vessels import elliptical_cap_height
+from math import pi
+import numpy as np
 
 class SphericalTanks(Vessels):
     vessels_type = 'Spherical Tanks'
@@ -8,7 +10,7 @@ class SphericalTanks(Vessels):
         super().__init__()
         self._diameter = input_diameter
 
-    @property
+    @cached_geometry
     def total_height(self) -> float:
         return self.diameter
 
@@ -24,11 +26,11 @@ class SphericalTanks(Vessels):
     def head_volume(self) -> float:
         return 0.0
 
-    @property
+    @cached_geometry
     def total_volume(self) -> float:
         return pi * (self.diameter / 2) ** 3 * (4 / 3)
 
-    @property
+    @cached_geometry
     def shell_volume(self) -> float:
         return pi * (self.diameter / 2) ** 3 * (4 / 3)
 
@@ -40,25 +42,57 @@ class SphericalTanks(Vessels):
     def head_surface_area(self) -> float:
         return 0.0
 
-    @property
+    @cached_geometry
     def shell_surface_area(self) -> float:
         return self.wetted_area(self.diameter)
 
+    @memoize_level
     def head_liquid_volume(self, value: float) -> float:
         return 0.0
 
+    @memoize_level
     def shell_liquid_volume(self, value: float) -> float:
         return self.liquid_volume(value)
 
+    @vectorize_levels
     def liquid_volume(self, value: float) -> float:
-        value = min(value, self.diameter)
-        return 0.0 if value < 0 else pi / 6 * value * (3 * sqrt(value * (self.diameter - value)) ** 2 + value ** 2)
+        return sphere_liquid_volume(self.diameter, value)
 
+    @memoize_level
     def head_wetted_area(self, value: float) -> float:
         return 0.0
 
+    @memoize_level
     def shell_wetted_area(self, value: float) -> float:
         return self.wetted_area(value)
 
+    @vectorize_levels
     def wetted_area(self, value: float) -> float:
-        return 0.0 if value < 0 else pi * self.diameter * value
\ No newline at end of file
+        return sphere_wetted_area(self.diameter, value)
+
+    @vectorize_levels
+    def surface_area_at_level(self, value: float) -> float:
+        value = clip_level(value, 0.0, self.diameter)
+        return pi * value * (self.diameter - value)
+
+    @vectorize_levels
+    def level_for_volume(self, value: float) -> float:
+        radius = self.diameter / 2
+        return elliptical_cap_height(radius, radius, radius, clip_level(value, 0.0, self.total_volume))
+
+
+def sphere_liquid_volume(diameter, level):
+    """Liquid volume of spheres of ``diameter`` filled to ``level``, broadcast over both arguments.
+
+    The cap volume ``pi * h ** 2 * (3 * D - 2 * h) / 6`` with the level clipped to ``[0, D]``.
+    """
+    diameter = np.asarray(diameter, dtype=float)
+    level = clip_level(level, 0.0, diameter)
+    return pi / 6 * level ** 2 * (3 * diameter - 2 * level)
+
+
+def sphere_wetted_area(diameter, level):
+    """Wetted area ``pi * D * h`` of spheres, broadcast over both arguments, 0 below the bottom."""
+    diameter = np.asarray(diameter, dtype=float)
+    level = np.asarray(level, dtype=float)
+    return np.where(level < 0, 0.0, pi * diameter * level)
@@ -0,0 +1,163 @@
+import numpy as np
+
+from .vessels import Vessels
+
+
+class StrappingTable:
+    """Level/volume strapping table of a vessel with monotone cubic interpolation.
+
+    Unlike ``Vessels.create_table`` the table stores absolute levels (m),
+    volumes (m3) and wetted areas (m2). Lookups use PCHIP interpolation, which
+    keeps the volume curve monotone. ``level`` inverts that interpolant, with a
+    root solve of the PCHIP cubic on the interval holding the volume, so
+    ``level(volume(h))`` returns ``h``. The table remembers the geometry it was built from and is only
+    rebuilt by ``refresh`` when that geometry changes.
+
+    Parameters
+        vessel : Vessels
+            vessel the table is sampled from
+        n : int
+            number of intervals between the bottom and the total height, default 200
+        estimate_error : bool
+            also evaluate the vessel at the interval midpoints to estimate the
+            interpolation error, default True
+    """
+
+    def __init__(self, vessel: Vessels, n: int = 200, estimate_error: bool = True) -> None:
+        if n < 2:
+            raise ValueError("Strapping table needs at least 2 intervals")
+        self.vessel = vessel
+        self.n = n
+        self.estimate_error = estimate_error
+        self._build()
+
+    def _build(self) -> None:
+        from scipy.interpolate import PchipInterpolator
+        vessel = self.vessel
+        self.spec = vessel.spec
+        self.levels = np.linspace(0.0, vessel.total_height, self.n + 1)
+        self.volumes = vessel.liquid_volume(self.levels)
+        self.wetted_areas = vessel.wetted_area(self.levels)
+        self._volume = PchipInterpolator(self.levels, self.volumes, extrapolate=False)
+        self._wetted_area = PchipInterpolator(self.levels, self.wetted_areas, extrapolate=False)
+        self.volume_error = 0.0
+        self.wetted_area_error = 0.0
+        if self.estimate_error:
+            midpoints = (self.levels[1:] + self.levels[:-1]) / 2
+            self.volume_error = float(np.abs(self._volume(midpoints) - vessel.liquid_volume(midpoints)).max())
+            self.wetted_area_error = float(np.abs(self._wetted_area(midpoints) - vessel.wetted_area(midpoints)).max())
+
+    def is_stale(self) -> bool:
+        """Return True when the vessel geometry changed since the table was built."""
+        return self.vessel.spec != self.spec
+
+    def refresh(self) -> bool:
+        """Rebuild the table if the geometry changed, return True when it was rebuilt."""
+        if not self.is_stale():
+            return False
+        self._build()
+        return True
+
+    def volume(self, level):
+        """Liquid volume (m3) at ``level`` m, a float or an array of levels."""
+        level = np.clip(level, 0.0, self.levels[-1])
+        return _as_result(self._volume(level))
+
+    def wetted_area(self, level):
+        """Wetted area (m2) at ``level`` m, a float or an array of levels."""
+        level = np.clip(level, 0.0, self.levels[-1])
+        return _as_result(self._wetted_area(level))
+
+    def level(self, volume, tol: float = 1e-12, max_iter: int = 50):
+        """Liquid level (m) holding ``volume`` m3, a float or an array of volumes, see ``invert_pchip``."""
+        return _as_result(invert_pchip(self._volume, self.volumes, volume, tol, max_iter))
+
+
+def invert_pchip(interpolant, values, target, tol: float = 1e-12, max_iter: int = 50):
+    """Abscissa where the monotone PCHIP ``interpolant`` of the samples ``values`` equals ``target``.
+
+    The root of the cubic on the interval holding each target, by Newton
+    steps kept inside the interval with bisection. Targets are clipped to the
+    range of ``values``, and flat parts of the curve return their lowest
+    abscissa.
+    """
+    x = interpolant.x
+    target, index = _locate(values, target)
+    return _invert_cubic(x, values, interpolant.c[:, index], index, target, tol, max_iter)
+
+
+def invert_hermite(levels, values, slopes, target, tol: float = 1e-12, max_iter: int = 50):
+    """``invert_pchip`` for the cubic Hermite curve through ``(levels, values)`` with ``slopes``.
+
+    With the slopes of ``pchip_slopes`` this is the inverse of the PCHIP
+    interpolant, computed from the samples without building it.
+    """
+    target, index = _locate(values, target)
+    h = levels[index + 1] - levels[index]
+    secant = (values[index + 1] - values[index]) / h
+    start, end = slopes[index], slopes[index + 1]
+    coefficients = ((start + end - 2 * secant) / h ** 2, (3 * secant - 2 * start - end) / h, start, values[index])
+    return _invert_cubic(levels, values, coefficients, index, target, tol, max_iter)
+
+
+def _locate(values, target):
+    target = np.clip(np.asarray(target, dtype=float), values[0], values[-1])
+    # the first interval whose end value reaches the target
+    return target, np.clip(np.searchsorted(values, target) - 1, 0, len(values) - 2)
+
+
+def _invert_cubic(x, values, coefficients, index, target, tol, max_iter):
+    c3, c2, c1, c0 = coefficients
+    target = target - c0
+    low, high = np.zeros_like(target), x[index + 1] - x[index]
+    span = values[index + 1] - values[index]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(span > 0, high * (target / span), 0.0)
+    for _ in range(max_iter):
+        residual = ((c3 * t + c2) * t + c1) * t - target
+        low = np.where(residual < 0, t, low)
+        high = np.where(residual > 0, t, high)
+        slope = (3 * c3 * t + 2 * c2) * t + c1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = t - residual / slope
+        # an exact root may have a zero slope, at the apex of a cone
+        t = np.where(residual == 0, t,
+                     np.where((slope > 0) & (step >= low) & (step <= high), step, (low + high) / 2))
+        if np.all(np.abs(residual) <= tol * max(abs(values[-1]), abs(values[0]))):
+            break
+    return x[index] + t
+
+
+def pchip_slopes(levels, values):
+    """Slopes at the samples of the monotone PCHIP interpolant, along the last axis.
+
+    The weighted harmonic mean of the secants used by SciPy's
+    ``PchipInterpolator``, zero at local extrema, so the cubic Hermite curve
+    with these slopes is that interpolant.
+    """
+    levels = np.asarray(levels, dtype=float)
+    values = np.asarray(values, dtype=float)
+    h = np.diff(levels, axis=-1)
+    secants = np.diff(values, axis=-1) / h
+    if values.shape[-1] == 2:
+        return np.concatenate([secants, secants], axis=-1)
+    h0, h1, m0, m1 = h[..., :-1], h[..., 1:], secants[..., :-1], secants[..., 1:]
+    w1, w2 = 2 * h1 + h0, h1 + 2 * h0
+    slopes = np.empty_like(values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = (w1 / m0 + w2 / m1) / (w1 + w2)
+        slopes[..., 1:-1] = np.where((np.sign(m0) != np.sign(m1)) | (m0 == 0) | (m1 == 0), 0.0, 1.0 / mean)
+    slopes[..., 0] = _end_slope(h[..., 0], h[..., 1], secants[..., 0], secants[..., 1])
+    slopes[..., -1] = _end_slope(h[..., -1], h[..., -2], secants[..., -1], secants[..., -2])
+    return slopes
+
+
+def _end_slope(h0, h1, m0, m1):
+    # one-sided three-point estimate, limited to keep the end interval monotone
+    slope = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+    slope = np.where(np.sign(slope) != np.sign(m0), 0.0, slope)
+    return np.where((np.sign(m0) != np.sign(m1)) & (np.abs(slope) > 3 * np.abs(m0)), 3 * m0, slope)
+
+
+def _as_result(value):
+    return float(value) if np.ndim(value) == 0 else value
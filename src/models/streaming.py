@@ -0,0 +1,187 @@
+"""Streaming conversion of level histories to inventory.
+
+Level records ``(timestamp, tank_id, level)`` are read from any iterable, for
+example ``read_level_records(sys.stdin)``, and converted ``chunk_size``
+records at a time: the records of one tank in a chunk go through a single
+vectorized ``liquid_volume`` and ``wetted_area`` call. Only the current chunk
+and the last timestamp and volume of each tank are held in memory, so
+histories of any length can be processed::
+
+    python -m models.streaming tanks.csv < levels.csv > inventory.csv
+
+The net flow of a record is the volume change since the previous record of
+the same tank divided by the elapsed time (m3/s for timestamps in seconds).
+It is NaN for the first record of a tank and when the time does not advance.
+Records of a tank are expected in time order. Timestamps are numbers (s) or
+ISO 8601 strings.
+"""
+import argparse
+import csv
+import sys
+from collections import namedtuple
+from datetime import datetime
+from itertools import islice
+
+import numpy as np
+
+from .fleet import FLEET_TYPES, fleet_vessel
+from .horizontal_conical_vessels import HorizontalConicalVessels
+from .spherical_tanks import SphericalTanks
+from .vertical_conical_vessels import VerticalConicalVessels
+
+STREAM_COLUMNS = ("timestamp", "tank_id", "level", "volume", "wetted_area", "net_flow")
+DEFAULT_CHUNK_SIZE = 65536
+
+InventoryRecord = namedtuple("InventoryRecord", STREAM_COLUMNS)
+
+
+def parse_timestamps(values) -> np.ndarray:
+    """Seconds for a sequence of numbers, numeric strings, ISO 8601 strings or datetimes."""
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        pass
+    seconds = np.empty(len(values))
+    for index, value in enumerate(values):
+        if isinstance(value, datetime):
+            seconds[index] = value.timestamp()
+            continue
+        try:
+            seconds[index] = float(value)
+        except ValueError:
+            seconds[index] = datetime.fromisoformat(value).timestamp()
+    return seconds
+
+
+def read_level_records(lines, delimiter: str = ","):
+    """Yield ``(timestamp, tank_id, level)`` from CSV lines, skipping a ``timestamp`` header row.
+
+    The timestamp is returned as written, the level as a float.
+    """
+    for row in csv.reader(lines, delimiter=delimiter):
+        if not row or row[0].lstrip().startswith("#"):
+            continue
+        if row[0].strip().lower() == "timestamp":
+            continue
+        if len(row) < 3:
+            raise ValueError(f"Expected timestamp, tank id and level, got {row!r}")
+        yield row[0].strip(), row[1].strip(), float(row[2])
+
+
+def load_tanks(lines, delimiter: str = ",") -> dict:
+    """Read the tank geometries of a CSV with a header row.
+
+    The columns are ``tank_id``, ``type`` (a ``FLEET_TYPES`` key), ``diameter``
+    and, where the type needs them, ``length``, ``head_distance``, ``fd`` and
+    ``fk``. Empty cells are left at the class defaults.
+    """
+    tanks = {}
+    for row in csv.DictReader(lines, delimiter=delimiter):
+        try:
+            vessel_class = FLEET_TYPES[row["type"].strip()]
+        except KeyError:
+            raise ValueError(f"Unknown vessel type {row.get('type')!r} for tank {row.get('tank_id')!r}") from None
+        values = {name: float(row[name]) for name in ("diameter", "length", "head_distance", "fd", "fk")
+                  if (row.get(name) or "").strip()}
+        required = ["diameter"] if vessel_class is SphericalTanks else ["diameter", "length"]
+        if issubclass(vessel_class, (VerticalConicalVessels, HorizontalConicalVessels)):
+            required.append("head_distance")
+        missing = [name for name in required if name not in values]
+        if missing:
+            raise ValueError(f"Tank {row['tank_id']!r} has no {', '.join(missing)}")
+        tanks[row["tank_id"].strip()] = fleet_vessel(vessel_class, values["diameter"], values.get("length"),
+                                                     values.get("head_distance"), values.get("fd"), values.get("fk"))
+    return tanks
+
+
+def stream_inventory_chunks(records, tanks, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Yield the inventory of ``records`` as one dict of ``STREAM_COLUMNS`` arrays per chunk.
+
+    Parameters
+        records : iterable
+            ``(timestamp, tank_id, level)`` records
+        tanks : mapping
+            vessel of each tank id
+        chunk_size : int
+            records converted per chunk, default 65536
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive")
+    records = iter(records)
+    # tank id -> (timestamp, volume) of its last record
+    last = {}
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        raw_timestamps, tank_ids, levels = zip(*chunk)
+        timestamps = parse_timestamps(raw_timestamps)
+        tank_ids = np.asarray(tank_ids)
+        levels = np.asarray(levels, dtype=float)
+        volume = np.empty(levels.size)
+        wetted_area = np.empty(levels.size)
+        net_flow = np.empty(levels.size)
+        names, inverse = np.unique(tank_ids, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        starts = np.searchsorted(inverse[order], np.arange(names.size + 1))
+        for index, tank_id in enumerate(names.tolist()):
+            rows = order[starts[index]:starts[index + 1]]
+            try:
+                vessel = tanks[tank_id]
+            except KeyError:
+                raise ValueError(f"Unknown tank {tank_id!r}") from None
+            volume[rows] = vessel.liquid_volume(levels[rows])
+            wetted_area[rows] = vessel.wetted_area(levels[rows])
+            previous_time, previous_volume = last.get(tank_id, (np.nan, np.nan))
+            elapsed = np.diff(timestamps[rows], prepend=previous_time)
+            change = np.diff(volume[rows], prepend=previous_volume)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                net_flow[rows] = np.where(elapsed > 0, change / elapsed, np.nan)
+            last[tank_id] = (timestamps[rows[-1]], volume[rows[-1]])
+        yield {"timestamp": list(raw_timestamps), "tank_id": tank_ids, "level": levels, "volume": volume,
+               "wetted_area": wetted_area, "net_flow": net_flow}
+
+
+def stream_inventory(records, tanks, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Yield an ``InventoryRecord`` per record, in input order, see ``stream_inventory_chunks``."""
+    for columns in stream_inventory_chunks(records, tanks, chunk_size):
+        yield from map(InventoryRecord, columns["timestamp"], columns["tank_id"].tolist(), columns["level"].tolist(),
+                       columns["volume"].tolist(), columns["wetted_area"].tolist(), columns["net_flow"].tolist())
+
+
+def convert_csv(source, target, tanks, chunk_size: int = DEFAULT_CHUNK_SIZE, delimiter: str = ",") -> int:
+    """Write the inventory of the CSV lines ``source`` to the text file ``target``, return the record count."""
+    writer = csv.writer(target, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(STREAM_COLUMNS)
+    count = 0
+    for columns in stream_inventory_chunks(read_level_records(source, delimiter), tanks, chunk_size):
+        writer.writerows(zip(columns["timestamp"], columns["tank_id"].tolist(), columns["level"].tolist(),
+                             columns["volume"].tolist(), columns["wetted_area"].tolist(),
+                             columns["net_flow"].tolist()))
+        count += len(columns["timestamp"])
+    return count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Convert a level history CSV to volume, wetted area and net flow.")
+    parser.add_argument("tanks", help="CSV of tank_id, type, diameter, length, head_distance, fd, fk.")
+    parser.add_argument("input", nargs="?", default="-", help="Level history CSV (default: stdin).")
+    parser.add_argument("-o", "--output", default="-", help="Output CSV (default: stdout).")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Records per chunk.")
+    args = parser.parse_args(argv)
+    with open(args.tanks, newline="", encoding="utf-8") as handle:
+        tanks = load_tanks(handle)
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        convert_csv(source, target, tanks, args.chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""Minimal SVG canvas with the subset of the matplotlib ``Axes`` API used by ``drawing``.
+
+``SvgAxes`` records lines, shapes, arrows and labels in data coordinates and
+writes them as one SVG document. The page mirrors the default matplotlib
+figure of ``draw_vessel``: an 8 x 8 inch page (576 x 576 pt) with the axes
+box at the default subplot margins and an equal aspect ratio. It depends on
+nothing outside the standard library.
+"""
+import math
+from xml.sax.saxutils import escape
+
+PAGE_SIZE = 576.0
+# default matplotlib subplot margins, as fractions of the page
+AXES_BOX = (0.125, 0.11, 0.9, 0.88)
+FONT_FAMILY = "DejaVu Sans, Arial, Helvetica, sans-serif"
+# average glyph width as a fraction of the font size, to size the label boxes
+CHAR_WIDTH = 0.6
+LINE_STYLES = {"-": None, "--": "3.7,1.6", ":": "1,1.65", "-.": "6.4,1.6,1,1.6"}
+COLOR_CODES = {"k": "black", "r": "red", "g": "green", "b": "blue"}
+
+
+def _format(value: float) -> str:
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+class SvgAxes:
+    """Collect drawing primitives in data coordinates and render them as SVG."""
+
+    def __init__(self, size: float = PAGE_SIZE) -> None:
+        self.size = size
+        self.xlim = (0.0, 1.0)
+        self.ylim = (0.0, 1.0)
+        self.title = ""
+        self._items = []
+
+    def set_aspect(self, aspect) -> None:
+        # the page is always drawn with an equal aspect ratio
+        pass
+
+    def axis(self, option) -> None:
+        # axes lines and ticks are never drawn
+        pass
+
+    def set_xlim(self, left: float, right: float) -> None:
+        self.xlim = (left, right)
+
+    def set_ylim(self, bottom: float, top: float) -> None:
+        self.ylim = (bottom, top)
+
+    def set_title(self, title: str) -> None:
+        self.title = title
+
+    def plot(self, xs, ys, fmt: str = "-", color: str | None = None, linestyle: str | None = None,
+             linewidth: float = 1.5) -> None:
+        style = linestyle or "".join(character for character in fmt if character in "-.:") or "-"
+        if color is None:
+            color = next((COLOR_CODES[character] for character in fmt if character in COLOR_CODES), "#1f77b4")
+        self._items.append(("polyline", list(zip(xs, ys)), color, LINE_STYLES.get(style), linewidth))
+
+    def rectangle(self, xy, width: float, height: float, edgecolor: str = "black") -> None:
+        x, y = xy
+        self._items.append(("polygon", [(x, y), (x + width, y), (x + width, y + height), (x, y + height)],
+                            edgecolor))
+
+    def arc(self, center, width: float, height: float, theta1: float, theta2: float,
+            edgecolor: str = "black") -> None:
+        self._items.append(("arc", center, width / 2, height / 2, theta1, theta2, edgecolor))
+
+    def circle(self, center, radius: float, edgecolor: str = "black") -> None:
+        self._items.append(("arc", center, radius, radius, 0.0, 360.0, edgecolor))
+
+    def annotate(self, text: str, xy, xytext, arrowprops: dict | None = None) -> None:
+        arrowprops = arrowprops or {}
+        self._items.append(("arrow", xytext, xy, arrowprops.get("color", "black"),
+                            arrowprops.get("linewidth", 1.0), arrowprops.get("arrowstyle", "->")))
+        if text:
+            self.text(xytext[0], xytext[1], text)
+
+    def text(self, x: float, y: float, text: str, color: str = "black", fontsize: float = 10.0,
+             ha: str = "left", va: str = "baseline", bbox: dict | None = None) -> None:
+        self._items.append(("text", x, y, text, color, fontsize, ha, va, bbox is not None))
+
+    def _transform(self):
+        left, bottom, right, top = AXES_BOX
+        box_width = (right - left) * self.size
+        box_height = (top - bottom) * self.size
+        x0, x1 = self.xlim
+        y0, y1 = self.ylim
+        scale = min(box_width / max(x1 - x0, 1e-12), box_height / max(y1 - y0, 1e-12))
+        # equal aspect, centred in the axes box like matplotlib's adjustable box
+        origin_x = left * self.size + (box_width - scale * (x1 - x0)) / 2
+        origin_y = (1 - top) * self.size + (box_height - scale * (y1 - y0)) / 2
+        return lambda x, y: (origin_x + (x - x0) * scale, origin_y + (y1 - y) * scale), scale, origin_y
+
+    def to_svg(self) -> str:
+        """The SVG document of everything drawn so far."""
+        point, scale, top = self._transform()
+        size = _format(self.size)
+        parts = [
+            '<?xml version="1.0" encoding="utf-8" standalone="no"?>',
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}pt" height="{size}pt" '
+            f'viewBox="0 0 {size} {size}" version="1.1">',
+            "<defs>",
+            '<marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="8" markerHeight="8" '
+            'orient="auto-start-reverse" markerUnits="userSpaceOnUse">'
+            '<path d="M 0 1 L 10 5 L 0 9" fill="none" stroke="context-stroke"/></marker>',
+            "</defs>",
+            f'<rect width="{size}" height="{size}" fill="white"/>',
+        ]
+        for item in self._items:
+            kind = item[0]
+            if kind == "polyline":
+                _, points, color, dashes, linewidth = item
+                coordinates = " ".join(f"{_format(px)},{_format(py)}" for px, py in (point(x, y) for x, y in points))
+                dash = f' stroke-dasharray="{dashes}"' if dashes else ""
+                parts.append(f'<polyline points="{coordinates}" fill="none" stroke="{color}" '
+                             f'stroke-width="{_format(linewidth)}"{dash}/>')
+            elif kind == "polygon":
+                _, points, color = item
+                coordinates = " ".join(f"{_format(px)},{_format(py)}" for px, py in (point(x, y) for x, y in points))
+                parts.append(f'<polygon points="{coordinates}" fill="none" stroke="{color}"/>')
+            elif kind == "arc":
+                parts.append(self._arc_element(point, scale, *item[1:]))
+            elif kind == "arrow":
+                _, start, end, color, linewidth, style = item
+                (x1, y1), (x2, y2) = point(*start), point(*end)
+                markers = ' marker-end="url(#arrow)"' if ">" in style else ""
+                if "<" in style:
+                    markers += ' marker-start="url(#arrow)"'
+                parts.append(f'<line x1="{_format(x1)}" y1="{_format(y1)}" x2="{_format(x2)}" y2="{_format(y2)}" '
+                             f'stroke="{color}" stroke-width="{_format(linewidth)}"{markers}/>')
+            else:
+                parts.extend(self._text_elements(point, *item[1:]))
+        if self.title:
+            parts.append(f'<text x="{_format(self.size / 2)}" y="{_format(top - 6)}" text-anchor="middle" '
+                         f'font-family="{FONT_FAMILY}" font-size="12">{escape(self.title)}</text>')
+        parts.append("</svg>")
+        return "\n".join(parts) + "\n"
+
+    @staticmethod
+    def _arc_element(point, scale, center, rx, ry, theta1, theta2, color) -> str:
+        cx, cy = point(*center)
+        rx, ry = rx * scale, ry * scale
+        if theta2 - theta1 >= 360:
+            return (f'<ellipse cx="{_format(cx)}" cy="{_format(cy)}" rx="{_format(rx)}" ry="{_format(ry)}" '
+                    f'fill="none" stroke="{color}"/>')
+        start, end = math.radians(theta1), math.radians(theta2)
+        # counter-clockwise in data coordinates is clockwise on the flipped page, sweep flag 0
+        x1, y1 = cx + rx * math.cos(start), cy - ry * math.sin(start)
+        x2, y2 = cx + rx * math.cos(end), cy - ry * math.sin(end)
+        large = 1 if (theta2 - theta1) % 360 > 180 else 0
+        return (f'<path d="M {_format(x1)} {_format(y1)} A {_format(rx)} {_format(ry)} 0 {large} 0 '
+                f'{_format(x2)} {_format(y2)}" fill="none" stroke="{color}"/>')
+
+    @staticmethod
+    def _text_elements(point, x, y, text, color, fontsize, ha, va, boxed) -> list[str]:
+        px, py = point(x, y)
+        anchor = {"left": "start", "center": "middle", "right": "end"}[ha]
+        baseline = {"center": 0.35, "top": 0.8, "bottom": -0.2, "baseline": 0.0}[va] * fontsize
+        elements = []
+        if boxed:
+            width = len(text) * fontsize * CHAR_WIDTH + 0.3 * fontsize
+            height = 1.3 * fontsize
+            left = {"start": px - 0.15 * fontsize, "middle": px - width / 2, "end": px - width + 0.15 * fontsize}[anchor]
+            elements.append(f'<rect x="{_format(left)}" y="{_format(py + baseline - fontsize)}" '
+                            f'width="{_format(width)}" height="{_format(height)}" rx="{_format(0.15 * fontsize)}" '
+                            f'fill="white" fill-opacity="0.9"/>')
+        elements.append(f'<text x="{_format(px)}" y="{_format(py + baseline)}" text-anchor="{anchor}" '
+                        f'font-family="{FONT_FAMILY}" font-size="{_format(fontsize)}" fill="{color}">'
+                        f'{escape(text)}</text>')
+        return elements
+
+    def savefig(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(self.to_svg())
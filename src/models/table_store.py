@@ -0,0 +1,268 @@
+"""On-disk store of strapping tables for many tanks.
+
+The store is a single ``.npy`` file holding a structured array with one
+record per tank: the tank id, the ``VesselSpec`` fields, the spec ``digest``
+and float64 arrays of ``n + 1`` evenly spaced absolute levels (m), the liquid
+volumes (m3) and wetted areas (m2) at them, as sampled by ``StrappingTable``,
+and the slopes of their PCHIP interpolants at the same levels.
+``numpy.load(path, mmap_mode="r")`` reads it as is.
+
+``TableStore`` maps the file read-only, so opening it costs nothing per tank
+and every process that opens the same file shares the pages of the OS cache;
+``table`` returns views of the mapping. ``volume``, ``wetted_area`` and
+``level`` interpolate with the monotone PCHIP cubic of ``StrappingTable``, so a
+store lookup returns the same value as the table of the same vessel; the
+slopes are computed when the store is written and the cubic is evaluated on
+the views of the mapping, so lookups copy nothing. The digest of each record is compared
+with the current geometry of a vessel to detect stale tables, and
+``refresh_table_store`` rewrites a store recomputing only the tanks whose
+geometry changed::
+
+    cd src && python -m models.table_store tanks.csv tables.npy --n 200
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from .fleet import fleet_vessel
+from .head_curves import HeadCurve
+from .spec import VesselSpec, vessel_class
+from .strapping import invert_hermite, pchip_slopes
+
+DEFAULT_INTERVALS = 200
+TANK_ID_SIZE = 64
+VESSEL_TYPE_SIZE = 40
+_HEADER_FIELDS = ("tank_id", "vessel_type", "diameter", "length", "head_distance", "fd", "fk", "digest")
+_TABLE_FIELDS = ("levels", "volumes", "wetted_areas", "volume_slopes", "wetted_area_slopes")
+
+
+def table_dtype(n: int) -> np.dtype:
+    """Record type of a store sampled at ``n + 1`` levels."""
+    return np.dtype([("tank_id", f"U{TANK_ID_SIZE}"), ("vessel_type", f"U{VESSEL_TYPE_SIZE}"),
+                     ("diameter", "f8"), ("length", "f8"), ("head_distance", "f8"), ("fd", "f8"), ("fk", "f8"),
+                     ("digest", "U32")] + [(name, "f8", (n + 1,)) for name in _TABLE_FIELDS])
+
+
+def _spec_of(vessel_or_spec) -> VesselSpec:
+    return vessel_or_spec if isinstance(vessel_or_spec, VesselSpec) else vessel_or_spec.spec
+
+
+def _fill_tables(records: np.ndarray, specs: list, n: int) -> None:
+    """Sample the tables of ``specs`` into ``records``, one vectorized call per class and head shape."""
+    fractions = np.linspace(0.0, 1.0, n + 1)
+    groups = {}
+    for row, spec in enumerate(specs):
+        groups.setdefault((spec.vessel_type, spec.fd, spec.fk), []).append(row)
+    for (name, fd, fk), rows in groups.items():
+        # one entry per tank and level, the same layout as the fleet evaluation
+        dimensions = np.repeat([(specs[row].diameter, specs[row].length, specs[row].head_distance)
+                                for row in rows], n + 1, axis=0)
+        vessel = fleet_vessel(vessel_class(name), dimensions[:, 0], dimensions[:, 1], dimensions[:, 2], fd, fk)
+        size = dimensions.shape[0]
+        levels = np.broadcast_to(vessel.total_height, (size,)) * np.tile(fractions, len(rows))
+        shape = (len(rows), n + 1)
+        records["levels"][rows] = levels.reshape(shape)
+        records["volumes"][rows] = np.broadcast_to(vessel.liquid_volume(levels), (size,)).reshape(shape)
+        records["wetted_areas"][rows] = np.broadcast_to(vessel.wetted_area(levels), (size,)).reshape(shape)
+        records["volume_slopes"][rows] = pchip_slopes(records["levels"][rows], records["volumes"][rows])
+        records["wetted_area_slopes"][rows] = pchip_slopes(records["levels"][rows], records["wetted_areas"][rows])
+
+
+def _build_records(tanks: dict, n: int, reuse=None):
+    """Records of ``tanks``, copying the current tables of the store ``reuse``; also return the sampled ids."""
+    if n < 2:
+        raise ValueError("Strapping table needs at least 2 intervals")
+    tank_ids = [str(tank_id) for tank_id in tanks]
+    for tank_id in tank_ids:
+        if not 0 < len(tank_id) <= TANK_ID_SIZE:
+            raise ValueError(f"Tank id {tank_id!r} must have 1 to {TANK_ID_SIZE} characters")
+    specs = [_spec_of(vessel) for vessel in tanks.values()]
+    records = np.zeros(len(specs), dtype=table_dtype(n))
+    records["tank_id"] = tank_ids
+    records["vessel_type"] = [spec.vessel_type for spec in specs]
+    records["diameter"] = [spec.diameter for spec in specs]
+    records["length"] = [spec.length for spec in specs]
+    records["head_distance"] = [spec.head_distance for spec in specs]
+    records["fd"] = [np.nan if spec.fd is None else spec.fd for spec in specs]
+    records["fk"] = [np.nan if spec.fk is None else spec.fk for spec in specs]
+    records["digest"] = [spec.digest for spec in specs]
+    sampled = []
+    for row, (tank_id, spec) in enumerate(zip(tank_ids, specs)):
+        if reuse is not None and reuse.n == n and reuse.has_table(tank_id, spec):
+            source = reuse._record(tank_id)
+            for name in _TABLE_FIELDS:
+                records[name][row] = source[name]
+        else:
+            sampled.append(row)
+    if sampled:
+        block = np.zeros(len(sampled), dtype=records.dtype)
+        _fill_tables(block, [specs[row] for row in sampled], n)
+        for name in _TABLE_FIELDS:
+            records[name][sampled] = block[name]
+    return records, [tank_ids[row] for row in sampled]
+
+
+def _save(path, records: np.ndarray) -> None:
+    # write next to the target and rename, so readers never map a half-written file
+    temporary = f"{os.fspath(path)}.tmp-{os.getpid()}"
+    try:
+        with open(temporary, "wb") as handle:
+            np.lib.format.write_array(handle, records, allow_pickle=False)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def write_table_store(path, tanks, n: int = DEFAULT_INTERVALS) -> int:
+    """Sample and write the tables of ``tanks`` to ``path``, return the number of tanks.
+
+    Parameters
+        path : str or path
+            ``.npy`` file to write, replaced atomically
+        tanks : mapping
+            vessel (or ``VesselSpec``) of each tank id; vessels need scalar dimensions
+        n : int
+            number of intervals between the bottom and the total height, default 200
+    """
+    records, _ = _build_records(dict(tanks), n)
+    _save(path, records)
+    return len(records)
+
+
+def refresh_table_store(path, tanks, n: int | None = None) -> list:
+    """Rewrite the store at ``path`` for ``tanks``, sampling only new or changed geometries.
+
+    Records whose digest matches the current geometry are copied, tanks no
+    longer in ``tanks`` are dropped. ``n`` defaults to the store's own, or 200
+    for a new store. Returns the ids of the tanks that were sampled.
+    """
+    tanks = dict(tanks)
+    if not os.path.exists(path):
+        records, sampled = _build_records(tanks, DEFAULT_INTERVALS if n is None else n)
+    else:
+        with TableStore(path) as store:
+            records, sampled = _build_records(tanks, store.n if n is None else n, reuse=store)
+    _save(path, records)
+    return sampled
+
+
+class TableStore:
+    """Read-only, memory-mapped view of a store written by ``write_table_store``.
+
+    Parameters
+        path : str or path
+            ``.npy`` store file
+    """
+
+    def __init__(self, path) -> None:
+        self.path = os.fspath(path)
+        records = np.load(self.path, mmap_mode="r", allow_pickle=False)
+        names = records.dtype.names or ()
+        if records.ndim != 1 or not set(_HEADER_FIELDS + _TABLE_FIELDS) <= set(names):
+            raise ValueError(f"{self.path} is not a strapping table store")
+        self._records = records
+        self.n = records.dtype["levels"].shape[0] - 1
+        self._rows = {tank_id: row for row, tank_id in enumerate(records["tank_id"].tolist())}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, tank_id) -> bool:
+        return tank_id in self._rows
+
+    def __enter__(self) -> "TableStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # worker processes map the file again instead of receiving the arrays
+        return TableStore, (self.path,)
+
+    def close(self) -> None:
+        """Drop the mapping, the file is unmapped once no view returned by ``table`` is left."""
+        self._records = None
+        self._rows = {}
+
+    @property
+    def tank_ids(self) -> list:
+        return list(self._rows)
+
+    def _record(self, tank_id):
+        try:
+            return self._records[self._rows[tank_id]]
+        except KeyError:
+            raise KeyError(f"No table for tank {tank_id!r}") from None
+
+    def spec(self, tank_id) -> VesselSpec:
+        """``VesselSpec`` the table of ``tank_id`` was sampled from."""
+        record = self._record(tank_id)
+        fd, fk = float(record["fd"]), float(record["fk"])
+        return VesselSpec(str(record["vessel_type"]), float(record["diameter"]), float(record["length"]),
+                          float(record["head_distance"]), None if np.isnan(fd) else fd, None if np.isnan(fk) else fk)
+
+    def has_table(self, tank_id, vessel) -> bool:
+        """Return True when the store has a table of ``tank_id`` for the current geometry of ``vessel``."""
+        return tank_id in self._rows and str(self._record(tank_id)["digest"]) == _spec_of(vessel).digest
+
+    def is_stale(self, tank_id, vessel) -> bool:
+        """Return True when the geometry of ``vessel`` changed since the table of ``tank_id`` was sampled."""
+        return not self.has_table(tank_id, vessel)
+
+    def stale(self, tanks) -> list:
+        """Ids of the tanks in the mapping ``tanks`` without a current table."""
+        return [tank_id for tank_id, vessel in dict(tanks).items() if not self.has_table(tank_id, vessel)]
+
+    def table(self, tank_id, vessel=None):
+        """Levels, volumes and wetted areas of ``tank_id`` as read-only views of the file.
+
+        When ``vessel`` is given a stale table raises ValueError.
+        """
+        record = self._record(tank_id)
+        if vessel is not None and str(record["digest"]) != _spec_of(vessel).digest:
+            raise ValueError(f"Table of tank {tank_id!r} is stale, the vessel geometry changed")
+        return record["levels"], record["volumes"], record["wetted_areas"]
+
+    def _curve(self, tank_id, column: str) -> HeadCurve:
+        # the PCHIP cubic of StrappingTable, evaluated on the views of the mapping
+        record = self._record(tank_id)
+        return HeadCurve(record["levels"], record[column + "s"], record[column + "_slopes"])
+
+    def volume(self, tank_id, level):
+        """Liquid volume (m3) of ``tank_id`` at ``level`` m, monotone cubic between the table points."""
+        return _as_result(self._curve(tank_id, "volume")(level))
+
+    def wetted_area(self, tank_id, level):
+        """Wetted area (m2) of ``tank_id`` at ``level`` m, monotone cubic between the table points."""
+        return _as_result(self._curve(tank_id, "wetted_area")(level))
+
+    def level(self, tank_id, volume):
+        """Liquid level (m) of ``tank_id`` holding ``volume`` m3, the inverse of ``volume``."""
+        record = self._record(tank_id)
+        return _as_result(invert_hermite(record["levels"], record["volumes"], record["volume_slopes"], volume))
+
+
+def _as_result(value):
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build or refresh a memory-mapped strapping table store.")
+    parser.add_argument("tanks", help="CSV of tank_id, type, diameter, length, head_distance, fd, fk.")
+    parser.add_argument("store", help="Store file (.npy) to create or refresh.")
+    parser.add_argument("--n", type=int, help=f"Intervals per table (default: the store's, or {DEFAULT_INTERVALS}).")
+    args = parser.parse_args(argv)
+    from .streaming import load_tanks
+    with open(args.tanks, newline="", encoding="utf-8") as handle:
+        tanks = load_tanks(handle)
+    sampled = refresh_table_store(args.store, tanks, args.n)
+    print(f"{len(tanks)} tanks, {len(sampled)} tables sampled")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
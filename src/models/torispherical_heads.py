@@ -0,0 +1,228 @@
+"""Closed-form and fixed-quadrature volumes of ASME F&D (torispherical) heads.
+
+All functions are dimensionless: lengths are in units of the shell diameter,
+so volumes scale with ``diameter ** 3``. ``fd`` and ``fk`` are the dish and
+knuckle radii as fractions of the diameter (see ``constants.py``).
+
+The head profile is measured from the apex, ``z = 0``, to the tangent line,
+``z = a2``. The dish (sphere of radius ``fd``) runs up to ``z = a1`` and the
+knuckle (torus of radius ``fk``) from ``a1`` to ``a2``.
+
+Vertical heads are integrated exactly, with a ``math`` path for float depths
+that keeps a scalar call to a few microseconds. Horizontal heads are the integral of
+circular segments over the head depth; that integral is split at the depth
+where the liquid surface is tangent to the profile and at the dish/knuckle
+junction, and each piece is evaluated with a fixed Gauss-Legendre rule after
+the substitution ``z = z0 + (a2 - z0) * s ** 2`` that removes the ``3/2``
+power singularity at the tangent point.
+
+The wetted area of a horizontal head is the surface integral of the wetted
+arc ``r * (pi + 2 * asin(y / r))`` along the profile, with the same
+substitution at the depth where the arc becomes a full circle. The
+horizontal curves are tabulated per ``fd``/``fk`` pair in ``head_curves``.
+
+Accuracy, relative to the full head volume: with the default 24 nodes the
+horizontal volume matches a tight adaptive ``quad`` reference to ``1e-12``
+for the ASME torispherical and 2:1 elliptical ``fd``/``fk`` pairs. The nested
+default-tolerance ``quad`` used before differs from it by up to ``2e-6``
+(``1e-7`` for ``FD_TORI``/``FK_TORI``), which is the error of the nested quad.
+
+Accuracy of the horizontal wetted area, relative to the full head area: the
+Gauss-Legendre evaluation matches an adaptive ``quad`` of the surface
+integral to ``1e-9``. The earlier quad-based formula it replaces differed from the
+surface integral by up to 4 % of the head area between empty and half full,
+and by 20 % in the hemispherical limit ``fd = 1/2``.
+"""
+from math import asin, sqrt
+
+import numpy as np
+
+from .constants import pi
+
+GAUSS_ORDER = 24
+_NODES, _WEIGHTS = np.polynomial.legendre.leggauss(GAUSS_ORDER)
+# nodes and weights mapped from [-1, 1] to [0, 1]
+GAUSS_NODES = (_NODES + 1) / 2
+GAUSS_WEIGHTS = _WEIGHTS / 2
+
+
+def head_constants(fd: float, fk: float) -> tuple[float, float, float]:
+    """Return ``(a1, a2, b1)``: dish depth, head depth and dish/knuckle junction radius."""
+    a1 = fd * (1 - sqrt(1 - (1 / 2 - fk) * (1 / 2 - fk) / ((fd - fk) * (fd - fk))))
+    a2 = fd - sqrt(fd ** 2 - 2 * fd * fk + fk - 1 / 4)
+    b1 = fd * (1 / 2 - fk) / (fd - fk)
+    return a1, a2, b1
+
+
+def profile_radius(z, fd: float, fk: float):
+    """Radius of the head at depth ``z`` from the apex."""
+    a1, a2, _ = head_constants(fd, fk)
+    z = np.minimum(np.maximum(z, 0.0), a2)
+    dish = np.sqrt(np.maximum(fd ** 2 - (z - fd) ** 2, 0.0))
+    knuckle = (1 / 2 - fk) + np.sqrt(np.maximum(fk ** 2 - (z - a2) ** 2, 0.0))
+    return np.where(z <= a1, dish, knuckle)
+
+
+def profile_depth(r, fd: float, fk: float):
+    """Depth from the apex where the head radius equals ``r``, inverse of :func:`profile_radius`."""
+    a1, a2, b1 = head_constants(fd, fk)
+    r = np.minimum(np.maximum(r, 0.0), 1 / 2)
+    dish = fd - np.sqrt(np.maximum(fd ** 2 - r ** 2, 0.0))
+    knuckle = a2 - np.sqrt(np.maximum(fk ** 2 - (r - (1 / 2 - fk)) ** 2, 0.0))
+    return np.where(r <= b1, dish, knuckle)
+
+
+def _knuckle_primitive(u, fk: float):
+    # antiderivative of r(u) ** 2 with u = z - a2 on the knuckle
+    c = 1 / 2 - fk
+    if isinstance(u, float):
+        return (c ** 2 + fk ** 2) * u - u ** 3 / 3 + c * (
+                u * sqrt(max(fk ** 2 - u ** 2, 0.0)) + fk ** 2 * asin(min(max(u / fk, -1.0), 1.0)))
+    return (c ** 2 + fk ** 2) * u - u ** 3 / 3 + c * (
+            u * np.sqrt(np.maximum(fk ** 2 - u ** 2, 0.0))
+            + fk ** 2 * np.arcsin(np.minimum(np.maximum(u / fk, -1.0), 1.0)))
+
+
+def vertical_head_volume(a, fd: float, fk: float):
+    """Volume of a vertical head filled from the apex to depth ``a``.
+
+    Exact: ``pi * integral(r(z) ** 2, 0, a)`` with the dish and knuckle
+    antiderivatives.
+    """
+    a1, a2, _ = head_constants(fd, fk)
+    if isinstance(a, float):
+        a = min(max(a, 0.0), a2)
+        if a <= a1:
+            return pi * (fd * a ** 2 - a ** 3 / 3)
+        dish, knuckle = a1, a
+    else:
+        a = np.minimum(np.maximum(a, 0.0), a2)
+        dish = np.minimum(a, a1)
+        knuckle = np.maximum(a, a1)
+    volume = pi * (fd * dish ** 2 - dish ** 3 / 3)
+    return volume + pi * (_knuckle_primitive(knuckle - a2, fk) - _knuckle_primitive(a1 - a2, fk))
+
+
+def vertical_head_wetted_area(a, fd: float, fk: float):
+    """Wetted area of a vertical head filled from the apex to depth ``a``.
+
+    Exact: a spherical zone ``2 * pi * fd * z`` on the dish and the toroidal
+    zone of the knuckle.
+    """
+    a1, a2, _ = head_constants(fd, fk)
+    if isinstance(a, float):
+        dish = min(max(a, 0.0), a1)
+        knuckle = min(max(a, a1), a2)
+        arc = asin((knuckle - a2) / fk)
+    else:
+        dish = np.minimum(np.maximum(a, 0.0), a1)
+        knuckle = np.minimum(np.maximum(a, a1), a2)
+        arc = np.arcsin((knuckle - a2) / fk)
+    return 2 * pi * (fd * dish + fk * (knuckle - a1 + (1 / 2 - fk) * (arc - asin((a1 - a2) / fk))))
+
+
+def circular_segment_area(r, y):
+    """Area of the circle of radius ``r`` lying below the horizontal line at height ``y``."""
+    r = np.asarray(r, dtype=float)
+    safe_r = np.where(r > 0, r, 1.0)
+    ratio = np.minimum(np.maximum(y / safe_r, -1.0), 1.0)
+    area = r ** 2 * (np.arccos(-ratio) + ratio * np.sqrt(1 - ratio ** 2))
+    return np.where(r > 0, area, 0.0)
+
+
+def _tangent_rule(delta, fd: float, fk: float):
+    # Gauss-Legendre nodes over the part of the head deeper than the tangent
+    # depth z0, returned as (y, z0, radius at the nodes, weights with jacobian)
+    a1, a2, _ = head_constants(fd, fk)
+    y = delta - 1 / 2
+    z0 = profile_depth(np.abs(y), fd, fk)
+    span = a2 - z0
+    safe_span = np.where(span > 0, span, 1.0)
+    s1 = np.sqrt(np.minimum(np.maximum((a1 - z0) / safe_span, 0.0), 1.0))[..., None]
+    # both pieces, [0, s1] on the dish and [s1, 1] on the knuckle, in one node array
+    s = np.concatenate([s1 * GAUSS_NODES, s1 + (1 - s1) * GAUSS_NODES], axis=-1)
+    weights = np.concatenate([s1 * GAUSS_WEIGHTS, (1 - s1) * GAUSS_WEIGHTS], axis=-1)
+    z = z0[..., None] + span[..., None] * s ** 2
+    return y, z0, profile_radius(z, fd, fk), weights * 2 * span[..., None] * s
+
+
+def horizontal_head_volume(delta, fd: float, fk: float):
+    """Volume of one horizontal head filled to ``delta`` of the diameter.
+
+    Slices at depth ``z`` are circles of radius ``r(z)`` cut by the liquid
+    surface at ``y = delta - 1/2``. Slices smaller than ``|y|`` are either
+    dry or fully wetted, which is the closed-form vertical volume; the rest
+    is integrated with the fixed Gauss-Legendre rule.
+    """
+    _, a2, _ = head_constants(fd, fk)
+    delta = np.minimum(np.maximum(np.asarray(delta, dtype=float), 0.0), 1.0)
+    y, z0, radius, weights = _tangent_rule(delta, fd, fk)
+    full = np.where(y > 0, vertical_head_volume(z0, fd, fk), 0.0)
+    partial = np.sum(circular_segment_area(radius, y[..., None]) * weights, axis=-1)
+    return np.where(delta >= 1.0, vertical_head_volume(a2, fd, fk), full + partial)
+
+
+def horizontal_head_surface_area(delta, fd: float, fk: float):
+    """Free liquid surface area inside one horizontal head filled to ``delta``.
+
+    The chord ``2 * sqrt(r(z) ** 2 - y ** 2)`` integrated over the head depth,
+    this is the derivative of :func:`horizontal_head_volume` with respect to ``delta``.
+    """
+    delta = np.minimum(np.maximum(np.asarray(delta, dtype=float), 0.0), 1.0)
+    y, _, radius, weights = _tangent_rule(delta, fd, fk)
+    chord = 2 * np.sqrt(np.maximum(radius ** 2 - y[..., None] ** 2, 0.0))
+    return np.sum(chord * weights, axis=-1)
+
+
+def horizontal_head_wetted_area(delta, fd: float, fk: float):
+    """Wetted area of one horizontal head filled to ``delta`` of the diameter, in units of ``diameter ** 2``.
+
+    The profile is parametrised by arc length, the angle ``u`` from the apex
+    on the dish and the angle ``t`` from the tangent line on the knuckle. Arcs
+    with ``r <= |y|`` are dry or fully wetted and integrate in closed form,
+    the partially wetted arcs use the fixed Gauss-Legendre rule.
+    """
+    a1, a2, b1 = head_constants(fd, fk)
+    c = 1 / 2 - fk
+    u1 = np.arcsin(b1 / fd)
+    t1 = np.arcsin((a2 - a1) / fk)
+    delta = np.minimum(np.maximum(np.asarray(delta, dtype=float), 0.0), 1.0)
+    y = delta - 1 / 2
+    # profile angles where the radius equals |y|
+    u0 = np.arcsin(np.minimum(np.abs(y), b1) / fd)
+    t0 = np.arccos(np.minimum(np.maximum((np.abs(y) - c) / fk, (b1 - c) / fk), 1.0))
+    full = np.where(y > 0, 2 * pi * (fd ** 2 * (1 - np.cos(u0)) + fk * (c * (t1 - t0) + fk * (np.sin(t1) - np.sin(t0)))),
+                    0.0)
+    # partial dish arcs on [u0, u1] and knuckle arcs on [0, t0], nodes crowded at u0 and t0
+    s = GAUSS_NODES
+    u = u0[..., None] + (u1 - u0)[..., None] * s ** 2
+    t = t0[..., None] * (1 - s ** 2)
+    radius = np.concatenate([fd * np.sin(u), c + fk * np.cos(t)], axis=-1)
+    weights = np.concatenate([fd * 2 * (u1 - u0)[..., None] * s * GAUSS_WEIGHTS,
+                              fk * 2 * t0[..., None] * s * GAUSS_WEIGHTS], axis=-1)
+    arc = pi + 2 * np.arcsin(np.minimum(np.maximum(y[..., None] / radius, -1.0), 1.0))
+    return full + np.sum(arc * radius * weights, axis=-1)
+
+
+def vertical_head_depth(volume, fd: float, fk: float, tol: float = 1e-14, max_iter: int = 20):
+    """Depth from the apex of a vertical head holding ``volume``, inverse of :func:`vertical_head_volume`.
+
+    The dish is a spherical cap of radius ``fd`` and is inverted exactly with
+    the trigonometric root of its cubic. The knuckle is solved by Newton
+    iteration with the cross-section ``pi * r ** 2`` as the derivative.
+    """
+    a1, a2, b1 = head_constants(fd, fk)
+    volume = np.minimum(np.maximum(np.asarray(volume, dtype=float), 0.0), vertical_head_volume(a2, fd, fk))
+    # spherical cap: volume / sphere volume = f, depth / fd = 1 + 2 cos((acos(1 - 2 f) + 4 pi) / 3),
+    # written with phi = acos(1 - 2 f) / 3 in a form without cancellation near f = 0
+    fraction = np.minimum(np.maximum(volume / (4 / 3 * pi * fd ** 3), 0.0), 1.0)
+    phi = 2 / 3 * np.arctan2(np.sqrt(fraction), np.sqrt(1 - fraction))
+    dish = fd * (2 * np.sin(phi / 2) ** 2 + np.sqrt(3) * np.sin(phi))
+    dish_volume = vertical_head_volume(a1, fd, fk)
+    knuckle = np.minimum(np.maximum(a1 + (volume - dish_volume) / (pi * b1 ** 2), a1), a2)
+    for _ in range(max_iter):
+        step = (vertical_head_volume(knuckle, fd, fk) - volume) / (pi * profile_radius(knuckle, fd, fk) ** 2)
+        knuckle = np.minimum(np.maximum(knuckle - step, a1), a2)
+        if np.all(np.abs(step) <= tol):
+            break
+    return np.where(volume <= dish_volume, np.minimum(dish, a1), knuckle)
@@ -1,5 +1,7 @@
 from .vertical_flat_vessels import VerticalFlatVessels
+from .vessels import clip_level, memoize_level
 from math import pi
+import numpy as np
 
 class VerticalConicalVessels(VerticalFlatVessels):
     vessels_type = 'Vertical Conical Vessels'
@@ -17,23 +19,36 @@ class VerticalConicalVessels(VerticalFlatVessels):
     @head_distance.setter
     def head_distance(self, value: float):
         self._head_distance = value
+        self._clear_geometry_cache()
 
+    @memoize_level
     def bottom_head_liquid_volume(self, value: float) -> float:
-        return 0.0 if value <= 0 else self.head_liquid_volume_fn(min(value, self.bottom_head_distance))
+        return self.head_liquid_volume_fn(np.minimum(value, self.bottom_head_distance))
 
+    @memoize_level
     def top_head_liquid_volume(self, value: float) -> float:
-        return 0.0 if value < self.tangent_height else (1 / 12) * pi * self.diameter ** 2 * (
-                self.top_head_distance) - self.head_liquid_volume_fn(self.total_height - min(value, self.total_height))
+        return np.where(value < self.tangent_height, 0.0, (1 / 12) * pi * self.diameter ** 2 * (
+                self.top_head_distance) - self.head_liquid_volume_fn(self.total_height - np.minimum(value, self.total_height)))
 
+    @memoize_level
     def bottom_head_wetted_area(self, value: float) -> float:
-        return 0.0 if value < 0 else self.vertical_cone_surface_area(min(value, self.bottom_head_distance))
+        return self.vertical_cone_surface_area(np.minimum(value, self.bottom_head_distance))
 
+    @memoize_level
     def top_head_wetted_area(self, value: float) -> float:
-        return 0.0 if value < self.tangent_height else self.vertical_cone_surface_area(self.top_head_distance) \
-                                                       - self.vertical_cone_surface_area(
-            self.total_height - min(value, self.total_height))
-    
+        return np.where(value < self.tangent_height, 0.0, self.vertical_cone_surface_area(self.top_head_distance)
+                        - self.vertical_cone_surface_area(self.total_height - np.minimum(value, self.total_height)))
+
     def head_liquid_volume_fn(self, value: float) -> float:
-        return 0.0 if (value <= 0.0) | (self.head_distance <= 0.0) else \
-            1 / 3 * pi * value * (value * self.diameter / 2 / self.head_distance) ** 2
-    
\ No newline at end of file
+        head_distance = self.head_distance
+        value = np.maximum(value, 0.0)
+        return np.where(head_distance > 0.0, 1 / 3 * pi * value * (
+                value * self.diameter / 2 / np.where(head_distance > 0.0, head_distance, 1.0)) ** 2, 0.0)
+
+    def head_radius(self, value: float) -> float:
+        head_distance = self.head_distance
+        return np.where(head_distance > 0.0, self.diameter / 2 * clip_level(value / np.where(head_distance > 0.0, head_distance, 1.0), 0.0, 1.0), self.diameter / 2)
+
+    def head_depth_for_volume(self, value: float) -> float:
+        # inverse of the cone volume pi / 3 * h * (h * D / 2 / head_distance) ** 2
+        return np.cbrt(3 * np.maximum(value, 0.0) * self.head_distance ** 2 / (pi * (self.diameter / 2) ** 2))
@@ -1,5 +1,7 @@
 from .vertical_elliptical_vessels import VerticalEllipticalVessels
+from .vessels import memoize_level
 from .constants import FD_ELLIP, FK_ELLIP, pi
+import numpy as np
 
 class VerticalEllipticalTanks(VerticalEllipticalVessels):
     vessels_type = 'Vertical Elliptical Tanks'
@@ -12,8 +14,10 @@ class VerticalEllipticalTanks(VerticalEllipticalVessels):
     def bottom_head_distance(self) -> float:
         return 0.0
 
+    @memoize_level
     def bottom_head_liquid_volume(self, value: float) -> float:
         return 0.0
 
+    @memoize_level
     def bottom_head_wetted_area(self, value: float) -> float:
-        return 0.0 if value <= 0 else pi * self.diameter ** 2 / 4
+        return np.where(value <= 0, 0.0, pi * self.diameter ** 2 / 4)
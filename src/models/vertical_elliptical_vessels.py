@@ -1,8 +1,11 @@
 from .vertical_torispherical_vessels import VerticalToriSphericalVessels
+from .vessels import clip_level, memoize_level
 from .constants import FD_ELLIP, FK_ELLIP, pi
+import numpy as np
 
 class VerticalEllipticalVessels(VerticalToriSphericalVessels):
     vessels_type = 'Vertical Elliptical Vessels'
+    head_type = 'elliptical'
 
     def __init__(self, input_diameter: float = 3, input_length: float = 9,
                  fd: float = FD_ELLIP, fk: float = FK_ELLIP) -> None:
@@ -12,21 +15,28 @@ class VerticalEllipticalVessels(VerticalToriSphericalVessels):
     def head_distance(self) -> float:
         return self.diameter / 4
 
+    @memoize_level
     def bottom_head_liquid_volume(self, value: float) -> float:
-        return 0.0 if value < 0 else elliptical_head_volume(
-            self.diameter / 2, self.diameter / 2, self.bottom_head_distance, min(value, self.bottom_head_distance))
+        return elliptical_head_volume(
+            self.diameter / 2, self.diameter / 2, self.bottom_head_distance, clip_level(value, 0.0, self.bottom_head_distance))
 
+    @memoize_level
     def top_head_liquid_volume(self, value: float) -> float:
-        if value <= self.bottom_head_distance + self.length:
-            return 0.0
-        else:
-            value = self.total_height - min(value, self.total_height)
-            v1 = elliptical_head_volume(self.diameter / 2, self.diameter / 2,
-                                        self.top_head_distance, self.top_head_distance)
-            v2 = elliptical_head_volume(self.diameter / 2, self.diameter / 2,
-                                        self.top_head_distance, value)
-            return v1 - v2
-        
+        cap_height = self.total_height - np.minimum(value, self.total_height)
+        v1 = elliptical_head_volume(self.diameter / 2, self.diameter / 2,
+                                    self.top_head_distance, self.top_head_distance)
+        v2 = elliptical_head_volume(self.diameter / 2, self.diameter / 2,
+                                    self.top_head_distance, cap_height)
+        return np.where(value <= self.bottom_head_distance + self.length, 0.0, v1 - v2)
+
+    def head_radius(self, value: float) -> float:
+        depth = clip_level(value / self.head_distance, 0.0, 1.0)
+        return self.diameter / 2 * np.sqrt(1 - (1 - depth) ** 2)
+
+    def head_depth_for_volume(self, value: float) -> float:
+        return elliptical_cap_height(self.diameter / 2, self.diameter / 2, self.head_distance, value)
+
+
 def elliptical_head_volume(x_radii: float, y_radii: float, z_radii: float, cap_height: float) -> float:
     """Elliptical Head Volume Calculation.
 
@@ -36,9 +46,35 @@ def elliptical_head_volume(x_radii: float, y_radii: float, z_radii: float, cap_h
         z_radii (float): radius on z-axis
         cap_height (float): height of the cap in z-axis
 
+    All arguments broadcast, so any of them may be a NumPy array.
+
     Returns:
         The calculated volume of the partial ellipsoidal cap given the semi-axes height.
     """
-    if z_radii == 0:
-        return 0.0
-    return pi * x_radii * y_radii * cap_height ** 2 * (3 * z_radii - cap_height) / (3 * z_radii ** 2)
\ No newline at end of file
+    z_radii = np.asarray(z_radii, dtype=float)
+    safe_z_radii = np.where(z_radii == 0, 1.0, z_radii)
+    volume = np.where(z_radii == 0, 0.0, pi * x_radii * y_radii * cap_height ** 2 * (
+            3 * safe_z_radii - cap_height) / (3 * safe_z_radii ** 2))
+    return float(volume) if volume.ndim == 0 else volume
+
+
+def elliptical_cap_height(x_radii: float, y_radii: float, z_radii: float, volume: float) -> float:
+    """Elliptical Cap Height Calculation, the inverse of ``elliptical_head_volume``.
+
+    Args:
+        x_radii (float): radius on x-axis
+        y_radii (float): radius on y-axis
+        z_radii (float): radius on z-axis
+        volume (float): volume of the cap
+
+    With ``f`` the fraction of the full ellipsoid volume, the cap cubic has
+    the root ``cap_height / z_radii = 1 + 2 cos((acos(1 - 2 f) + 4 pi) / 3)``.
+
+    Returns:
+        The height of the partial ellipsoidal cap holding the given volume.
+    """
+    fraction = clip_level(volume / (4 / 3 * pi * x_radii * y_radii * z_radii), 0.0, 1.0)
+    # phi = acos(1 - 2 f) / 3, and 1 + 2 cos(phi + 4 pi / 3) rewritten without cancellation near f = 0
+    phi = 2 / 3 * np.arctan2(np.sqrt(fraction), np.sqrt(1 - fraction))
+    height = z_radii * (2 * np.sin(phi / 2) ** 2 + np.sqrt(3) * np.sin(phi))
+    return float(height) if np.ndim(height) == 0 else height
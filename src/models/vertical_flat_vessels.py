@@ -1,5 +1,6 @@
-from .vessels import Vessels
+from .vessels import Vessels, cached_geometry, vectorize_levels, clip_level, memoize_level
 from math import pi
+import numpy as np
 
 class VerticalFlatVessels(Vessels):
     """Basic class for representing vertical flat vessels
@@ -24,19 +25,19 @@ class VerticalFlatVessels(Vessels):
     def top_head_distance(self) -> float:
         return self.head_distance
 
-    @property
+    @cached_geometry
     def total_height(self) -> float:
         return self.length + self.bottom_head_distance + self.top_head_distance
 
-    @property
+    @cached_geometry
     def tangent_height(self) -> float:
         return self.length + self.bottom_head_distance
 
-    @property
+    @cached_geometry
     def head_volume(self) -> float:
         return self.bottom_head_liquid_volume(self.total_height) + self.top_head_liquid_volume(self.total_height)
 
-    @property
+    @cached_geometry
     def shell_volume(self) -> float:
         return pi * self.diameter ** 2 / 4 * self.length
 
@@ -44,7 +45,7 @@ class VerticalFlatVessels(Vessels):
     def effective_volume(self) -> float:
         return self.liquid_volume(self.high_liquid_level + self.bottom_head_distance)
 
-    @property
+    @cached_geometry
     def tangent_volume(self) -> float:
         return self.liquid_volume(self.tangent_height)
 
@@ -52,44 +53,68 @@ class VerticalFlatVessels(Vessels):
     def working_volume(self) -> float:
         return pi * self.diameter ** 2 / 4 * (self.high_liquid_level - self.low_liquid_level)
 
-    @property
+    @cached_geometry
     def head_surface_area(self) -> float:
         return self.bottom_head_wetted_area(self.total_height) + self.top_head_wetted_area(self.total_height)
 
-    @property
+    @cached_geometry
     def shell_surface_area(self) -> float:
         return pi * self.diameter * self.length
 
+    @memoize_level
     def bottom_head_liquid_volume(self, value: float) -> float:
         return 0.0
 
+    @memoize_level
     def top_head_liquid_volume(self, value: float) -> float:
         return 0.0
 
+    @memoize_level
     def head_liquid_volume(self, value: float) -> float:
         return self.bottom_head_liquid_volume(value) + self.top_head_liquid_volume(value)
 
+    @memoize_level
     def shell_liquid_volume(self, value: float) -> float:
-        if value <= self.bottom_head_distance:
-            return 0.0
-        elif value <= self.bottom_head_distance + self.length:
-            return pi * self.diameter ** 2 / 4 * (value - self.bottom_head_distance)
-        else:
-            return pi * self.diameter ** 2 / 4 * self.length
+        return pi * self.diameter ** 2 / 4 * clip_level(value - self.bottom_head_distance, 0.0, self.length)
 
+    @memoize_level
     def bottom_head_wetted_area(self, value: float) -> float:
-        return 0.0 if value <= 0 else pi * self.diameter ** 2 / 4
+        return np.where(value <= 0, 0.0, pi * self.diameter ** 2 / 4)
 
+    @memoize_level
     def top_head_wetted_area(self, value: float) -> float:
-        return 0.0 if value < self.total_height else pi * self.diameter ** 2 / 4
+        return np.where(value < self.total_height, 0.0, pi * self.diameter ** 2 / 4)
 
+    @memoize_level
     def shell_wetted_area(self, value: float) -> float:
-        if value <= self.bottom_head_distance:
-            return 0.0
-        elif value < self.bottom_head_distance + self.length:
-            return pi * self.diameter * (value - self.bottom_head_distance)
-        else:
-            return pi * self.diameter * self.length
+        return pi * self.diameter * clip_level(value - self.bottom_head_distance, 0.0, self.length)
 
+    @memoize_level
     def head_wetted_area(self, value: float) -> float:
-        return self.bottom_head_wetted_area(value) + self.top_head_wetted_area(value)
\ No newline at end of file
+        return self.bottom_head_wetted_area(value) + self.top_head_wetted_area(value)
+
+    def head_radius(self, value: float) -> float:
+        """Radius of a head ``value`` m from its apex."""
+        return self.diameter / 2
+
+    def head_depth_for_volume(self, value: float) -> float:
+        """Depth from the apex of a head holding ``value`` m3, inverse of the head volume."""
+        return 0.0
+
+    @vectorize_levels
+    def surface_area_at_level(self, value: float) -> float:
+        top_tangent = self.bottom_head_distance + self.length
+        radius = np.where(value < self.bottom_head_distance, self.head_radius(value),
+                          np.where(value <= top_tangent, self.diameter / 2, self.head_radius(self.total_height - value)))
+        return np.where((value < 0) | (value > self.total_height), 0.0, pi * radius ** 2)
+
+    @vectorize_levels
+    def level_for_volume(self, value: float) -> float:
+        volume = clip_level(value, 0.0, self.total_volume)
+        bottom_volume = self.bottom_head_liquid_volume(self.bottom_head_distance)
+        top_volume = self.top_head_liquid_volume(self.total_height)
+        shell_top_volume = bottom_volume + pi * self.diameter ** 2 / 4 * self.length
+        bottom = self.head_depth_for_volume(np.minimum(volume, bottom_volume))
+        shell = self.bottom_head_distance + (volume - bottom_volume) / (pi * self.diameter ** 2 / 4)
+        top = self.total_height - self.head_depth_for_volume(clip_level(top_volume - (volume - shell_top_volume), 0.0, top_volume))
+        return np.where(volume <= bottom_volume, bottom, np.where(volume <= shell_top_volume, shell, top))
@@ -1,5 +1,7 @@
 from .vertical_hemispherical_vessels import VerticalHemiSphericalVessels
+from .vessels import memoize_level
 from math import pi
+import numpy as np
 
 class VerticalHemiSphericalTanks(VerticalHemiSphericalVessels):
     vessels_type = 'Vertical HemiSpherical Tanks'
@@ -11,9 +13,11 @@ class VerticalHemiSphericalTanks(VerticalHemiSphericalVessels):
     def bottom_head_distance(self) -> float:
         return 0.0
 
+    @memoize_level
     def bottom_head_liquid_volume(self, value: float) -> float:
         return 0.0
 
+    @memoize_level
     def bottom_head_wetted_area(self, value: float) -> float:
-        return 0.0 if value <= 0 else pi * self.diameter ** 2 / 4 * 1
+        return np.where(value <= 0, 0.0, pi * self.diameter ** 2 / 4 * 1)
 
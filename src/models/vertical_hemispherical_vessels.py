@@ -1,5 +1,7 @@
 from .vertical_elliptical_vessels import VerticalEllipticalVessels
+from .vessels import clip_level, memoize_level
 from math import pi
+import numpy as np
 
 class VerticalHemiSphericalVessels(VerticalEllipticalVessels):
     vessels_type = 'Vertical HemiSpherical Vessels'
@@ -11,10 +13,11 @@ class VerticalHemiSphericalVessels(VerticalEllipticalVessels):
     def head_distance(self) -> float:
         return self.diameter / 2
 
+    @memoize_level
     def bottom_head_wetted_area(self, value: float) -> float:
-        return 0.0 if value < 0 else pi * self.diameter * min(value, self.bottom_head_distance)
+        return pi * self.diameter * clip_level(value, 0.0, self.bottom_head_distance)
 
+    @memoize_level
     def top_head_wetted_area(self, value: float) -> float:
-        return 0.0 if value < self.tangent_height else pi * self.diameter * (
-                self.top_head_distance - (self.total_height - min(value, self.total_height)))
-    
\ No newline at end of file
+        return np.where(value < self.tangent_height, 0.0, pi * self.diameter * (
+                self.top_head_distance - (self.total_height - np.minimum(value, self.total_height))))
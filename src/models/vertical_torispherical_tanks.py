@@ -1,5 +1,7 @@
 from .vertical_torispherical_vessels import VerticalToriSphericalVessels
+from .vessels import memoize_level
 from .constants import FD_TORI, FK_TORI, pi
+import numpy as np
 
 class VerticalToriSphericalTanks(VerticalToriSphericalVessels):
     vessels_type = 'Vertical ToriSpherical Tanks'
@@ -11,9 +13,11 @@ class VerticalToriSphericalTanks(VerticalToriSphericalVessels):
     def bottom_head_distance(self) -> float:
         return 0.0
 
+    @memoize_level
     def bottom_head_liquid_volume(self, value: float) -> float:
         return 0.0
 
+    @memoize_level
     def bottom_head_wetted_area(self, value: float) -> float:
-        return 0.0 if value <= 0 else pi * self.diameter ** 2 / 4
+        return np.where(value <= 0, 0.0, pi * self.diameter ** 2 / 4)
 
@@ -1,10 +1,223 @@
 from abc import ABC, abstractmethod
-from math import pi, sqrt, acos, asin, acosh
+from functools import wraps
+from math import pi
+
+import numpy as np
+
+from .memo import MEMO_METHODS, LevelMemo
+from .parallel import map_levels
+from .spec import VesselSpec
 
 # This is a forward declaration, the actual import is at the end of the file
 # to avoid circular dependencies.
 # from .drawing import draw_vessel
 
+
+def vectorize_levels(method):
+    """Let a public level method accept a float or an array of liquid levels.
+
+    The wrapped method must use NumPy broadcasting. A float or int is passed
+    through as is and the result returned as a plain ``float``, so scalar
+    calls pay for no array conversion; anything else is converted to a float
+    ``ndarray`` and returns an array of the broadcast shape, as does a scalar
+    level on a vessel with array dimensions. Scalar calls of the methods in
+    ``MEMO_METHODS`` go through the vessel memo when enabled. Only the public
+    entry points are wrapped, the head and shell helpers they call are plain
+    broadcasting functions memoized with ``memoize_level``.
+    """
+    memoized = method.__name__ in MEMO_METHODS
+
+    @wraps(method)
+    def wrapper(self, value):
+        if isinstance(value, (float, int)):
+            if memoized and self._memo is not None:
+                key = (method.__qualname__, self.spec, float(value))
+                result = self._memo.get(key)
+                if result is None:
+                    result = float(method(self, float(value)))
+                    self._memo.put(key, result)
+                return result
+            result = method(self, float(value))
+            # a vessel with array dimensions returns one value per vessel
+            return result if type(result) is np.ndarray and result.ndim else float(result)
+        levels = np.asarray(value, dtype=float)
+        if levels.ndim == 0:
+            return wrapper(self, float(levels))
+        result = method(self, levels)
+        if np.shape(result) != levels.shape:
+            result = result + np.zeros_like(levels)
+        return result
+    return wrapper
+
+
+def memoize_level(method):
+    """Memoize scalar calls of a head or shell helper in the vessel memo.
+
+    Helpers are called with a float by the public methods and with arrays
+    when those are vectorized; only float or int levels are looked up, under
+    the same ``(method, vessel.spec, level)`` key, and arrays, as well as the
+    per-vessel results of a vessel with array dimensions, pass straight
+    through.
+    """
+    @wraps(method)
+    def wrapper(self, value):
+        if self._memo is None or not isinstance(value, (float, int)):
+            return method(self, value)
+        key = (method.__qualname__, self.spec, float(value))
+        result = self._memo.get(key)
+        if result is None:
+            result = method(self, value)
+            if type(result) is np.ndarray and result.ndim:
+                return result
+            result = float(result)
+            self._memo.put(key, result)
+        return result
+    return wrapper
+
+
+def clip_level(value, low, high):
+    """``np.clip`` for the level helpers, without its overhead on scalars."""
+    if isinstance(value, float) and isinstance(low, float) and isinstance(high, float):
+        return min(max(value, low), high)
+    return np.minimum(np.maximum(value, low), high)
+
+
+class cached_geometry:
+    """Read-only property computed once and cached until the geometry changes.
+
+    Values live in the instance ``_geometry_cache`` dict, which every
+    geometry setter clears through ``Vessels._clear_geometry_cache``. Only use
+    it for values that depend on the dimensions, never on the liquid levels.
+    """
+
+    def __init__(self, method) -> None:
+        self.method = method
+        self.__doc__ = method.__doc__
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance._geometry_cache
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = self.method(instance)
+            # the level helpers return NumPy scalars, scalar geometry is kept as plain floats
+            if isinstance(value, np.generic) or (isinstance(value, np.ndarray) and value.ndim == 0):
+                value = value.item()
+            cache[self.name] = value
+            return value
+
+    def __set__(self, instance, value) -> None:
+        raise AttributeError(f"property '{self.name}' of '{type(instance).__name__}' object has no setter")
+
+
+_END_DECADES = np.logspace(-4, -1, 4)
+
+
+def _hermite(t, y_lo, y_hi, m_lo, m_hi):
+    # cubic Hermite between y_lo and y_hi with the slopes m_lo and m_hi in units of the interval
+    return ((2 * t ** 3 - 3 * t ** 2 + 1) * y_lo + (t ** 3 - 2 * t ** 2 + t) * m_lo
+            + (-2 * t ** 3 + 3 * t ** 2) * y_hi + (t ** 3 - t ** 2) * m_hi)
+
+
+def _end_guess(depth_lo, depth_hi, fill_lo, fill_hi, fill, slope_lo, slope_hi):
+    """Distance from an end of the level range where the function has risen by ``fill`` from its end value.
+
+    The interval runs from ``depth_lo`` to ``depth_hi``, where the function has risen by ``fill_lo`` and
+    ``fill_hi`` with the slopes ``slope_lo`` and ``slope_hi``. The guess is a cubic Hermite in log-log
+    coordinates with the log slopes ``depth * slope / fill``, exact for a power of the depth; the interval
+    that starts at the end is a power law with the log slope of its other end.
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        power_lo, power_hi = depth_lo * slope_lo / fill_lo, depth_hi * slope_hi / fill_hi
+        rise = np.log(fill_hi / fill_lo)
+        t = np.log(fill / fill_lo) / rise
+        guess = np.exp(_hermite(t, np.log(depth_lo), np.log(depth_hi), rise / power_lo, rise / power_hi))
+        return np.where(depth_lo > 0, guess, depth_hi * (fill / fill_hi) ** (1 / power_hi))
+
+
+def _solve_level(func, target, upper: float, derivative=None, rtol: float = 1e-12, max_iter: int = 60,
+                 n_grid: int = 32):
+    """Invert the non-decreasing level function ``func`` on ``[0, upper]``.
+
+    One evaluation of ``func`` on a grid of ``n_grid`` intervals brackets
+    every target and gives a linear first guess, a cubic one with
+    ``derivative``. The end intervals are split in decades, and where the
+    derivative vanishes at an end, the bottom and top of a horizontal vessel,
+    the guesses next to it are interpolated log-log. They are refined by
+    Newton steps with ``derivative``, or secant steps without it, falling
+    back to bisection whenever a step leaves the bracket. Each iteration
+    evaluates ``func`` once on the targets that have not converged. Where
+    ``func`` jumps over a target the lowest level reaching it is returned.
+    """
+    target = np.asarray(target, dtype=float)
+    shape = target.shape
+    target = target.ravel()
+    grid = np.linspace(0.0, upper, n_grid + 1)
+    # decades into the end intervals, where a horizontal vessel fills like a power of the depth
+    ends = grid[1] * _END_DECADES
+    grid = np.concatenate([[0.0], ends, grid[1:-1], upper - ends[::-1], [upper]])
+    values = func(grid)
+    index = np.clip(np.searchsorted(values, target), 1, grid.size - 1)
+    lo, hi = grid[index - 1], grid[index]
+    f_lo, f_hi = values[index - 1] - target, values[index] - target
+    rise = f_hi - f_lo
+    t = np.where(rise > 0, -f_lo / np.where(rise > 0, rise, 1.0), 0.5)
+    x = lo + (hi - lo) * t
+    if derivative is not None:
+        # cubic Hermite guess for the inverse, dh/dV = 1 / derivative at the grid levels
+        slopes = derivative(grid)
+        s_lo, s_hi = slopes[index - 1], slopes[index]
+        usable = (s_lo > 0) & (s_hi > 0)
+        m_lo = rise / np.where(usable, s_lo, 1.0)
+        m_hi = rise / np.where(usable, s_hi, 1.0)
+        x = np.where(usable, np.clip(_hermite(t, lo, hi, m_lo, m_hi), lo, hi), x)
+        # where the derivative vanishes at the bottom or top, as in a horizontal vessel, the function grows
+        # like a power of the distance to that end, so the intervals next to it are interpolated log-log
+        end_intervals = _END_DECADES.size + 2
+        bottom = index <= end_intervals
+        if slopes[0] == 0 and bottom.any():
+            guess = _end_guess(lo, hi, values[index - 1] - values[0], values[index] - values[0],
+                               target - values[0], s_lo, s_hi)
+            x = np.where(bottom & np.isfinite(guess), np.clip(guess, lo, hi), x)
+        top = index >= grid.size - end_intervals
+        if slopes[-1] == 0 and top.any():
+            guess = upper - _end_guess(upper - hi, upper - lo, values[-1] - values[index],
+                                       values[-1] - values[index - 1], values[-1] - target, s_hi, s_lo)
+            x = np.where(top & np.isfinite(guess), np.clip(guess, lo, hi), x)
+    x_prev, f_prev = lo.copy(), f_lo
+    ftol = rtol * max(abs(values[-1]), 1e-300)
+    xtol = rtol * upper
+    active = np.flatnonzero(f_lo < 0)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        x_active = x[active]
+        f = func(x_active) - target[active]
+        below = f < 0
+        lo[active] = np.where(below, x_active, lo[active])
+        hi[active] = np.where(below, hi[active], x_active)
+        if derivative is not None:
+            slope = derivative(x_active)
+        else:
+            run = x_active - x_prev[active]
+            slope = np.where(run != 0, (f - f_prev[active]) / np.where(run != 0, run, 1.0), 0.0)
+        x_prev[active], f_prev[active] = x_active, f
+        step = f / np.where(slope > 0, slope, 1.0)
+        newton = x_active - step
+        inside = (slope > 0) & (newton > lo[active]) & (newton < hi[active])
+        solved = np.abs(f) <= ftol
+        collapsed = ~solved & (hi[active] - lo[active] <= xtol)
+        x[active] = np.where(solved, x_active, np.where(
+            collapsed, hi[active], np.where(inside, newton, (lo[active] + hi[active]) / 2)))
+        active = active[~(solved | collapsed | (inside & (np.abs(step) <= xtol)))]
+    return x.reshape(shape)
+
+
 class Vessels(ABC):
     """The skeleton class for tank and vessel classes.
     """
@@ -27,6 +240,8 @@ class Vessels(ABC):
         self._low_liquid_level = 0.0
         self._liquid_level = 0.0
         self._overflow_flag = False
+        self._geometry_cache = {}
+        self._memo = None
 
     def __str__(self) -> str:
         return_string = f"vessel type     : {self.vessels_type}"
@@ -49,12 +264,15 @@ class Vessels(ABC):
         return_string += f"\nwetted surface area : {self.wetted_area(self.liquid_level):.2f} m2"
         return return_string
 
-    def create_table(self, n: int = 10):
+    def create_table(self, n: int = 10, workers: int | None = None):
         """Create table of height, volume, wetted area from bottom to total height of the vessel
 
         Parameters
             n : int
                 number of points in the table, excluding 0.0, default 10
+            workers : int
+                evaluate the levels in chunks on a process pool of this size,
+                0 for all cores, default None (serial)
 
         Returns
             height : float
@@ -64,30 +282,132 @@ class Vessels(ABC):
             wetted area : float
                 list of wetted areas
         """
-        height = []
-        volume = []
-        wetted_area = []
+        height = np.arange(n + 1) / n
         total_height = self.total_height
         total_volume = self.total_volume
         total_area = self.total_surface_area
-        for index in range(n + 1):
-            height.append(index / n)
-            current_height = height[-1] * total_height
-            if total_volume > 0:
-                volume.append(self.liquid_volume(current_height) / total_volume)
-            else:
-                volume.append(0.0)
-            
-            if total_area > 0:
-                wetted_area.append(self.wetted_area(current_height) / total_area)
-            else:
-                wetted_area.append(0.0)
-        return height, volume, wetted_area
-
-    def draw(self, output_path: str):
-        """Draws the vessel and saves it to a file."""
+        levels = height * total_height
+        if total_volume > 0:
+            volume = map_levels(self, "liquid_volume", levels, workers) / total_volume
+        else:
+            volume = np.zeros_like(height)
+        if total_area > 0:
+            wetted_area = map_levels(self, "wetted_area", levels, workers) / total_area
+        else:
+            wetted_area = np.zeros_like(height)
+        return height.tolist(), volume.tolist(), wetted_area.tolist()
+
+    def create_adaptive_table(self, tolerance: float = 1e-4, max_points: int = 4097):
+        """Create the ``create_table`` table with points placed where the curves bend
+
+        The height is first split in eight and at the head/shell junctions.
+        Every interval is then bisected until linear interpolation between its
+        ends predicts the volume and wetted area fractions at its midpoint
+        within ``tolerance``, so straight shell sections keep a few points and
+        the heads get most of them. The midpoints of a round are evaluated in
+        one vectorized call. Intervals narrower than ``2 ** -20`` of the height
+        are not split, so the wetted area jumps where a flat head is covered
+        cost about twenty points each.
+
+        Parameters
+            tolerance : float
+                allowed linear interpolation error of the volume and wetted
+                area fractions, default 1e-4
+            max_points : int
+                stop refining when the table reaches this many points, default 4097
+
+        Returns
+            height : float
+                list of height
+            volume : float
+                list of volumes
+            wetted area : float
+                list of wetted areas
+        """
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be positive")
+        total_height = self.total_height
+        total_volume = self.total_volume
+        total_area = self.total_surface_area
+        volume_scale = 1 / total_volume if total_volume > 0 else 0.0
+        area_scale = 1 / total_area if total_area > 0 else 0.0
+        breaks = [getattr(self, "bottom_head_distance", 0.0), self.tangent_height]
+        # a single midpoint test cannot see a bend symmetric about it, as in a horizontal cylinder
+        levels = np.unique(np.clip(np.concatenate([np.linspace(0.0, total_height, 9), breaks]), 0.0, total_height))
+        min_width = total_height * 2.0 ** -20
+        volumes = self.liquid_volume(levels) * volume_scale
+        areas = self.wetted_area(levels) * area_scale
+        # the intervals still to be tested, by the index of their left end
+        pending = np.arange(levels.size - 1)
+        while pending.size and levels.size + pending.size <= max_points:
+            midpoints = (levels[pending] + levels[pending + 1]) / 2
+            mid_volumes = self.liquid_volume(midpoints) * volume_scale
+            mid_areas = self.wetted_area(midpoints) * area_scale
+            error = np.maximum(np.abs(mid_volumes - (volumes[pending] + volumes[pending + 1]) / 2),
+                               np.abs(mid_areas - (areas[pending] + areas[pending + 1]) / 2))
+            split = (error > tolerance) & (levels[pending + 1] - levels[pending] > 2 * min_width)
+            # the midpoints are kept either way, they cost nothing more
+            order = np.argsort(np.concatenate([levels, midpoints]), kind="stable")
+            levels = np.concatenate([levels, midpoints])[order]
+            volumes = np.concatenate([volumes, mid_volumes])[order]
+            areas = np.concatenate([areas, mid_areas])[order]
+            position = np.argsort(order)[levels.size - midpoints.size:]
+            pending = np.concatenate([position[split] - 1, position[split]])
+        return (levels / total_height).tolist(), volumes.tolist(), areas.tolist()
+
+    def strapping_table(self, n: int = 200, estimate_error: bool = True):
+        """Create an absolute level/volume strapping table, see ``StrappingTable``."""
+        from .strapping import StrappingTable
+        return StrappingTable(self, n, estimate_error)
+
+    @staticmethod
+    def profile(trace: bool = False):
+        """Count and time the vessel methods called inside a ``with`` block, see ``Profiler``."""
+        from .profiling import Profiler
+        return Profiler(trace)
+
+    def simulate(self, initial_level, t_end: float, inflow=0.0, outflow=0.0, **options):
+        """Integrate the level under level-dependent flows, see ``simulate_levels``."""
+        from .dynamics import simulate_levels
+        return simulate_levels(self, initial_level, t_end, inflow, outflow, **options)
+
+    def draw(self, output_path: str, backend: str = "matplotlib"):
+        """Draws the vessel and saves it to a file, ``backend="svg"`` writes SVG without matplotlib."""
         from .drawing import draw_vessel
-        draw_vessel(self, output_path)
+        draw_vessel(self, output_path, backend)
+
+    def _clear_geometry_cache(self) -> None:
+        """Forget every ``cached_geometry`` value and memo entry, called by the geometry setters."""
+        # the cached spec is still the one of the old geometry, the key of its memo entries
+        spec = self._geometry_cache.get("spec")
+        self._geometry_cache.clear()
+        if self._memo is not None and spec is not None:
+            self._memo.invalidate(spec)
+
+    @cached_geometry
+    def spec(self) -> VesselSpec:
+        """Immutable, hashable ``VesselSpec`` of the current geometry, the geometry identity of tables and memos."""
+        return VesselSpec.from_vessel(self)
+
+    @classmethod
+    def from_spec(cls, spec: VesselSpec) -> "Vessels":
+        """Create the vessel described by ``spec``, which must be of this class or a subclass."""
+        vessel = spec.build()
+        if not isinstance(vessel, cls):
+            raise ValueError(f"{spec.vessel_type} is not a {cls.__name__}")
+        return vessel
+
+    def enable_memo(self, maxsize: int = 256, memo: LevelMemo | None = None) -> LevelMemo:
+        """Memoize scalar level queries in an LRU memo, ``memo`` may be shared with other vessels."""
+        self._memo = memo if memo is not None else LevelMemo(maxsize)
+        return self._memo
+
+    def disable_memo(self) -> None:
+        self._memo = None
+
+    def memo_info(self):
+        """Hit/miss statistics of the memo, None when it is disabled."""
+        return None if self._memo is None else self._memo.info()
 
     @property
     def diameter(self) -> float:
@@ -98,6 +418,7 @@ class Vessels(ABC):
         if value <= 0:
             raise ValueError("Diameter must be positive")
         self._diameter = value
+        self._clear_geometry_cache()
 
     @property
     def length(self) -> float:
@@ -108,6 +429,7 @@ class Vessels(ABC):
         if value <= 0:
             raise ValueError("Length must be positive")
         self._length = value
+        self._clear_geometry_cache()
 
     @property
     def high_liquid_level(self) -> float:
@@ -160,6 +482,7 @@ class Vessels(ABC):
         if value < 0:
             raise ValueError("Head distance must be non-negative")
         self._head_distance = value
+        self._clear_geometry_cache()
 
     @property
     @abstractmethod
@@ -181,7 +504,7 @@ class Vessels(ABC):
     def shell_volume(self) -> float:
         pass
 
-    @property
+    @cached_geometry
     def total_volume(self) -> float:
         return self.shell_volume + self.head_volume
 
@@ -213,7 +536,7 @@ class Vessels(ABC):
     def shell_surface_area(self) -> float:
         pass
 
-    @property
+    @cached_geometry
     def total_surface_area(self) -> float:
         return self.shell_surface_area + self.head_surface_area
 
@@ -225,7 +548,9 @@ class Vessels(ABC):
     def shell_liquid_volume(self, value: float) -> float:
         pass
 
-    def liquid_volume(self, value: float) -> float:
+    @vectorize_levels
+    def liquid_volume(self, value: float | np.ndarray) -> float | np.ndarray:
+        """Liquid volume at ``value`` m level, a float or an array of levels."""
         return self.shell_liquid_volume(value) + self.head_liquid_volume(value)
 
     @abstractmethod
@@ -236,9 +561,38 @@ class Vessels(ABC):
     def shell_wetted_area(self, value: float) -> float:
         pass
 
-    def wetted_area(self, value: float) -> float:
+    @vectorize_levels
+    def wetted_area(self, value: float | np.ndarray) -> float | np.ndarray:
+        """Wetted area at ``value`` m level, a float or an array of levels."""
         return self.shell_wetted_area(value) + self.head_wetted_area(value)
 
+    @vectorize_levels
+    def surface_area_at_level(self, value: float | np.ndarray) -> float | np.ndarray:
+        """Free liquid surface area (m2) at ``value`` m level, the derivative dV/dh.
+
+        This is a central difference of ``liquid_volume``, subclasses override
+        it with the analytic cross-section.
+        """
+        step = 1e-6 * self.total_height
+        return (self.liquid_volume(value + step) - self.liquid_volume(value - step)) / (2 * step)
+
+    @vectorize_levels
+    def level_for_volume(self, value: float | np.ndarray) -> float | np.ndarray:
+        """Liquid level (m) holding ``value`` m3, a float or an array of volumes.
+
+        Volumes outside ``[0, total_volume]`` are clipped. Solved by a
+        safeguarded Newton iteration with ``surface_area_at_level`` as the
+        derivative, subclasses override it where an analytic inverse exists.
+        """
+        volume = clip_level(value, 0.0, self.total_volume)
+        return _solve_level(self.liquid_volume, volume, self.total_height, self.surface_area_at_level)
+
+    @vectorize_levels
+    def level_for_wetted_area(self, value: float | np.ndarray) -> float | np.ndarray:
+        """Lowest liquid level (m) with ``value`` m2 of wetted area, a float or an array of areas."""
+        area = clip_level(value, 0.0, self.wetted_area(self.total_height))
+        return _solve_level(self.wetted_area, area, self.total_height)
+
     def estimate_empty_weight(self, wall_thickness: float, material_density: float) -> float:
         """Estimate the total weight of the vessel."""
         if wall_thickness <= 0 or material_density <= 0:
@@ -258,11 +612,7 @@ class Vessels(ABC):
         return self.working_volume / flow_out
 
     def vertical_cone_surface_area(self, value: float) -> float:
-        if (value <= 0.0) | (self.head_distance <= 0.0):
-            return 0.0
-        else:
-            value = min(value, self._head_distance)
-            if self.head_distance == 0:
-                return 0.0
-            r = (value / self.head_distance) * self.diameter / 2
-            return pi * r * sqrt(value ** 2 + r ** 2)
+        head_distance = self.head_distance
+        value = clip_level(value, 0.0, head_distance)
+        r = value / np.where(head_distance > 0.0, head_distance, 1.0) * self.diameter / 2
+        return np.where(head_distance > 0.0, pi * r * np.sqrt(value ** 2 + r ** 2), 0.0)
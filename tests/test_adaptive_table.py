@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.vertical_elliptical_vessels import VerticalEllipticalVessels
+
+from test_vectorization import VESSELS
+
+
+def _interpolation_error(vessel, table):
+    height, volume, wetted_area = table
+    # the ends are left out, flat heads make the wetted area jump there
+    x = np.linspace(0.0, 1.0, 4001)[1:-1]
+    level = x * vessel.total_height
+    return max(np.abs(np.interp(x, height, volume) - vessel.liquid_volume(level) / vessel.total_volume).max(),
+               np.abs(np.interp(x, height, wetted_area) - vessel.wetted_area(level) / vessel.total_surface_area).max())
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+@pytest.mark.parametrize("tolerance", [1e-3, 1e-4])
+def test_adaptive_table_meets_tolerance(vessel_class, args, tolerance):
+    vessel = vessel_class(*args)
+    table = vessel.create_adaptive_table(tolerance)
+    height = np.array(table[0])
+    assert height[0] == 0.0 and height[-1] == pytest.approx(1.0)
+    assert np.all(np.diff(height) > 0)
+    assert len(table[1]) == len(table[2]) == height.size
+    assert _interpolation_error(vessel, table) <= 2 * tolerance
+
+
+def test_adaptive_table_matches_the_uniform_table_at_its_points():
+    vessel = VerticalEllipticalVessels(2.0, 6.0)
+    height, volume, wetted_area = vessel.create_adaptive_table(1e-3)
+    level = np.array(height) * vessel.total_height
+    np.testing.assert_allclose(volume, vessel.liquid_volume(level) / vessel.total_volume, rtol=1e-12)
+    np.testing.assert_allclose(wetted_area, vessel.wetted_area(level) / vessel.total_surface_area, rtol=1e-12)
+
+
+def test_adaptive_table_uses_fewer_points_than_uniform():
+    vessel = HorizontalToriSphericalVessels(2.0, 6.0)
+    table = vessel.create_adaptive_table(1e-3)
+    error = _interpolation_error(vessel, table)
+    uniform = vessel.create_table(5 * (len(table[0]) - 1))
+    assert _interpolation_error(vessel, uniform) > error
+
+
+def test_adaptive_table_points_cluster_in_the_heads():
+    vessel = VerticalEllipticalVessels(2.0, 20.0)
+    height = np.array(vessel.create_adaptive_table(1e-4)[0]) * vessel.total_height
+    in_head = (height < vessel.bottom_head_distance) | (height > vessel.tangent_height)
+    head_density = in_head.sum() / (2 * vessel.bottom_head_distance)
+    shell_density = (~in_head).sum() / vessel.length
+    assert head_density > 20 * shell_density
+
+
+def test_adaptive_table_respects_max_points():
+    vessel = HorizontalToriSphericalVessels(2.0, 6.0)
+    assert len(vessel.create_adaptive_table(1e-8, max_points=100)[0]) <= 100
+
+
+def test_adaptive_table_rejects_non_positive_tolerance():
+    with pytest.raises(ValueError):
+        VerticalEllipticalVessels(2.0, 6.0).create_adaptive_table(0.0)
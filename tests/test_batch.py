@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.vertical_flat_vessels import VerticalFlatVessels
+
+MAIN = Path(__file__).resolve().parents[1] / "main.py"
+
+SPECS = [
+    {"id": "a", "type": "vertical-flat-vessel", "diameter": 3.5, "length": 10, "high_level": 8, "low_level": 2,
+     "liquid_level": 5},
+    {"id": "b", "type": "horizontal-torispherical-vessel", "diameter": 2, "length": 6, "overflow": True},
+    {"id": "c", "type": "vertical-conical-vessel", "diameter": 3, "length": 6},
+    {"id": "d", "type": "spherical-tank", "diameter": 4},
+]
+
+
+def _run(*args, stdin=None):
+    result = subprocess.run([sys.executable, str(MAIN), *args], input=stdin, capture_output=True, text=True,
+                            check=True)
+    return result.stdout
+
+
+def _jsonl(specs):
+    return "".join(json.dumps(spec) + "\n" for spec in specs)
+
+
+def test_batch_csv_output_matches_the_library():
+    rows = list(csv.DictReader(io.StringIO(_run("--batch", "-", "--batch-input-format", "jsonl",
+                                                stdin=_jsonl(SPECS)))))
+    assert [row["id"] for row in rows] == ["a", "b", "c", "d"]
+    vessel = VerticalFlatVessels(3.5, 10)
+    vessel.high_liquid_level, vessel.low_liquid_level = 8, 2
+    assert float(rows[0]["total_volume"]) == pytest.approx(vessel.total_volume)
+    assert float(rows[0]["working_volume"]) == pytest.approx(vessel.working_volume)
+    assert float(rows[0]["liquid_volume"]) == pytest.approx(vessel.liquid_volume(5))
+    assert float(rows[0]["wetted_area"]) == pytest.approx(vessel.wetted_area(5))
+    vessel = HorizontalToriSphericalVessels(2, 6)
+    assert float(rows[1]["head_surface_area"]) == pytest.approx(vessel.head_surface_area)
+    assert float(rows[1]["overflow_volume"]) == pytest.approx(0.02 * vessel.total_volume)
+    assert rows[2]["error"] == "Head distance is required" and rows[2]["total_volume"] == ""
+    assert rows[3]["error"] == ""
+
+
+@pytest.mark.parametrize("spec, error", [
+    ({"diameter": 0, "length": 6}, "Diameter must be ≥ 0.01"),
+    ({"diameter": -2, "length": 6}, "Diameter must be ≥ 0.01"),
+    ({"diameter": 2, "length": 0.001}, "Length must be ≥ 0.01"),
+    ({"type": "vertical-conical-vessel", "diameter": 2, "length": 6, "head_distance": -1},
+     "Head distance must be ≥ 0.0"),
+    ({"diameter": 2, "length": 6, "high_level": 7}, "High liquid level must be ≤ 6.0"),
+    ({"diameter": 2, "length": 6, "high_level": 3, "low_level": 4}, "Low liquid level exceeds the high liquid level"),
+    ({"diameter": 2, "length": 6, "liquid_level": -0.5}, "Current liquid level must be ≥ 0.0"),
+    ({"diameter": [2], "length": 6}, "Diameter must be a number, got [2]"),
+    ({"diameter": "two", "length": 6}, "Diameter must be a number, got 'two'"),
+    ({"diameter": "nan", "length": 6}, "Diameter must be finite, got 'nan'"),
+    ({"diameter": 2, "length": "inf"}, "Length must be finite, got 'inf'"),
+    ({"diameter": 2, "length": 6, "high_level": "-inf"}, "High level must be finite, got '-inf'"),
+])
+def test_batch_reports_specs_outside_the_prompt_bounds(spec, error):
+    spec = {"id": "x", "type": "vertical-flat-vessel", **spec}
+    (row,) = [json.loads(line) for line in _run("--batch", "-", "--batch-input-format", "jsonl", "--batch-format",
+                                                  "jsonl", stdin=_jsonl([spec])).splitlines()]
+    assert row["error"] == error and row["total_volume"] is None
+
+
+def test_batch_reads_csv_and_writes_json(tmp_path):
+    specs = tmp_path / "specs.csv"
+    with open(specs, "w", newline="") as handle:
+        writer = csv.DictWriter(handle, ["id", "type", "diameter", "length", "head_distance"])
+        writer.writeheader()
+        writer.writerows({key: spec.get(key, "") for key in writer.fieldnames} for spec in SPECS)
+    output = tmp_path / "results.json"
+    _run("--batch", str(specs), "--batch-output", str(output))
+    rows = json.loads(output.read_text())
+    assert len(rows) == 4
+    assert rows[0]["diameter"] == 3.5 and rows[2]["total_volume"] is None
+
+
+def test_batch_with_workers_matches_serial():
+    specs = [{"id": i, "type": "vertical-elliptical-vessel", "diameter": 1 + i / 10, "length": 5}
+             for i in range(40)]
+    serial = _run("--batch", "-", "--batch-input-format", "jsonl", "--batch-format", "jsonl", stdin=_jsonl(specs))
+    pooled = _run("--batch", "-", "--batch-input-format", "jsonl", "--batch-format", "jsonl", "--workers", "2",
+                  stdin=_jsonl(specs))
+    assert pooled == serial
+    assert [json.loads(line)["id"] for line in serial.splitlines()] == list(range(40))
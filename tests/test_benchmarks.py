@@ -0,0 +1,31 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+RUNNER = Path(__file__).resolve().parents[1] / "benchmarks" / "run.py"
+
+
+@pytest.fixture(scope="module")
+def runner():
+    spec = importlib.util.spec_from_file_location("benchmark_runner", RUNNER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_benchmarks_cover_every_class_and_method(runner, tmp_path):
+    assert len(runner.VESSEL_CLASSES) == 16
+    results = runner.run_benchmarks("SphericalTanks/typical/*", repeat=1, min_time=0.0, draw=False, verbose=False)
+    assert set(results) == {f"SphericalTanks/typical/{method}" for method in
+                            ("liquid_volume", "liquid_volume[head]", "liquid_volume[array]", "wetted_area",
+                             "wetted_area[head]", "wetted_area[array]", "head_volume", "head_surface_area",
+                             "create_table")}
+    path = tmp_path / "baseline.json"
+    runner.save_baseline(path, results)
+    assert runner.load_baseline(path) == results
+
+
+def test_compare_flags_slowdowns_beyond_threshold(runner):
+    baseline = {"a": 1.0, "b": 1.0}
+    assert runner.compare({"a": 1.2, "b": 1.3, "c": 9.0}, baseline, threshold=0.25) == [("b", 1.0, 1.3)]
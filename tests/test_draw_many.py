@@ -0,0 +1,73 @@
+import re
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.image import imread
+from models.drawing import draw_many, draw_vessel
+
+from test_vectorization import VESSELS
+
+
+def _vessels(n):
+    vessels = []
+    for vessel_class, args in (VESSELS * n)[:n]:
+        vessel = vessel_class(*args)
+        height = vessel.total_height
+        vessel.high_liquid_level, vessel.low_liquid_level, vessel.liquid_level = 0.8 * height, 0.2 * height, 0.5 * height
+        vessels.append(vessel)
+    return vessels
+
+
+def test_draw_many_matches_draw_vessel(tmp_path):
+    vessels = _vessels(3)
+    paths = draw_many(vessels, tmp_path / "many", fmt="png")
+    assert [path.rsplit("/", 1)[-1] for path in paths] == [
+        "0000-VerticalFlatVessels.png", "0001-VerticalToriSphericalVessels.png", "0002-VerticalEllipticalVessels.png"]
+    for vessel, path in zip(vessels, paths):
+        single = tmp_path / "single.png"
+        draw_vessel(vessel, str(single))
+        np.testing.assert_array_equal(imread(path), imread(single))
+
+
+def test_draw_many_with_workers_writes_the_same_files(tmp_path):
+    vessels = _vessels(6)
+    names = [f"tag-{index}" for index in range(6)]
+    serial = draw_many(vessels, tmp_path / "serial", fmt="svg", names=names, backend="svg")
+    pooled = draw_many(vessels, tmp_path / "pooled", fmt="svg", names=names, backend="svg", workers=2, chunk_size=2)
+    assert [path.rsplit("/", 1)[-1] for path in pooled] == [f"tag-{index}.svg" for index in range(6)]
+    for first, second in zip(serial, pooled):
+        assert open(first).read() == open(second).read()
+
+
+def test_draw_many_pdf_pages(tmp_path):
+    (path,) = draw_many(_vessels(4), tmp_path, fmt="pdf-pages")
+    assert path.endswith("drawings.pdf")
+    with open(path, "rb") as handle:
+        assert len(re.findall(rb"/Type\s*/Page\b(?!s)", handle.read())) == 4
+
+
+def test_draw_many_sprite_sheet(tmp_path):
+    (path,) = draw_many(_vessels(5), tmp_path, fmt="sprite", columns=3, sprite_dpi=10)
+    # 8 x 8 inch drawings at 10 dpi, 2 rows of 3
+    assert imread(path).shape[:2] == (160, 240)
+
+
+def test_shared_figure_keeps_its_resolution(tmp_path):
+    vessels = _vessels(1)
+    draw_many(vessels, tmp_path, fmt="sprite", sprite_dpi=10)
+    (path,) = draw_many(vessels, tmp_path, fmt="png")
+    assert imread(path).shape[:2] == (800, 800)
+
+
+def test_draw_many_rejects_bad_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        draw_many(_vessels(1), tmp_path, fmt="png", backend="svg")
+    with pytest.raises(ValueError):
+        draw_many(_vessels(2), tmp_path, names=["only-one"])
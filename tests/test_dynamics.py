@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+from models.dynamics import GRAVITY, orifice_outflow, pump_outflow, simulate_levels
+from models.horizontal_elliptical_vessels import HorizontalEllipticalVessels
+from models.spherical_tanks import SphericalTanks
+from models.vertical_conical_vessels import VerticalConicalVessels
+from models.vertical_flat_vessels import VerticalFlatVessels
+from models.vertical_torispherical_vessels import VerticalToriSphericalVessels
+from scipy.integrate import solve_ivp
+
+
+def test_constant_flows_give_the_exact_event_times():
+    vessel = VerticalFlatVessels(2.0, 6.0)
+    area = np.pi
+    result = vessel.simulate(1.0, 1e5, inflow=0.05, high_level=4.0, low_level=0.5)
+    assert result.time_to_high_level == pytest.approx(3 * area / 0.05, rel=1e-9)
+    assert result.time_to_overflow == pytest.approx(5 * area / 0.05, rel=1e-9)
+    assert np.isnan(result.time_to_low_level) and np.isnan(result.time_to_empty)
+    assert result.final_time == result.time_to_overflow and result.final_level == pytest.approx(6.0)
+    drained = vessel.simulate(1.0, 1e5, outflow=0.05, low_level=0.5)
+    assert drained.time_to_low_level == pytest.approx(0.5 * area / 0.05, rel=1e-9)
+    assert drained.time_to_empty == pytest.approx(area / 0.05, rel=1e-6)
+
+
+def test_torricelli_drain_of_a_flat_tank():
+    vessel = VerticalFlatVessels(2.0, 6.0)
+    orifice = 0.002
+    result = vessel.simulate(4.0, 1e5, outflow=orifice_outflow(orifice, 0.6), low_level=1.0)
+    rate = 0.6 * orifice * np.sqrt(2 * GRAVITY) / np.pi
+    assert result.time_to_low_level == pytest.approx(2 * (2 - 1) / rate, rel=1e-4)
+    assert result.time_to_empty == pytest.approx(2 * 2 / rate, rel=1e-4)
+
+
+def test_sphere_drain_matches_a_reference_integration():
+    # the free surface shrinks to a point at the bottom, where dh/dt is singular
+    vessel = SphericalTanks(3.0)
+    outflow = orifice_outflow(0.004)
+    result = vessel.simulate(2.5, 1e5, outflow=outflow, high_level=2.8, low_level=0.3)
+
+    def level_rate(t, h):
+        return -outflow(t, h) / vessel.surface_area_at_level(h[0])
+
+    def low(t, h):
+        return h[0] - 0.3
+
+    low.terminal = True
+    reference = solve_ivp(level_rate, (0, 1e5), [2.5], events=low, rtol=1e-11, atol=1e-12)
+    assert result.time_to_low_level == pytest.approx(reference.t_events[0][0], rel=1e-4)
+    assert np.isnan(result.time_to_high_level)
+    assert result.time_to_empty > result.time_to_low_level and result.final_level == pytest.approx(0.0, abs=1e-3)
+
+
+def test_pump_settles_where_its_flow_matches_the_inflow():
+    vessel = VerticalFlatVessels(2.0, 6.0)
+    pump = pump_outflow(0.02, 10.0, 8.0)
+    result = vessel.simulate(3.0, 1e6, inflow=0.01, outflow=pump, low_level=1.0)
+    # 0.02 * sqrt(1 - (8 - h) / 10) = 0.01 at h = 0.5, below the low level
+    assert result.final_level == pytest.approx(0.5, rel=1e-4)
+    assert result.time_to_low_level > 0 and np.isnan(result.time_to_empty)
+
+
+def test_fleet_rows_match_single_runs():
+    knuckled = VerticalToriSphericalVessels(2.0, 5.0)
+    knuckled.fd, knuckled.fk = 0.8, 0.15
+    vessels = [SphericalTanks(3.0), VerticalConicalVessels(2.0, 6.0, 0.5), SphericalTanks(2.0),
+               HorizontalEllipticalVessels(2.0, 8.0), knuckled]
+    for vessel in vessels:
+        vessel.high_liquid_level, vessel.low_liquid_level = 0.9 * vessel.total_height, 0.2 * vessel.total_height
+    initial = [0.5 * vessel.total_height for vessel in vessels]
+    inflow, orifices = 0.004, [0.002, 0.003, 0.001, 0.004, 0.002]
+    fleet = simulate_levels(vessels, initial, 1e5, inflow, orifice_outflow(orifices))
+    for row, vessel in enumerate(vessels):
+        single = vessel.simulate(initial[row], 1e5, inflow, orifice_outflow(orifices[row]))
+        for name in ("time_to_high_level", "time_to_low_level", "time_to_overflow", "time_to_empty", "final_level"):
+            np.testing.assert_allclose(getattr(fleet, name)[row], getattr(single, name), rtol=1e-9)
+
+
+def test_array_geometry_and_trajectories():
+    vessels = VerticalConicalVessels(np.array([1.5, 2.0, 2.5]), 5.0, 0.5)
+    result = simulate_levels(vessels, 1.0, 1e5, inflow=0.01, trajectories=True, high_level=0, low_level=0)
+    np.testing.assert_allclose(result.time_to_overflow, (vessels.total_volume - vessels.liquid_volume(1.0)) / 0.01,
+                               rtol=1e-9)
+    for row, (times, levels) in enumerate(result.trajectories):
+        assert times[0] == 0 and times[-1] == result.time_to_overflow[row]
+        assert np.all(np.diff(times) > 0) and np.all(np.diff(levels) > 0)
+        single = VerticalConicalVessels(vessels.diameter[row], 5.0, 0.5)
+        np.testing.assert_allclose(single.liquid_volume(levels), single.liquid_volume(1.0) + 0.01 * times, rtol=1e-7)
+
+
+def test_full_or_empty_vessels_stop_at_once():
+    vessel = SphericalTanks(2.0)
+    full = vessel.simulate(2.0, 100.0, inflow=0.1)
+    assert full.time_to_overflow == 0 and full.final_time == 0
+    empty = vessel.simulate(0.0, 100.0, outflow=0.1)
+    assert empty.time_to_empty == 0 and empty.final_time == 0
+    filling = vessel.simulate(0.0, 1e4, inflow=0.1, high_level=0, low_level=0)
+    assert filling.time_to_overflow == pytest.approx(vessel.total_volume / 0.1, rel=1e-9)
+
+
+@pytest.mark.parametrize("kwargs", [{"t_end": 0.0}, {"rtol": 0.0}, {"initial_level": -0.1},
+                                    {"initial_level": 2.5}])
+def test_bad_arguments_raise(kwargs):
+    arguments = {"initial_level": 1.0, "t_end": 10.0, **kwargs}
+    with pytest.raises(ValueError):
+        SphericalTanks(2.0).simulate(**arguments)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from models.fleet import FLEET_COLUMNS, FLEET_TYPES, evaluate_fleet, fleet_records, fleet_vessel
+
+
+def _fleet(n=64, seed=0):
+    rng = np.random.default_rng(seed)
+    keys = list(FLEET_TYPES)
+    return dict(
+        vessel_type=np.array([keys[i % len(keys)] for i in range(n)]),
+        diameter=rng.uniform(1.0, 4.0, n),
+        length=rng.uniform(2.0, 12.0, n),
+        head_distance=rng.uniform(0.2, 1.5, n),
+        high_liquid_level=rng.uniform(1.0, 1.8, n),
+        low_liquid_level=rng.uniform(0.1, 0.9, n),
+        flow_out=rng.uniform(0.01, 0.1, n),
+    )
+
+
+def test_fleet_matches_one_object_per_row():
+    fleet = _fleet()
+    columns = evaluate_fleet(**fleet)
+    for i, key in enumerate(fleet["vessel_type"]):
+        vessel = fleet_vessel(FLEET_TYPES[key], fleet["diameter"][i], fleet["length"][i], fleet["head_distance"][i])
+        vessel.high_liquid_level = fleet["high_liquid_level"][i]
+        vessel.low_liquid_level = fleet["low_liquid_level"][i]
+        for name in FLEET_COLUMNS[:-1]:
+            assert columns[name][i] == pytest.approx(getattr(vessel, name), rel=1e-12), (key, name)
+        assert columns["surge_time"][i] == pytest.approx(vessel.surge_time(fleet["flow_out"][i]))
+
+
+def test_fleet_groups_fd_and_fk():
+    fd = np.array([np.nan, 0.9, 1.0, 0.9])
+    fk = np.array([np.nan, 0.17, 0.06, 0.17])
+    columns = evaluate_fleet(["horizontal-torispherical-vessel"] * 4, [2.0] * 4, [6.0] * 4, fd=fd, fk=fk)
+    assert columns["total_volume"][0] == pytest.approx(columns["total_volume"][2])
+    assert columns["total_volume"][1] == columns["total_volume"][3]
+    assert columns["total_volume"][1] != pytest.approx(columns["total_volume"][2])
+
+
+def test_fleet_records_and_validation():
+    columns = evaluate_fleet(["spherical-tank", "vertical-flat-vessel"], [2.0, 2.0], [np.nan, 3.0])
+    records = fleet_records(columns)
+    assert records.dtype.names == FLEET_COLUMNS
+    assert records["total_volume"][0] == pytest.approx(4 / 3 * np.pi)
+    assert np.isnan(records["surge_time"]).all()
+    with pytest.raises(ValueError):
+        evaluate_fleet(["no-such-vessel"], [1.0], [1.0])
+    with pytest.raises(ValueError):
+        evaluate_fleet(["vertical-flat-vessel"], [-1.0], [1.0])
@@ -0,0 +1,50 @@
+import pytest
+from test_vectorization import VESSELS
+from models.vertical_conical_vessels import VerticalConicalVessels
+from models.vertical_torispherical_vessels import VerticalToriSphericalVessels
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_setters_invalidate_cached_geometry(vessel_class, args):
+    vessel = vessel_class(*args)
+    total_volume = vessel.total_volume
+    total_height = vessel.total_height
+    assert vessel.total_volume is total_volume
+    vessel.diameter = 2 * vessel.diameter
+    fresh = vessel_class(vessel.diameter, *args[1:])
+    assert vessel.total_volume == pytest.approx(fresh.total_volume)
+    assert vessel.total_height == pytest.approx(fresh.total_height)
+    assert vessel.total_volume > total_volume
+    assert vessel.total_height >= total_height
+
+
+def test_torispherical_constants_follow_fd_and_fk():
+    vessel = VerticalToriSphericalVessels(2.0, 4.0)
+    a1, a2, b1 = vessel.a1, vessel.a2, vessel.b1
+    vessel.fd, vessel.fk = 0.9, 0.17
+    fresh = VerticalToriSphericalVessels(2.0, 4.0)
+    fresh.fd, fresh.fk = 0.9, 0.17
+    assert (vessel.a1, vessel.a2, vessel.b1) == (fresh.a1, fresh.a2, fresh.b1)
+    assert (vessel.a1, vessel.a2, vessel.b1) != (a1, a2, b1)
+    assert vessel.total_volume == fresh.total_volume
+
+
+def test_conical_head_distance_setter_invalidates():
+    vessel = VerticalConicalVessels(2.0, 4.0, 0.5)
+    height = vessel.total_height
+    vessel.head_distance = 1.0
+    assert vessel.total_height == pytest.approx(height + 1.0)
+
+
+def test_cached_geometry_is_read_only():
+    vessel = VerticalToriSphericalVessels(2.0, 4.0)
+    with pytest.raises(AttributeError):
+        vessel.total_volume = 1.0
+    with pytest.raises(AttributeError):
+        vessel.a1 = 1.0
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_head_surface_area_is_the_full_head_wetted_area(vessel_class, args):
+    vessel = vessel_class(*args)
+    assert vessel.head_surface_area == pytest.approx(vessel.head_wetted_area(vessel.total_height), rel=1e-9)
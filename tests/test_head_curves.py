@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from models.constants import FD_ELLIP, FK_ELLIP, FD_TORI, FK_TORI
+from models.head_curves import HEAD_CURVES, HeadCurveRegistry, horizontal_volume_curve
+from models.horizontal_elliptical_vessels import HorizontalEllipticalVessels
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.torispherical_heads import (horizontal_head_surface_area, horizontal_head_volume,
+                                        horizontal_head_wetted_area)
+
+
+@pytest.mark.parametrize("fd, fk", [(FD_TORI, FK_TORI), (FD_ELLIP, FK_ELLIP)])
+def test_volume_curve_matches_direct_evaluation(fd, fk):
+    deltas = np.random.default_rng(3).uniform(0.0, 1.0, 2000)
+    full = horizontal_head_volume(1.0, fd, fk)
+    curve = horizontal_volume_curve(fd, fk)
+    assert np.abs(curve(deltas) - horizontal_head_volume(deltas, fd, fk)).max() < 1e-12 * full
+    assert curve(-1.0) == 0.0 and curve(2.0) == pytest.approx(full)
+
+
+@pytest.mark.parametrize("fd, fk", [(FD_TORI, FK_TORI), (0.8, 0.15)])
+def test_volume_curve_derivative_is_the_surface_area(fd, fk):
+    deltas = np.concatenate([np.random.default_rng(4).uniform(0.0, 1.0, 2000), [0.0, 1e-9, 0.5, 1.0]])
+    curve = horizontal_volume_curve(fd, fk)
+    exact = horizontal_head_surface_area(deltas, fd, fk)
+    assert np.abs(curve.derivative(deltas) - exact).max() < 1e-8 * horizontal_head_surface_area(0.5, fd, fk)
+    np.testing.assert_allclose(curve.derivative(curve.nodes), curve.slopes, atol=1e-12)
+
+
+def test_vessels_share_registry_curves():
+    first, second = HorizontalToriSphericalVessels(1.0, 3.0), HorizontalToriSphericalVessels(4.0, 8.0)
+    first.liquid_volume(0.3)
+    second.liquid_volume(1.3)
+    curve = HEAD_CURVES.get("torispherical", FD_TORI, FK_TORI, "horizontal", "volume")
+    assert curve is HEAD_CURVES.get("torispherical", FD_TORI, FK_TORI, "horizontal", "volume")
+    assert ("torispherical", FD_TORI, FK_TORI, "horizontal", "volume") in HEAD_CURVES
+    assert second.horizontal_fd_head_volume(1.3) == pytest.approx(4.0 ** 3 * curve(1.3 / 4.0))
+    HorizontalEllipticalVessels(2.0, 5.0).wetted_area(0.5)
+    assert ("elliptical", FD_ELLIP, FK_ELLIP, "horizontal", "wetted_area") in HEAD_CURVES
+
+
+def test_registry_persists_curves(tmp_path):
+    path = str(tmp_path / "curves.npz")
+    registry = HeadCurveRegistry(path)
+    built = registry.get("torispherical", 0.8, 0.1, "horizontal", "wetted_area")
+    reloaded = HeadCurveRegistry(path)
+    assert reloaded.keys() == [("torispherical", 0.8, 0.1, "horizontal", "wetted_area")]
+    curve = reloaded.get("torispherical", 0.8, 0.1, "horizontal", "wetted_area")
+    np.testing.assert_array_equal(curve.values, built.values)
+    assert curve(0.3) == pytest.approx(horizontal_head_wetted_area(0.3, 0.8, 0.1), rel=1e-8)
+    with pytest.raises(ValueError):
+        registry.get("torispherical", 0.8, 0.1, "vertical", "volume")
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from test_vectorization import VESSELS
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.spherical_tanks import SphericalTanks
+from models.vertical_flat_vessels import VerticalFlatVessels
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_level_for_volume_inverts_liquid_volume(vessel_class, args):
+    vessel = vessel_class(*args)
+    levels = np.linspace(0.0, vessel.total_height, 41)
+    volumes = vessel.liquid_volume(levels)
+    solved = vessel.level_for_volume(volumes)
+    assert vessel.liquid_volume(solved) == pytest.approx(volumes, abs=1e-10 * vessel.total_volume)
+    assert vessel.level_for_volume(vessel.total_volume / 3) == pytest.approx(
+        vessel.level_for_volume(np.array([vessel.total_volume / 3]))[0])
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_level_for_wetted_area_inverts_wetted_area(vessel_class, args):
+    vessel = vessel_class(*args)
+    levels = np.linspace(0.0, vessel.total_height, 41)
+    areas = vessel.wetted_area(levels)
+    solved = vessel.level_for_wetted_area(areas)
+    assert vessel.wetted_area(solved) == pytest.approx(areas, abs=1e-9 * vessel.total_surface_area)
+
+
+def test_level_for_volume_is_analytic_for_flat_shell():
+    vessel = VerticalFlatVessels(2.0, 3.0)
+    assert vessel.level_for_volume(np.pi) == pytest.approx(1.0)
+    assert vessel.level_for_volume(-1.0) == 0.0
+    assert vessel.level_for_volume(1e9) == pytest.approx(3.0)
+
+
+def test_level_for_volume_sphere_half_full():
+    vessel = SphericalTanks(3.0)
+    assert vessel.level_for_volume(vessel.total_volume / 2) == pytest.approx(1.5)
+
+
+def test_level_for_volume_torispherical_evaluation_budget():
+    """Tests that the horizontal torispherical inverse needs under 5 forward evaluations per query."""
+    vessel = HorizontalToriSphericalVessels(3.0, 9.0)
+    forward = vessel.liquid_volume
+    evaluated = []
+
+    def counted(value):
+        evaluated.append(np.size(value))
+        return forward(value)
+
+    vessel.liquid_volume = counted
+    volumes = np.linspace(0.01, 0.99, 500) * vessel.total_volume
+    levels = vessel.level_for_volume(volumes)
+    assert forward(levels) == pytest.approx(volumes, rel=1e-10)
+    # the first call is the bracketing grid, shared by the whole batch
+    assert sum(evaluated[1:]) / volumes.size < 5
+
+
+@pytest.mark.parametrize("vessel", [HorizontalToriSphericalVessels(3.0, 9.0), HorizontalToriSphericalVessels(2.0, 0.1),
+                                    HorizontalToriSphericalVessels(2.0, 5.0, fd=0.9, fk=0.15)])
+def test_level_for_volume_evaluation_budget_near_empty_and_full(vessel):
+    forward = vessel.liquid_volume
+    evaluated = []
+
+    def counted(value):
+        evaluated.append(np.size(value))
+        return forward(value)
+
+    vessel.liquid_volume = counted
+    fractions = np.concatenate([np.logspace(-12, -1, 23), [0.5], 1 - np.logspace(-1, -12, 23)])
+    for fraction in fractions:
+        evaluated.clear()
+        volume = fraction * vessel.total_volume
+        level = vessel.level_for_volume(volume)
+        assert forward(level) == pytest.approx(volume, abs=1e-12 * vessel.total_volume)
+        # the bracketing grid and the Newton steps
+        assert len(evaluated) < 5, fraction
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from models.horizontal_flat_vessels import (HorizontalFlatVessels, horizontal_cylinder_liquid_volume,
+                                            horizontal_cylinder_wetted_area)
+from models.spherical_tanks import SphericalTanks, sphere_liquid_volume, sphere_wetted_area
+
+
+def test_sphere_kernels_broadcast_over_diameter_and_level():
+    diameters = np.linspace(1.0, 4.0, 7)[:, None]
+    fractions = np.linspace(-0.1, 1.1, 13)[None, :]
+    volumes = sphere_liquid_volume(diameters, fractions * diameters)
+    areas = sphere_wetted_area(diameters, fractions * diameters)
+    assert volumes.shape == areas.shape == (7, 13)
+    for i, diameter in enumerate(diameters[:, 0]):
+        tank = SphericalTanks(diameter)
+        np.testing.assert_allclose(volumes[i], tank.liquid_volume(fractions[0] * diameter), rtol=1e-14)
+        np.testing.assert_allclose(areas[i], tank.wetted_area(fractions[0] * diameter), rtol=1e-14)
+    assert sphere_liquid_volume(2.0, 2.0) == pytest.approx(4 / 3 * np.pi)
+
+
+def test_horizontal_cylinder_kernels_broadcast_over_geometry_and_level():
+    rng = np.random.default_rng(1)
+    diameters, lengths = rng.uniform(1.0, 4.0, 50), rng.uniform(2.0, 10.0, 50)
+    levels = rng.uniform(-0.5, 4.5, 50)
+    volumes = horizontal_cylinder_liquid_volume(diameters, lengths, levels)
+    areas = horizontal_cylinder_wetted_area(diameters, lengths, levels)
+    for diameter, length, level, volume, area in zip(diameters, lengths, levels, volumes, areas):
+        vessel = HorizontalFlatVessels(diameter, length)
+        assert volume == pytest.approx(vessel.shell_liquid_volume(level), rel=1e-14, abs=1e-14)
+        assert area == pytest.approx(vessel.shell_wetted_area(level), rel=1e-14, abs=1e-14)
+    assert horizontal_cylinder_liquid_volume(2.0, 3.0, 1.0) == pytest.approx(1.5 * np.pi)
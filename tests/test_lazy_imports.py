@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _loaded(code: str, modules) -> set[str]:
+    script = f"{code}\nimport sys\nprint(' '.join(m for m in {tuple(modules)!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                            cwd=PROJECT_ROOT / "src")
+    return set(result.stdout.split())
+
+
+def test_importing_the_package_loads_no_class_module():
+    assert _loaded("import models", ["numpy", "scipy", "models.vessels"]) == set()
+
+
+@pytest.mark.parametrize("name", ["VerticalToriSphericalVessels", "HorizontalToriSphericalVessels",
+                                  "StrappingTable", "evaluate_fleet"])
+def test_classes_do_not_load_scipy_or_matplotlib(name):
+    code = f"from models import {name}"
+    assert _loaded(code, ["scipy", "matplotlib", "concurrent.futures.process"]) == set()
+
+
+def test_scipy_is_loaded_by_the_strapping_table():
+    code = ("from models import StrappingTable, VerticalToriSphericalVessels\n"
+            "vessel = VerticalToriSphericalVessels(2.0, 6.0)\n"
+            "vessel.liquid_volume(1.0)\n"
+            "StrappingTable(vessel, 10)")
+    assert _loaded(code, ["scipy"]) == {"scipy"}
+
+
+def test_lazy_exports():
+    import models
+    from models.spherical_tanks import SphericalTanks
+    assert models.SphericalTanks is SphericalTanks
+    assert set(models.__all__) <= set(dir(models))
+    with pytest.raises(AttributeError):
+        models.NoSuchVessel
+
+
+def test_cli_list_does_not_import_the_models():
+    script = ("import runpy, sys\n"
+              "sys.argv = ['main.py', '--list']\n"
+              f"runpy.run_path({str(PROJECT_ROOT / 'main.py')!r}, run_name='__main__')\n"
+              "print('LOADED', ' '.join(m for m in ('numpy', 'src.models.vessels') if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert "vertical-flat-vessel" in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "LOADED"
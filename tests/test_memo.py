@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from test_vectorization import VESSELS
+from models.memo import MEMO_METHODS, LevelMemo
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.vertical_flat_vessels import VerticalFlatVessels
+from models.vertical_torispherical_vessels import VerticalToriSphericalVessels
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_memo_returns_the_same_results(vessel_class, args):
+    vessel = vessel_class(*args)
+    level = 0.4 * vessel.total_height
+    expected = vessel.liquid_volume(level), vessel.wetted_area(level)
+    vessel.enable_memo()
+    assert (vessel.liquid_volume(level), vessel.wetted_area(level)) == expected
+    assert (vessel.liquid_volume(level), vessel.wetted_area(level)) == expected
+    assert vessel.memo_info().hits >= 2
+
+
+def test_memo_counts_hits_and_stays_bounded():
+    vessel = VerticalFlatVessels(2.0, 3.0)
+    assert vessel.memo_info() is None
+    memo = vessel.enable_memo(maxsize=4)
+    vessel.liquid_volume(1.0)
+    misses = memo.info().misses
+    vessel.liquid_volume(1.0)
+    assert memo.info().hits == 1 and memo.info().misses == misses
+    for level in np.linspace(0.0, 3.0, 10):
+        vessel.liquid_volume(level)
+    assert memo.info().currsize == 4
+    # array queries bypass the memo
+    hits = memo.info().hits
+    vessel.liquid_volume(np.array([1.0, 2.0]))
+    assert memo.info().hits == hits
+    vessel.disable_memo()
+    assert vessel.memo_info() is None
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_memo_wraps_every_component_method(vessel_class, args):
+    for name in MEMO_METHODS:
+        method = getattr(vessel_class, name, None)
+        assert method is None or hasattr(method, "__wrapped__"), name
+
+
+def test_memo_counts_component_calls():
+    vessel = HorizontalToriSphericalVessels(2, 5)
+    expected = vessel.head_liquid_volume(1.0)
+    memo = vessel.enable_memo()
+    assert vessel.head_liquid_volume(1.0) == expected
+    assert vessel.head_liquid_volume(1.0) == expected
+    assert memo.info().hits == 1 and memo.info().misses == 1
+    # array queries bypass the memo
+    vessel.head_liquid_volume(np.array([0.5, 1.0]))
+    assert memo.info().hits == 1 and memo.info().misses == 1
+    vessel.diameter = 3.0
+    assert vessel.head_liquid_volume(1.0) == HorizontalToriSphericalVessels(3, 5).head_liquid_volume(1.0)
+    assert memo.info().misses == 2
+
+
+def test_geometry_setters_invalidate_memo():
+    vessel = VerticalToriSphericalVessels(2.0, 3.0)
+    memo = vessel.enable_memo()
+    before = vessel.liquid_volume(1.0)
+    vessel.diameter = 3.0
+    assert len(memo) == 0
+    assert vessel.liquid_volume(1.0) == VerticalToriSphericalVessels(3.0, 3.0).liquid_volume(1.0) != before
+    vessel.fd = 0.9
+    fresh = VerticalToriSphericalVessels(3.0, 3.0, fd=0.9)
+    assert vessel.liquid_volume(1.0) == fresh.liquid_volume(1.0)
+
+
+def test_memo_shared_between_equal_geometries():
+    memo = LevelMemo(64)
+    first, second = VerticalFlatVessels(2.0, 3.0), VerticalFlatVessels(2.0, 3.0)
+    first.enable_memo(memo=memo)
+    second.enable_memo(memo=memo)
+    first.liquid_volume(1.5)
+    hits = memo.info().hits
+    second.liquid_volume(1.5)
+    assert memo.info().hits == hits + 1
+    with pytest.raises(ValueError):
+        LevelMemo(0)
@@ -0,0 +1,44 @@
+import pickle
+
+import numpy as np
+import pytest
+from test_fleet import _fleet
+from test_vectorization import VESSELS
+from models.fleet import evaluate_fleet
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.parallel import chunk_bounds, parallel_map, resolve_workers
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_vessels_pickle(vessel_class, args):
+    vessel = vessel_class(*args)
+    vessel.total_volume
+    clone = pickle.loads(pickle.dumps(vessel))
+    assert clone.liquid_volume(1.0) == vessel.liquid_volume(1.0)
+    assert clone.spec == vessel.spec
+
+
+def test_chunk_bounds_cover_range_in_order():
+    bounds = chunk_bounds(103, 3)
+    assert bounds[0][0] == 0 and bounds[-1][1] == 103
+    assert all(stop == start for (_, stop), (start, _) in zip(bounds, bounds[1:]))
+    assert chunk_bounds(10, 2, chunk_size=4) == [(0, 4), (4, 8), (8, 10)]
+    assert resolve_workers(None) == 1
+    assert resolve_workers(0) >= 1
+
+
+def test_parallel_map_keeps_order():
+    assert parallel_map(abs, range(-20, 0), workers=2) == list(range(20, 0, -1))
+
+
+def test_create_table_with_workers_matches_serial():
+    vessel = HorizontalToriSphericalVessels(2.0, 5.0)
+    assert vessel.create_table(24, workers=2) == vessel.create_table(24)
+
+
+def test_fleet_with_workers_matches_serial():
+    fleet = _fleet(80)
+    serial = evaluate_fleet(**fleet)
+    parallel = evaluate_fleet(**fleet, workers=3)
+    for name, column in serial.items():
+        np.testing.assert_array_equal(parallel[name], column)
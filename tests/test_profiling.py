@@ -0,0 +1,115 @@
+import json
+import threading
+
+import pytest
+from models import Profiler, Vessels
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.vertical_flat_vessels import VerticalFlatVessels
+from models.vertical_torispherical_vessels import VerticalToriSphericalVessels
+
+
+def _stat(profiler, vessel_type, method):
+    return next(stat for stat in profiler.stats() if stat.vessel_type == vessel_type and stat.method == method)
+
+
+def test_profiler_counts_calls_per_vessel_class():
+    flat = VerticalFlatVessels(2.0, 6.0)
+    tori = VerticalToriSphericalVessels(2.0, 6.0)
+    with Profiler() as profiler:
+        for level in (1.0, 2.0, 3.0):
+            flat.liquid_volume(level)
+        tori.liquid_volume(1.0)
+    assert _stat(profiler, "VerticalFlatVessels", "liquid_volume").calls == 3
+    assert _stat(profiler, "VerticalToriSphericalVessels", "liquid_volume").calls == 1
+    assert _stat(profiler, "VerticalFlatVessels", "shell_liquid_volume").category == "level"
+
+
+def test_profiler_separates_own_time_of_nested_calls():
+    vessel = VerticalToriSphericalVessels(2.0, 6.0)
+    with Profiler() as profiler:
+        vessel.liquid_volume(0.3)
+    outer = _stat(profiler, "VerticalToriSphericalVessels", "liquid_volume")
+    inner = _stat(profiler, "VerticalToriSphericalVessels", "vertical_bottom_fd_head_volume")
+    assert inner.category == "level" and inner.calls == 1
+    assert outer.own < outer.total and inner.total <= outer.total - outer.own
+
+
+def test_profiler_keeps_one_call_stack_per_thread():
+    vessels = [VerticalToriSphericalVessels(2.0, 6.0) for _ in range(4)]
+    barrier = threading.Barrier(len(vessels))
+
+    def work(vessel):
+        barrier.wait()
+        for level in range(200):
+            vessel.liquid_volume(level / 40)
+
+    with Profiler() as profiler:
+        threads = [threading.Thread(target=work, args=(vessel,)) for vessel in vessels]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    outer = _stat(profiler, "VerticalToriSphericalVessels", "liquid_volume")
+    inner = _stat(profiler, "VerticalToriSphericalVessels", "vertical_bottom_fd_head_volume")
+    assert outer.calls == 800 and inner.calls == 800
+    # with a shared stack, calls of other threads would be charged to each other
+    assert 0.0 <= outer.own < outer.total and inner.total <= outer.total - outer.own
+
+
+def test_profiler_times_geometry_recomputation():
+    vessel = HorizontalToriSphericalVessels(2.0, 6.0)
+    with Profiler() as profiler:
+        vessel.total_volume
+        vessel.total_volume
+        vessel.length = 8.0
+        vessel.total_volume
+    stat = _stat(profiler, "HorizontalToriSphericalVessels", "total_volume")
+    assert stat.category == "geometry" and stat.calls == 2
+
+
+def test_profiler_restores_the_methods():
+    shell_liquid_volume = VerticalFlatVessels.__dict__["shell_liquid_volume"]
+    descriptor = VerticalFlatVessels.__dict__["total_height"]
+    getter = descriptor.method
+    with Profiler():
+        assert VerticalFlatVessels.__dict__["shell_liquid_volume"] is not shell_liquid_volume
+    assert VerticalFlatVessels.__dict__["shell_liquid_volume"] is shell_liquid_volume
+    assert descriptor.method is getter
+
+
+def test_profiler_results_are_unchanged():
+    vessel = HorizontalToriSphericalVessels(2.0, 6.0)
+    expected = vessel.create_table(10)
+    vessel._clear_geometry_cache()
+    with Vessels.profile():
+        assert vessel.create_table(10) == expected
+
+
+def test_profilers_do_not_nest():
+    with Profiler():
+        with pytest.raises(RuntimeError):
+            Profiler().__enter__()
+    with Profiler():
+        pass
+
+
+def test_chrome_trace(tmp_path):
+    vessel = VerticalToriSphericalVessels(2.0, 6.0)
+    with Profiler(trace=True, max_events=5) as profiler:
+        vessel.wetted_area(1.0)
+        vessel.create_table(10)
+    path = tmp_path / "trace.json"
+    profiler.save_chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert len(events) == 5
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+    assert events[-1]["name"].startswith("VerticalToriSphericalVessels.")
+
+
+def test_summary_lists_the_slowest_first():
+    vessel = VerticalToriSphericalVessels(2.0, 6.0)
+    with Profiler() as profiler:
+        vessel.create_table(10)
+    lines = profiler.summary(limit=3).splitlines()
+    assert len(lines) == 4
+    assert "create_table" in lines[1]
@@ -0,0 +1,136 @@
+import asyncio
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from models.fleet import FLEET_TYPES
+from models.server import GeometryCache, VesselServer, evaluate_levels, request_spec
+from models.spec import VesselSpec
+
+
+@pytest.fixture(scope="module")
+def server():
+    # a long window so that concurrent requests reliably share a batch
+    server = VesselServer(port=0, batch_window=0.05)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start())
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait(10)
+    yield server
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result(10)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(10)
+
+
+def _request(server, method, path, body=None):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+    try:
+        connection.request(method, path, json.dumps(body) if body is not None else None)
+        response = connection.getresponse()
+        data = response.read()
+        if response.getheader("Content-Type") == "application/json":
+            data = json.loads(data)
+        return response.status, data
+    finally:
+        connection.close()
+
+
+def test_types_lists_the_fleet_keys(server):
+    assert _request(server, "GET", "/types") == (200, {"types": list(FLEET_TYPES)})
+
+
+def test_evaluate_matches_the_library(server):
+    levels = [0.0, 0.4, 1.1, 2.0]
+    status, result = _request(server, "POST", "/evaluate", {"type": "horizontal-torispherical-vessel",
+                                                            "diameter": 2, "length": 6, "levels": levels})
+    assert status == 200
+    vessel = FLEET_TYPES["horizontal-torispherical-vessel"](2, 6)
+    assert result["total_volume"] == pytest.approx(vessel.total_volume)
+    assert result["head_surface_area"] == pytest.approx(vessel.head_surface_area)
+    assert result["liquid_volume"] == pytest.approx(vessel.liquid_volume(np.array(levels)).tolist())
+    assert result["wetted_area"] == pytest.approx(vessel.wetted_area(np.array(levels)).tolist())
+
+
+def test_concurrent_requests_share_a_batch(server):
+    bodies = [{"type": "vertical-conical-vessel", "diameter": 2 + 0.1 * i, "length": 6, "head_distance": 0.5,
+               "levels": [1.0, 3.0]} for i in range(16)]
+    batches = server.batcher.batches
+    with ThreadPoolExecutor(16) as pool:
+        results = list(pool.map(lambda body: _request(server, "POST", "/evaluate", body), bodies))
+    assert server.batcher.batches - batches < len(bodies)
+    for body, (status, result) in zip(bodies, results):
+        assert status == 200
+        vessel = FLEET_TYPES[body["type"]](body["diameter"], body["length"], body["head_distance"])
+        assert result["liquid_volume"] == pytest.approx([vessel.liquid_volume(level) for level in body["levels"]])
+
+
+def test_table_and_draw(server):
+    body = {"type": "vertical-elliptical-vessel", "diameter": 2, "length": 5, "n": 4}
+    status, table = _request(server, "POST", "/table", body)
+    assert status == 200
+    expected = FLEET_TYPES["vertical-elliptical-vessel"](2, 5).create_table(4)
+    assert table["volume"] == pytest.approx(expected[1])
+    status, svg = _request(server, "POST", "/draw", {**body, "high_level": 4, "low_level": 1, "liquid_level": 2})
+    assert status == 200 and svg.startswith(b"<?xml") and b"</svg>" in svg
+
+
+@pytest.mark.parametrize("path, body, status", [
+    ("/evaluate", {"type": "no-such-vessel", "diameter": 2}, 400),
+    ("/evaluate", {"type": "vertical-flat-vessel", "diameter": 2}, 400),
+    ("/evaluate", {"type": "spherical-tank", "diameter": -1}, 400),
+    ("/evaluate", {"type": "spherical-tank", "diameter": 2, "levels": ["x"]}, 400),
+    ("/table", {"type": "spherical-tank", "diameter": 2, "n": 0}, 400),
+    ("/missing", {}, 404),
+])
+def test_bad_requests_return_errors(server, path, body, status):
+    code, result = _request(server, "POST", path, body)
+    assert code == status and "error" in result
+
+
+def test_get_on_a_post_endpoint_is_not_allowed(server):
+    assert _request(server, "GET", "/evaluate")[0] == 405
+
+
+def test_evaluate_levels_groups_mixed_geometries():
+    specs = [VesselSpec("VerticalFlatVessels", 2, 6), VesselSpec("VerticalFlatVessels", 3, 4),
+             VesselSpec("SphericalTanks", 2), VesselSpec("VerticalToriSphericalVessels", 2, 6, fd=1.0, fk=0.1)]
+    queries = [(spec, np.array([0.5, 1.5])) for spec in specs]
+    for (spec, levels), (volume, wetted_area) in zip(queries, evaluate_levels(queries, GeometryCache())):
+        vessel = spec.build()
+        np.testing.assert_allclose(volume, vessel.liquid_volume(levels))
+        np.testing.assert_allclose(wetted_area, vessel.wetted_area(levels))
+
+
+def test_requests_for_the_same_tank_share_a_cache_entry():
+    cache = GeometryCache()
+    payloads = [{"type": "vertical-torispherical-vessel", "diameter": 2, "length": 5},
+                {"type": "vertical-torispherical-vessel", "diameter": 2.0, "length": 5, "fd": 1.0, "fk": 0.06},
+                {"type": "vertical-torispherical-vessel", "diameter": 2, "length": 5, "head_distance": 0.3}]
+    specs = [request_spec(payload) for payload in payloads]
+    assert specs[0] == specs[1] == specs[2] == FLEET_TYPES["vertical-torispherical-vessel"](2, 5).spec
+    for spec in specs:
+        cache.get(spec)
+    assert len(cache) == 1 and (cache.hits, cache.misses) == (2, 1)
+
+
+def test_geometry_cache_is_lru():
+    cache = GeometryCache(2)
+    specs = [request_spec({"type": "spherical-tank", "diameter": d}) for d in (1, 2, 3)]
+    first = cache.get(specs[0])[0]
+    cache.get(specs[1])
+    assert cache.get(specs[0])[0] is first
+    cache.get(specs[2])
+    assert len(cache) == 2 and (cache.hits, cache.misses) == (1, 3)
+    cache.get(specs[1])
+    assert cache.misses == 4
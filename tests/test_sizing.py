@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from models.fleet import FLEET_TYPES
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.sizing import LevelRules, pareto_mask, size_vessel
+from models.spherical_tanks import SphericalTanks
+from models.vertical_elliptical_vessels import VerticalEllipticalVessels
+
+
+def test_vertical_designs_hold_the_working_volume_between_the_rule_levels():
+    rules = LevelRules(0.15, 0.15, 0.2, 0.3)
+    designs = size_vessel(VerticalEllipticalVessels, 12.0, slenderness=(3.0, 5.0), rules=rules, n=16,
+                          design_pressure=10e5)
+    assert len(designs["diameter"]) == 16 and np.all(np.diff(designs["diameter"]) > 0)
+    np.testing.assert_allclose(designs["length"] / designs["diameter"], designs["slenderness"])
+    assert designs["slenderness"].min() == pytest.approx(3.0) and designs["slenderness"].max() == pytest.approx(5.0)
+    for row in range(16):
+        diameter, length = designs["diameter"][row], designs["length"][row]
+        vessel = VerticalEllipticalVessels(diameter, length)
+        vessel.low_liquid_level = max(0.15 * diameter, 0.15)
+        vessel.high_liquid_level = length - max(0.2 * diameter, 0.3)
+        assert designs["low_liquid_level"][row] == pytest.approx(vessel.low_liquid_level)
+        assert designs["high_liquid_level"][row] == pytest.approx(vessel.high_liquid_level)
+        assert vessel.working_volume == pytest.approx(12.0, rel=1e-8)
+        assert designs["total_surface_area"][row] == pytest.approx(vessel.total_surface_area)
+        assert designs["weight"][row] == pytest.approx(
+            vessel.estimate_empty_weight(designs["wall_thickness"][row], 7850.0))
+    # 10 bar needs more than the corrosion allowance over the minimum thickness at these diameters
+    np.testing.assert_allclose(designs["wall_thickness"], 10e5 * designs["diameter"] / 2 / (138e6 - 6e5) + 0.003)
+
+
+def test_horizontal_designs_match_the_scalar_classes():
+    designs = size_vessel("horizontal-torispherical-vessel", surge_time=600.0, flow=0.03, pareto=False, n=8)
+    assert len(designs["diameter"]) == 8
+    for diameter, length, low, high in zip(designs["diameter"], designs["length"], designs["low_liquid_level"],
+                                           designs["high_liquid_level"]):
+        vessel = HorizontalToriSphericalVessels(diameter, length)
+        assert low == pytest.approx(max(0.15 * diameter, 0.15)) and high == pytest.approx(diameter - 0.2 * diameter)
+        vessel.low_liquid_level, vessel.high_liquid_level = low, high
+        assert vessel.surge_time(0.03) == pytest.approx(600.0, rel=1e-8)
+
+
+@pytest.mark.parametrize("key", list(FLEET_TYPES))
+def test_every_type_meets_the_volume(key):
+    designs = size_vessel(key, 20.0, n=8, pareto=False)
+    np.testing.assert_allclose(designs["working_volume"], 20.0, rtol=1e-8)
+    assert np.all(designs["high_liquid_level"] > designs["low_liquid_level"])
+
+
+def test_sphere_has_one_design():
+    designs = size_vessel(SphericalTanks, 10.0, rules=LevelRules(0.1, 0.0, 0.1, 0.0))
+    (diameter,) = designs["diameter"]
+    vessel = SphericalTanks(diameter)
+    vessel.low_liquid_level, vessel.high_liquid_level = 0.1 * diameter, 0.9 * diameter
+    assert vessel.working_volume == pytest.approx(10.0, rel=1e-8)
+
+
+def test_pareto_set_is_the_non_dominated_candidates():
+    candidates = size_vessel("horizontal-elliptical-vessel", 30.0, design_pressure=20e5, pareto=False)
+    front = size_vessel("horizontal-elliptical-vessel", 30.0, design_pressure=20e5)
+    assert 0 < len(front["diameter"]) <= len(candidates["diameter"])
+    for length, weight in zip(front["length"], front["weight"]):
+        dominated = ((candidates["length"] <= length) & (candidates["weight"] <= weight)
+                     & ((candidates["length"] < length) | (candidates["weight"] < weight)))
+        assert not dominated.any()
+
+
+def test_pareto_mask():
+    columns = {"length": np.array([1.0, 2.0, 3.0, 2.0, 1.0]), "weight": np.array([5.0, 3.0, 1.0, 4.0, 5.0])}
+    assert pareto_mask(columns).tolist() == [True, True, True, False, True]
+    assert pareto_mask(columns, ("length",)).tolist() == [True, False, False, False, True]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"working_volume": 10.0, "surge_time": 60.0, "flow": 0.1},
+    {"surge_time": 60.0},
+    {"working_volume": -1.0},
+    {"working_volume": 10.0, "slenderness": (4.0, 2.0)},
+    {"working_volume": 10.0, "objectives": ("cost",)},
+    {"working_volume": 10.0, "design_pressure": 1e9},
+    {"working_volume": 10.0, "vessel_type": "no-such-vessel"},
+    # the level rules leave no room between the levels at any slenderness
+    {"working_volume": 10.0, "slenderness": (0.5, 0.6), "rules": LevelRules(0.4, 0.0, 0.4, 0.0)},
+])
+def test_bad_arguments_raise(kwargs):
+    arguments = {"vessel_type": "vertical-flat-vessel", **kwargs}
+    with pytest.raises(ValueError):
+        size_vessel(**arguments)
@@ -0,0 +1,98 @@
+import pickle
+import sys
+
+import pytest
+from models import VesselSpec, Vessels
+from models.horizontal_elliptical_vessels import HorizontalEllipticalVessels
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.vertical_conical_vessels import VerticalConicalVessels
+from models.vertical_flat_vessels import VerticalFlatVessels
+from models.vertical_torispherical_vessels import VerticalToriSphericalVessels
+
+from test_vectorization import VESSELS
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_spec_round_trip(vessel_class, args):
+    vessel = vessel_class(*args)
+    spec = vessel.spec
+    # a spec of the constructor arguments is the spec of the vessel
+    assert spec == VesselSpec(vessel_class.__name__, *args)
+    rebuilt = spec.build()
+    assert type(rebuilt) is vessel_class
+    assert rebuilt.spec == spec
+    assert rebuilt.total_volume == vessel.total_volume
+    assert rebuilt.wetted_area(0.7) == vessel.wetted_area(0.7)
+    assert Vessels.from_spec(spec).spec == spec
+    assert pickle.loads(pickle.dumps(spec)) == spec
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+@pytest.mark.parametrize("fields", [{}, {"head_distance": 0.4}, {"fd": 0.9, "fk": 0.12}, {"fd": 0.9}])
+def test_spec_is_canonical(vessel_class, args, fields):
+    spec = VesselSpec(vessel_class.__name__, 2.0, 5.0, **fields)
+    assert spec.build().spec == spec
+    assert spec.build().spec.digest == spec.digest
+
+
+def test_spec_keeps_only_the_class_inputs():
+    assert VesselSpec("VerticalToriSphericalVessels", 2, 5) == VerticalToriSphericalVessels(2, 5).spec
+    assert VesselSpec("HorizontalEllipticalVessels", 2, 5) == HorizontalEllipticalVessels(2, 5).spec
+    assert VesselSpec("VerticalFlatVessels", 2, 5, fd=0.9).fd is None
+    assert VesselSpec("SphericalTanks", 2, 5, 1).key == ("SphericalTanks", 2.0, 0.0, 0.0, None, None)
+    assert VesselSpec("VerticalToriSphericalVessels", 2, 5, fk=0.1).key == (
+        "VerticalToriSphericalVessels", 2.0, 5.0, 0.0, 1.0, 0.1)
+
+
+def test_spec_keeps_fd_and_fk():
+    vessel = HorizontalToriSphericalVessels(2.0, 6.0, fd=0.9, fk=0.15)
+    rebuilt = vessel.spec.build()
+    assert (rebuilt.fd, rebuilt.fk) == (0.9, 0.15)
+    assert rebuilt.head_surface_area == vessel.head_surface_area
+
+
+def test_spec_is_immutable_and_hashable():
+    spec = VesselSpec("VerticalConicalVessels", 2, 6, 1)
+    with pytest.raises(AttributeError):
+        spec.diameter = 3.0
+    with pytest.raises(AttributeError):
+        del spec.length
+    assert spec == VerticalConicalVessels(2.0, 6.0, 1.0).spec
+    assert len({spec, VesselSpec("VerticalConicalVessels", 2.0, 6.0, 1.0), spec.replace(length=7)}) == 2
+    assert spec.replace(length=7).length == 7.0
+    with pytest.raises(TypeError):
+        spec.replace(height=7)
+
+
+def test_spec_follows_the_geometry_setters():
+    vessel = VerticalFlatVessels(2.0, 6.0)
+    spec = vessel.spec
+    vessel.length = 8.0
+    assert vessel.spec == spec.replace(length=8.0)
+
+
+def test_spec_is_compact():
+    vessel = VerticalFlatVessels(2.0, 6.0)
+    spec = vessel.spec
+    assert not hasattr(spec, "__dict__")
+    assert sys.getsizeof(spec) < sys.getsizeof(vessel) + sys.getsizeof(vessel.__dict__)
+    assert len(pickle.dumps(spec)) < len(pickle.dumps(vessel)) / 2
+
+
+def test_from_spec_checks_the_class():
+    spec = VerticalFlatVessels(2.0, 6.0).spec
+    assert isinstance(VerticalFlatVessels.from_spec(spec), VerticalFlatVessels)
+    with pytest.raises(ValueError):
+        HorizontalToriSphericalVessels.from_spec(spec)
+    with pytest.raises(ValueError):
+        VesselSpec("NoSuchVessels", 2.0).build()
+
+
+def test_digest_is_stable_across_processes():
+    import subprocess
+    spec = VerticalConicalVessels(2.0, 6.0, 1.0).spec
+    code = "from models import VesselSpec; print(VesselSpec('VerticalConicalVessels', 2.0, 6.0, 1.0).digest)"
+    src = str(__import__("pathlib").Path(__file__).resolve().parents[1] / "src")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=src)
+    assert output.stdout.strip() == spec.digest
+    assert spec.replace(length=6.5).digest != spec.digest
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.spherical_tanks import SphericalTanks
+from models.strapping import StrappingTable
+from models.vertical_conical_vessels import VerticalConicalVessels
+from models.vertical_elliptical_vessels import VerticalEllipticalVessels
+
+
+def test_strapping_table_stores_absolute_values():
+    vessel = VerticalEllipticalVessels(2.0, 3.0)
+    table = vessel.strapping_table(50)
+    assert table.levels[-1] == pytest.approx(vessel.total_height)
+    assert table.volumes[-1] == pytest.approx(vessel.total_volume)
+    assert table.volume(vessel.total_height) == pytest.approx(vessel.total_volume)
+
+
+def test_strapping_table_level_inverts_volume():
+    vessel = HorizontalToriSphericalVessels(3.0, 9.0)
+    table = StrappingTable(vessel, 100)
+    levels = np.linspace(0.05, 2.95, 30)
+    # the inverse of the interpolant, not a separate fit through the swapped samples
+    assert table.level(table.volume(levels)) == pytest.approx(levels, abs=1e-9)
+    assert table.level(table.volume(1.234)) == pytest.approx(1.234, abs=1e-9)
+    assert table.level(table.volumes) == pytest.approx(table.levels, abs=1e-12)
+    assert table.level(-1.0) == 0.0 and table.level(2 * vessel.total_volume) == pytest.approx(vessel.total_height)
+    assert table.volume(levels) == pytest.approx(vessel.liquid_volume(levels), abs=2 * table.volume_error)
+
+
+def test_strapping_table_level_at_a_cone_apex():
+    # the volume curve is flat at the apex and at the top of a conical vessel
+    vessel = VerticalConicalVessels(2.0, 6.0, 0.5)
+    table = StrappingTable(vessel, 50)
+    assert table.level(table.volumes) == pytest.approx(table.levels, abs=1e-12)
+
+
+def test_strapping_table_error_estimate():
+    table = StrappingTable(SphericalTanks(3.0), 200)
+    assert 0.0 < table.volume_error < 1e-3
+    assert StrappingTable(SphericalTanks(3.0), 20, estimate_error=False).volume_error == 0.0
+
+
+def test_strapping_table_rebuilds_only_when_geometry_changes():
+    vessel = SphericalTanks(2.0)
+    table = StrappingTable(vessel, 20)
+    vessel.liquid_level = 1.0
+    assert not table.refresh()
+    vessel.diameter = 3.0
+    assert table.is_stale()
+    assert table.refresh()
+    assert table.volume(3.0) == pytest.approx(vessel.total_volume)
+
+
+def test_strapping_table_requires_two_intervals():
+    with pytest.raises(ValueError):
+        StrappingTable(SphericalTanks(2.0), 1)
@@ -0,0 +1,100 @@
+import io
+import math
+
+import numpy as np
+import pytest
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.spherical_tanks import SphericalTanks
+from models.streaming import (InventoryRecord, convert_csv, load_tanks, parse_timestamps, read_level_records,
+                              stream_inventory, stream_inventory_chunks)
+from models.vertical_conical_vessels import VerticalConicalVessels
+
+TANKS_CSV = """tank_id,type,diameter,length,head_distance,fd,fk
+T1,horizontal-torispherical-vessel,2.5,8,,,
+T2,vertical-conical-vessel,3,6,1,,
+T3,spherical-tank,4,,,,
+"""
+
+
+def _history(n, seed=0):
+    rng = np.random.default_rng(seed)
+    tanks = rng.choice(["T1", "T2", "T3"], n)
+    levels = rng.uniform(0.0, 2.4, n)
+    return [(10.0 * i, str(tank), float(level)) for i, (tank, level) in enumerate(zip(tanks, levels))]
+
+
+def test_load_tanks():
+    tanks = load_tanks(io.StringIO(TANKS_CSV))
+    assert isinstance(tanks["T1"], HorizontalToriSphericalVessels)
+    assert isinstance(tanks["T2"], VerticalConicalVessels) and tanks["T2"].head_distance == 1.0
+    assert isinstance(tanks["T3"], SphericalTanks)
+
+
+def test_load_tanks_rejects_missing_dimensions():
+    with pytest.raises(ValueError):
+        load_tanks(io.StringIO("tank_id,type,diameter,length\nT1,vertical-conical-vessel,3,6\n"))
+    with pytest.raises(ValueError):
+        load_tanks(io.StringIO("tank_id,type,diameter,length\nT1,square-tank,3,6\n"))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_stream_inventory_matches_per_record_evaluation(chunk_size):
+    tanks = load_tanks(io.StringIO(TANKS_CSV))
+    records = _history(200)
+    result = list(stream_inventory(iter(records), tanks, chunk_size))
+    assert [record[:3] for record in result] == records
+    last = {}
+    for record in result:
+        vessel = tanks[record.tank_id]
+        assert record.volume == pytest.approx(vessel.liquid_volume(record.level), rel=1e-12)
+        assert record.wetted_area == pytest.approx(vessel.wetted_area(record.level), rel=1e-12)
+        if record.tank_id in last:
+            time, volume = last[record.tank_id]
+            assert record.net_flow == pytest.approx((record.volume - volume) / (record.timestamp - time), rel=1e-9)
+        else:
+            assert math.isnan(record.net_flow)
+        last[record.tank_id] = (record.timestamp, record.volume)
+
+
+def test_net_flow_is_nan_when_time_does_not_advance():
+    tanks = {"A": SphericalTanks(2.0)}
+    result = list(stream_inventory([(0, "A", 0.5), (0, "A", 1.0), (5, "A", 1.0)], tanks))
+    assert math.isnan(result[1].net_flow)
+    assert result[2].net_flow == 0.0
+
+
+def test_chunks_hold_at_most_chunk_size_records():
+    tanks = load_tanks(io.StringIO(TANKS_CSV))
+    sizes = [len(columns["level"]) for columns in stream_inventory_chunks(_history(25), tanks, 10)]
+    assert sizes == [10, 10, 5]
+
+
+def test_unknown_tank():
+    with pytest.raises(ValueError):
+        list(stream_inventory([(0, "X", 1.0)], {"A": SphericalTanks(2.0)}))
+
+
+def test_parse_timestamps():
+    seconds = parse_timestamps(["2024-01-01T00:00:00+00:00", "2024-01-01T00:01:00+00:00", "1704067320"])
+    np.testing.assert_allclose(np.diff(seconds), [60.0, 60.0])
+
+
+def test_convert_csv_round_trip():
+    tanks = load_tanks(io.StringIO(TANKS_CSV))
+    source = io.StringIO("timestamp,tank_id,level\n# comment\n"
+                         + "".join(f"{t:g},{tank},{level!r}\n" for t, tank, level in _history(50)))
+    target = io.StringIO()
+    assert convert_csv(source, target, tanks, chunk_size=8) == 50
+    lines = target.getvalue().splitlines()
+    assert lines[0] == "timestamp,tank_id,level,volume,wetted_area,net_flow"
+    assert len(lines) == 51
+    expected = list(stream_inventory(_history(50), tanks))
+    timestamp, tank_id, level, volume, _, _ = lines[5].split(",")
+    assert tank_id == expected[4].tank_id
+    assert float(volume) == pytest.approx(expected[4].volume)
+
+
+def test_read_level_records_skips_header():
+    records = list(read_level_records(io.StringIO("timestamp,tank_id,level\n1,A,0.5\n")))
+    assert records == [("1", "A", 0.5)]
+    assert InventoryRecord._fields[:3] == ("timestamp", "tank_id", "level")
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from models.fleet import fleet_vessel
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.vertical_torispherical_vessels import VerticalToriSphericalVessels
+
+from test_vectorization import VESSELS
+
+
+def _volume_derivative(vessel, levels):
+    step = 1e-5 * np.max(vessel.total_height)
+    return (vessel.liquid_volume(levels + step) - vessel.liquid_volume(levels - step)) / (2 * step)
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_surface_area_is_the_volume_derivative(vessel_class, args):
+    vessel = vessel_class(*args)
+    # away from the ends and the head/shell junctions, where dV/dh has kinks
+    levels = np.linspace(0.003, 0.997, 301) * vessel.total_height
+    breaks = [getattr(vessel, "bottom_head_distance", 0.0), getattr(vessel, "tangent_height", 0.0)]
+    levels = levels[np.min(np.abs(levels[:, None] - np.array(breaks)), axis=1) > 1e-3]
+    expected = _volume_derivative(vessel, levels)
+    np.testing.assert_allclose(vessel.surface_area_at_level(levels), expected, rtol=0, atol=1e-6 * expected.max())
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_surface_area_scalars_match_arrays(vessel_class, args):
+    vessel = vessel_class(*args)
+    levels = np.linspace(0.0, vessel.total_height, 7)
+    areas = vessel.surface_area_at_level(levels)
+    assert [vessel.surface_area_at_level(level) for level in levels] == pytest.approx(areas.tolist())
+    assert np.all(areas >= 0)
+
+
+@pytest.mark.parametrize("vessel_class", [VerticalToriSphericalVessels, HorizontalToriSphericalVessels])
+@pytest.mark.parametrize("fd, fk", [(0.8, 0.15), (1.0, 0.06), (0.9, 0.17)])
+def test_surface_area_of_any_dish_and_knuckle(vessel_class, fd, fk):
+    vessel = vessel_class(2.0, 5.0)
+    vessel.fd, vessel.fk = fd, fk
+    levels = np.linspace(0.01, 0.99, 97) * vessel.total_height
+    expected = _volume_derivative(vessel, levels)
+    np.testing.assert_allclose(vessel.surface_area_at_level(levels), expected, rtol=0, atol=1e-6 * expected.max())
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_surface_area_broadcasts_over_array_geometry(vessel_class, args):
+    scale = np.array([0.5, 1.0, 2.5])
+    dimensions = [scale * value for value in args] + [None] * (3 - len(args))
+    fleet = fleet_vessel(vessel_class, *dimensions)
+    levels = 0.4 * np.broadcast_to(fleet.total_height, scale.shape)
+    areas = fleet.surface_area_at_level(levels)
+    for row in range(scale.size):
+        single = fleet_vessel(vessel_class, *[None if value is None else value[row] for value in dimensions])
+        assert areas[row] == pytest.approx(single.surface_area_at_level(levels[row]))
@@ -0,0 +1,86 @@
+import subprocess
+import sys
+import xml.etree.ElementTree as ElementTree
+from pathlib import Path
+
+import pytest
+from models.drawing import _render, draw_vessel
+from models.horizontal_hemispherical_vessels import HorizontalHemiSphericalVessels
+from models.svg import SvgAxes
+from models.vertical_flat_vessels import VerticalFlatVessels
+
+from test_vectorization import VESSELS
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def _vessel(vessel_class, args):
+    vessel = vessel_class(*args)
+    height = vessel.total_height
+    vessel.high_liquid_level, vessel.low_liquid_level, vessel.liquid_level = 0.8 * height, 0.2 * height, 0.5 * height
+    return vessel
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_svg_backend_writes_a_valid_document(vessel_class, args, tmp_path):
+    path = tmp_path / "vessel.svg"
+    _vessel(vessel_class, args).draw(str(path), backend="svg")
+    root = ElementTree.parse(path).getroot()
+    assert root.tag == f"{SVG}svg"
+    texts = [element.text for element in root.iter(f"{SVG}text")]
+    assert vessel_class.vessels_type in texts
+    assert {"HLL", "LLL", "LL"} <= {text.split(" =")[0] for text in texts}
+    assert any(text.startswith("D = ") for text in texts)
+    assert len(root.findall(f"{SVG}polyline")) >= 3
+
+
+def test_svg_page_matches_the_matplotlib_axes():
+    plt = pytest.importorskip("matplotlib.pyplot")
+    vessel = _vessel(HorizontalHemiSphericalVessels, (2.0, 6.0))
+    figure, axes = plt.subplots(figsize=(8, 8))
+    _render(axes, vessel)
+    figure.canvas.draw()
+    svg_axes = SvgAxes()
+    _render(svg_axes, vessel)
+    point, _, _ = svg_axes._transform()
+    for x, y in [(0.0, 0.0), (6.0, 1.0), (-1.0, -1.0)]:
+        display_x, display_y = axes.transData.transform((x, y)) * 72 / figure.dpi
+        assert point(x, y) == pytest.approx((display_x, 576 - display_y), abs=1e-6)
+    plt.close(figure)
+
+
+def test_svg_arcs_and_dashes():
+    axes = SvgAxes()
+    axes.set_xlim(-1, 1)
+    axes.set_ylim(-1, 1)
+    axes.arc((0, 0), 2, 2, 180, 360)
+    axes.circle((0, 0), 1)
+    axes.plot([0, 1], [0, 0], linestyle="--", color="red")
+    root = ElementTree.fromstring(axes.to_svg())
+    move, x1, y1, command, rx, ry, rotation, large, sweep, x2, y2 = root.find(f"{SVG}path").get("d").split()
+    # from the left end to the right end, the short way through the bottom of the page
+    assert float(x1) < float(x2) and y1 == y2
+    assert (command, large, sweep) == ("A", "0", "0")
+    assert root.find(f"{SVG}ellipse") is not None
+    assert root.find(f"{SVG}polyline").get("stroke-dasharray")
+
+
+def test_text_is_escaped():
+    axes = SvgAxes()
+    axes.set_title("A <&> B")
+    ElementTree.fromstring(axes.to_svg())
+
+
+def test_unknown_backend(tmp_path):
+    with pytest.raises(ValueError):
+        draw_vessel(VerticalFlatVessels(2.0, 6.0), str(tmp_path / "vessel.svg"), backend="pdf")
+
+
+def test_svg_backend_does_not_import_matplotlib(tmp_path):
+    code = ("import sys\n"
+            "from models import VerticalFlatVessels\n"
+            f"VerticalFlatVessels(2.0, 6.0).draw({str(tmp_path / 'vessel.svg')!r}, backend='svg')\n"
+            "print('matplotlib' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).resolve().parents[1] / "src")
+    assert result.stdout.strip() == "False"
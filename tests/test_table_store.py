@@ -0,0 +1,97 @@
+import pickle
+
+import numpy as np
+import pytest
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.spherical_tanks import SphericalTanks
+from models.strapping import StrappingTable
+from models.table_store import TableStore, refresh_table_store, write_table_store
+from models.vertical_conical_vessels import VerticalConicalVessels
+from models.vertical_torispherical_vessels import VerticalToriSphericalVessels
+
+
+def _tanks():
+    knuckled = VerticalToriSphericalVessels(2.0, 5.0)
+    knuckled.fd, knuckled.fk = 0.8, 0.15
+    return {"TK-1": HorizontalToriSphericalVessels(3.0, 9.0), "TK-2": VerticalConicalVessels(2.0, 6.0, 0.5),
+            "TK-3": SphericalTanks(4.0), "TK-4": knuckled, "TK-5": VerticalToriSphericalVessels(2.5, 5.0)}
+
+
+def test_store_holds_the_strapping_table_samples(tmp_path):
+    path = tmp_path / "tables.npy"
+    tanks = _tanks()
+    assert write_table_store(path, tanks, n=50) == 5
+    with TableStore(path) as store:
+        assert len(store) == 5 and store.n == 50 and "TK-2" in store
+        for tank_id, vessel in tanks.items():
+            table = StrappingTable(vessel, 50, estimate_error=False)
+            levels, volumes, wetted_areas = store.table(tank_id, vessel)
+            np.testing.assert_allclose(levels, table.levels)
+            np.testing.assert_allclose(volumes, table.volumes)
+            np.testing.assert_allclose(wetted_areas, table.wetted_areas)
+            assert store.spec(tank_id) == vessel.spec
+            # the same monotone cubic as the strapping table
+            probes = np.linspace(-0.1, 1.1, 37) * vessel.total_height
+            np.testing.assert_allclose(store.volume(tank_id, probes), table.volume(probes), rtol=1e-12)
+            np.testing.assert_allclose(store.wetted_area(tank_id, probes), table.wetted_area(probes), rtol=1e-12)
+            np.testing.assert_allclose(store.level(tank_id, table.volumes), table.levels, atol=1e-12)
+        vessel = tanks["TK-1"]
+        assert store.volume("TK-1", 1.5) == pytest.approx(vessel.liquid_volume(1.5), rel=1e-3)
+        assert store.level("TK-1", store.volume("TK-1", 1.2)) == pytest.approx(1.2, abs=1e-9)
+
+
+def test_store_is_a_memory_mapped_npy_file(tmp_path):
+    path = tmp_path / "tables.npy"
+    write_table_store(path, _tanks(), n=20)
+    records = np.load(path, mmap_mode="r")
+    assert isinstance(records, np.memmap)
+    assert records["tank_id"].tolist() == list(_tanks())
+    with TableStore(path) as store:
+        levels = store.table("TK-3")[0]
+        assert np.shares_memory(levels, store._records)
+        assert not levels.flags.writeable
+        # lookups evaluate the cubic on the mapping, nothing is copied per tank
+        curve = store._curve("TK-3", "volume")
+        assert np.shares_memory(curve.values, store._records) and np.shares_memory(curve.slopes, store._records)
+
+
+def test_stale_tables_are_detected_and_refreshed(tmp_path):
+    path = tmp_path / "tables.npy"
+    tanks = _tanks()
+    write_table_store(path, tanks, n=20)
+    tanks["TK-2"].head_distance = 0.7
+    tanks["TK-6"] = SphericalTanks(2.0)
+    with TableStore(path) as store:
+        assert store.stale(tanks) == ["TK-2", "TK-6"]
+        assert store.is_stale("TK-2", tanks["TK-2"]) and not store.is_stale("TK-1", tanks["TK-1"])
+        with pytest.raises(ValueError):
+            store.table("TK-2", tanks["TK-2"])
+    del tanks["TK-3"]
+    assert refresh_table_store(path, tanks) == ["TK-2", "TK-6"]
+    with TableStore(path) as store:
+        assert store.n == 20 and store.tank_ids == list(tanks)
+        assert store.stale(tanks) == []
+        assert store.volume("TK-2", 100.0) == pytest.approx(tanks["TK-2"].total_volume)
+    assert refresh_table_store(path, tanks) == []
+
+
+def test_store_pickles_by_path(tmp_path):
+    path = tmp_path / "tables.npy"
+    write_table_store(path, _tanks(), n=10)
+    with TableStore(path) as store:
+        payload = pickle.dumps(store)
+        assert len(payload) < 500
+        copy = pickle.loads(payload)
+        np.testing.assert_array_equal(copy.table("TK-4")[1], store.table("TK-4")[1])
+
+
+def test_store_rejects_other_files_and_bad_ids(tmp_path):
+    path = tmp_path / "other.npy"
+    np.save(path, np.arange(5.0))
+    with pytest.raises(ValueError):
+        TableStore(path)
+    with pytest.raises(ValueError):
+        write_table_store(tmp_path / "tables.npy", {"x" * 65: SphericalTanks(2.0)})
+    write_table_store(path, {"a": SphericalTanks(2.0)}, n=5)
+    with TableStore(path) as store, pytest.raises(KeyError):
+        store.table("b")
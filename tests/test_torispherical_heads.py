@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+import scipy.integrate as integrate
+from models.constants import FD_ELLIP, FK_ELLIP, FD_TORI, FK_TORI
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.vertical_torispherical_vessels import VerticalToriSphericalVessels
+from models.head_curves import horizontal_wetted_area_curve
+from models.torispherical_heads import (circular_segment_area, head_constants, horizontal_head_volume,
+                                        horizontal_head_wetted_area, profile_depth, profile_radius,
+                                        vertical_head_volume, vertical_head_wetted_area)
+
+HEADS = [(FD_TORI, FK_TORI), (FD_ELLIP, FK_ELLIP), (0.8, 0.1)]
+
+
+@pytest.mark.parametrize("fd, fk", HEADS)
+def test_vertical_head_volume_matches_quadrature(fd, fk):
+    vessel = VerticalToriSphericalVessels(1.0, 1.0, fd, fk)
+    depths = np.linspace(0.0, vessel.a2, 11)
+    expected = [integrate.quad(vessel.vertical_fd_head_surface_area, 0, a, points=[vessel.a1], epsabs=1e-13)[0]
+                for a in depths]
+    assert vertical_head_volume(depths, fd, fk) == pytest.approx(expected, rel=1e-10, abs=1e-13)
+
+
+@pytest.mark.parametrize("fd, fk", HEADS)
+def test_horizontal_head_volume_matches_quadrature(fd, fk):
+    """Tests the Gauss-Legendre engine against an adaptive quad of the circular segments."""
+    a1, a2, _ = head_constants(fd, fk)
+    deltas = np.linspace(0.0, 1.0, 9)
+    expected = []
+    for delta in deltas:
+        # split at the dish/knuckle junction and where the profile is tangent to the liquid surface
+        edges = np.unique([0.0, a1, a2, float(profile_depth(abs(delta - 1 / 2), fd, fk))])
+        expected.append(sum(integrate.quad(lambda z: circular_segment_area(profile_radius(z, fd, fk), delta - 1 / 2),
+                                           low, high, limit=200, epsabs=1e-14)[0]
+                            for low, high in zip(edges[:-1], edges[1:])))
+    full = vertical_head_volume(a2, fd, fk)
+    assert np.abs(horizontal_head_volume(deltas, fd, fk) - expected).max() < 1e-10 * full
+
+
+@pytest.mark.parametrize("fd, fk", HEADS)
+def test_vertical_head_wetted_area_matches_quadrature(fd, fk):
+    # surface of revolution, 2 pi r(z) sqrt(1 + r'(z) ** 2) dz, with r' from the dish and knuckle circles
+    a1, a2, _ = head_constants(fd, fk)
+
+    def ring(z):
+        radius = profile_radius(z, fd, fk)
+        centre, arc_radius = (fd, fd) if z <= a1 else (a2, fk)
+        return 2 * np.pi * radius * arc_radius / np.sqrt(arc_radius ** 2 - (z - centre) ** 2)
+
+    depths = np.linspace(0.0, a2, 7)
+    expected = [sum(integrate.quad(ring, low, min(a, high), limit=200, epsabs=1e-13)[0]
+                    for low, high in ((0, a1), (a1, a2)) if a > low) for a in depths]
+    assert vertical_head_wetted_area(depths, fd, fk) == pytest.approx(expected, rel=1e-8, abs=1e-12)
+    assert [vertical_head_wetted_area(float(a), fd, fk) for a in depths] == pytest.approx(expected, rel=1e-8, abs=1e-12)
+
+
+@pytest.mark.parametrize("fd, fk", HEADS)
+def test_horizontal_head_volume_is_symmetric(fd, fk):
+    full = vertical_head_volume(HorizontalToriSphericalVessels(1.0, 1.0, fd, fk).a2, fd, fk)
+    deltas = np.linspace(0.0, 1.0, 21)
+    volumes = horizontal_head_volume(deltas, fd, fk)
+    assert volumes[-1] == pytest.approx(full)
+    assert volumes + volumes[::-1] == pytest.approx(np.full_like(deltas, full), rel=1e-12)
+
+
+def test_horizontal_vessel_head_volume_scales_with_diameter():
+    vessel = HorizontalToriSphericalVessels(3.0, 9.0)
+    vertical = VerticalToriSphericalVessels(3.0, 9.0)
+    assert vessel.head_volume == pytest.approx(2 * vertical.bottom_head_liquid_volume(vertical.total_height))
+    assert vessel.liquid_volume(1.5) == pytest.approx(vessel.total_volume / 2)
+
+
+def _surface_integral(delta, fd, fk):
+    # wetted arc r * (pi + 2 asin(y / r)) integrated along the dish and knuckle arcs
+    a1, a2, b1 = head_constants(fd, fk)
+    y = delta - 1 / 2
+
+    def arc(r):
+        return r * (np.pi + 2 * np.arcsin(np.clip(y / r, -1.0, 1.0))) if r > 0 else 0.0
+
+    # split where the arc becomes a full circle, r = |y|
+    u1, t1 = np.arcsin(b1 / fd), np.arcsin((a2 - a1) / fk)
+    u0 = np.arcsin(min(abs(y), b1) / fd)
+    t0 = np.arccos(np.clip((abs(y) - 1 / 2 + fk) / fk, np.cos(t1), 1.0))
+    dish = sum(integrate.quad(lambda u: arc(fd * np.sin(u)) * fd, low, high, limit=200, epsabs=1e-14)[0]
+               for low, high in ((0, u0), (u0, u1)))
+    knuckle = sum(integrate.quad(lambda t: arc(1 / 2 - fk + fk * np.cos(t)) * fk, low, high, limit=200,
+                                 epsabs=1e-14)[0] for low, high in ((0, t0), (t0, t1)))
+    return dish + knuckle
+
+
+@pytest.mark.parametrize("fd, fk", HEADS)
+def test_horizontal_head_wetted_area_matches_surface_integral(fd, fk):
+    deltas = np.linspace(0.0, 1.0, 13)
+    expected = [_surface_integral(delta, fd, fk) for delta in deltas]
+    full = horizontal_head_wetted_area(1.0, fd, fk)
+    assert np.abs(horizontal_head_wetted_area(deltas, fd, fk) - expected).max() < 1e-9 * full
+    assert np.abs(horizontal_wetted_area_curve(fd, fk)(deltas) - expected).max() < 2e-9 * full
+
+
+@pytest.mark.parametrize("fd, fk", HEADS)
+def test_horizontal_head_wetted_area_is_symmetric_and_tabulated(fd, fk):
+    vessel = VerticalToriSphericalVessels(1.0, 1.0, fd, fk)
+    full = vessel.vertical_bottom_fd_head_wetted_area(vessel.a2)
+    deltas = np.random.default_rng(2).uniform(0.0, 1.0, 2000)
+    areas = horizontal_head_wetted_area(deltas, fd, fk)
+    assert areas + horizontal_head_wetted_area(1 - deltas, fd, fk) == pytest.approx(np.full_like(deltas, full))
+    assert np.abs(horizontal_wetted_area_curve(fd, fk)(deltas) - areas).max() < 2e-9 * full
+
+
+def test_horizontal_head_wetted_area_hemispherical_limit():
+    # a hemisphere lying on its side wets half of the spherical zone, pi * R * h
+    deltas = np.linspace(0.0, 1.0, 11)
+    assert horizontal_head_wetted_area(deltas, 0.5, 1e-4) == pytest.approx(np.pi / 2 * deltas, rel=1e-6, abs=1e-12)
+
+
+def test_horizontal_vessel_wetted_area_scales_with_diameter():
+    small, large = HorizontalToriSphericalVessels(1.0, 3.0), HorizontalToriSphericalVessels(2.5, 7.5)
+    levels = np.linspace(0.0, 1.0, 7)
+    assert large.head_wetted_area(2.5 * levels) == pytest.approx(2.5 ** 2 * small.head_wetted_area(levels))
+    assert large.head_wetted_area(2.5) == pytest.approx(large.head_surface_area)
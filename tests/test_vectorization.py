@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from models.vertical_flat_vessels import VerticalFlatVessels
+from models.vertical_torispherical_vessels import VerticalToriSphericalVessels
+from models.vertical_elliptical_vessels import VerticalEllipticalVessels
+from models.vertical_hemispherical_vessels import VerticalHemiSphericalVessels
+from models.vertical_conical_vessels import VerticalConicalVessels
+from models.vertical_flat_tanks import VerticalFlatTanks
+from models.vertical_torispherical_tanks import VerticalToriSphericalTanks
+from models.vertical_elliptical_tanks import VerticalEllipticalTanks
+from models.vertical_hemispherical_tanks import VerticalHemiSphericalTanks
+from models.vertical_conical_tanks import VerticalConicalTanks
+from models.horizontal_flat_vessels import HorizontalFlatVessels
+from models.horizontal_torishperical_vessels import HorizontalToriSphericalVessels
+from models.horizontal_elliptical_vessels import HorizontalEllipticalVessels
+from models.horizontal_hemispherical_vessels import HorizontalHemiSphericalVessels
+from models.horizontal_conical_vessels import HorizontalConicalVessels
+from models.spherical_tanks import SphericalTanks
+
+VESSELS = [
+    (VerticalFlatVessels, (2.0, 3.0)),
+    (VerticalToriSphericalVessels, (2.0, 3.0)),
+    (VerticalEllipticalVessels, (2.0, 3.0)),
+    (VerticalHemiSphericalVessels, (2.0, 3.0)),
+    (VerticalConicalVessels, (2.0, 3.0, 1.0)),
+    (VerticalFlatTanks, (2.0, 3.0)),
+    (VerticalToriSphericalTanks, (2.0, 3.0)),
+    (VerticalEllipticalTanks, (2.0, 3.0)),
+    (VerticalHemiSphericalTanks, (2.0, 3.0)),
+    (VerticalConicalTanks, (2.0, 3.0, 1.0)),
+    (HorizontalFlatVessels, (2.0, 3.0)),
+    (HorizontalToriSphericalVessels, (2.0, 3.0)),
+    (HorizontalEllipticalVessels, (2.0, 3.0)),
+    (HorizontalHemiSphericalVessels, (2.0, 3.0)),
+    (HorizontalConicalVessels, (2.0, 3.0, 1.0)),
+    (SphericalTanks, (2.0,)),
+]
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_array_levels_match_scalar_levels(vessel_class, args):
+    """Tests that an array of levels gives the same values as scalar calls."""
+    vessel = vessel_class(*args)
+    levels = np.linspace(0.0, vessel.total_height, 17)
+    volumes = vessel.liquid_volume(levels)
+    areas = vessel.wetted_area(levels)
+    assert isinstance(volumes, np.ndarray) and volumes.shape == levels.shape
+    assert isinstance(areas, np.ndarray) and areas.shape == levels.shape
+    assert volumes.tolist() == [vessel.liquid_volume(level) for level in levels]
+    assert areas.tolist() == [vessel.wetted_area(level) for level in levels]
+
+
+@pytest.mark.parametrize("vessel_class, args", VESSELS)
+def test_scalar_level_returns_float(vessel_class, args):
+    vessel = vessel_class(*args)
+    assert type(vessel.liquid_volume(1.0)) is float
+    assert type(vessel.wetted_area(1.0)) is float
+    assert type(vessel.total_volume) is float
+
+
+def test_array_levels_keep_shape():
+    vessel = HorizontalFlatVessels(2.0, 3.0)
+    levels = np.array([[0.0, 1.0], [2.0, 3.0]])
+    volumes = vessel.liquid_volume(levels)
+    assert volumes.shape == (2, 2)
+    assert volumes[1, 1] == pytest.approx(vessel.total_volume)